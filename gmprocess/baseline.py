@@ -0,0 +1,107 @@
+"""
+Polynomial baseline correction following Ancheta et al. (2013).
+
+A sixth-order polynomial, with the zeroth- and first-order terms fixed at
+zero, is fit to the displacement time series; its second derivative is
+then removed from the acceleration. The fit is linear in the coefficients,
+so it is solved directly by least squares. The polynomial is evaluated on
+the sample index scaled to [0, 1] so that the problem stays well
+conditioned for long records, and traces with the same number of samples
+share the same design matrix, so they are fit together in one solve.
+"""
+
+# third party imports
+import numpy as np
+from scipy import integrate
+
+# Powers of the terms in the baseline polynomial
+BASELINE_POWERS = np.arange(2, 7)
+
+
+def fit_baseline(acc, delta):
+    """
+    Fit the baseline polynomial to the displacement of one or more traces.
+
+    Args:
+        acc (np.ndarray):
+            Acceleration of one trace, or 2D array with one trace per row.
+            All traces must have the same sampling interval.
+        delta (float):
+            Sampling interval (sec).
+
+    Returns:
+        np.ndarray: Coefficients of the polynomial in the sample index,
+        highest power first (as used by numpy.poly1d), including the two
+        zero terms. Has one row per trace if acc is 2D.
+    """
+    acc = np.asarray(acc, dtype=float)
+    rows = np.atleast_2d(acc)
+    npts = rows.shape[1]
+
+    # Integrate twice to get the displacement time series
+    disp = integrate.cumtrapz(rows, dx=delta, initial=0, axis=-1)
+    disp = integrate.cumtrapz(disp, dx=delta, initial=0, axis=-1)
+
+    # Solve for the coefficients in the scaled index, then rescale them
+    scale = max(npts - 1, 1)
+    x = np.arange(npts) / scale
+    design = x[:, None] ** BASELINE_POWERS
+    scaled_cofs = np.linalg.lstsq(design, disp.T, rcond=None)[0]
+    cofs = scaled_cofs.T / float(scale) ** BASELINE_POWERS
+
+    poly_cofs = np.zeros((rows.shape[0], BASELINE_POWERS[-1] + 1))
+    poly_cofs[:, :len(BASELINE_POWERS)] = cofs[:, ::-1]
+    if acc.ndim == 1:
+        return poly_cofs[0]
+    return poly_cofs
+
+
+def baseline_second_derivative(poly_cofs, npts):
+    """
+    Evaluate the second derivative of baseline polynomials.
+
+    Args:
+        poly_cofs (np.ndarray):
+            Coefficients from fit_baseline.
+        npts (int):
+            Number of samples.
+
+    Returns:
+        np.ndarray: Second derivative with respect to the sample index at
+        each sample, with one row per set of coefficients if poly_cofs is
+        2D.
+    """
+    poly_cofs = np.asarray(poly_cofs, dtype=float)
+    cofs = np.atleast_2d(poly_cofs)[:, len(BASELINE_POWERS) - 1::-1]
+
+    # Evaluate in the scaled index as well, to avoid huge powers
+    scale = max(npts - 1, 1)
+    x = np.arange(npts) / scale
+    factors = BASELINE_POWERS * (BASELINE_POWERS - 1) * \
+        float(scale) ** (BASELINE_POWERS - 2)
+    derivative = (cofs * factors) @ (x[None, :] **
+                                     (BASELINE_POWERS - 2)[:, None])
+    if poly_cofs.ndim == 1:
+        return derivative[0]
+    return derivative
+
+
+def correct_baseline(acc, delta):
+    """
+    Remove the baseline from the acceleration of one or more traces.
+
+    Args:
+        acc (np.ndarray):
+            Acceleration of one trace, or 2D array with one trace per row.
+            All traces must have the same sampling interval.
+        delta (float):
+            Sampling interval (sec).
+
+    Returns:
+        tuple: Corrected acceleration, with the same shape as acc, and the
+        coefficients of the polynomials from fit_baseline.
+    """
+    acc = np.asarray(acc, dtype=float)
+    poly_cofs = fit_baseline(acc, delta)
+    return acc - baseline_second_derivative(poly_cofs, acc.shape[-1]), \
+        poly_cofs
@@ -85,3 +85,28 @@ def get_config(picker=False):
             config = yaml.load(f, Loader=yaml.FullLoader)
 
     return config
+
+
+def get_num_workers(config, key, num_workers=None):
+    """Gets the number of worker processes to use for a task.
+
+    Args:
+        config (dict):
+            Configuration dictionary, or None.
+        key (str):
+            Name of the option in the 'parallel' section of the config,
+            e.g. 'processing_workers', 'metrics_workers' or
+            'reading_workers'.
+        num_workers (int):
+            Number of workers requested by the caller. If None, the value of
+            the option is used, or 1 if it is not set.
+
+    Returns:
+        int: Number of workers; a value of 0 gives one worker per CPU.
+    """
+    if num_workers is None:
+        parallel_conf = (config or {}).get('parallel', None) or {}
+        num_workers = parallel_conf.get(key, 1)
+    if not num_workers:
+        num_workers = os.cpu_count() or 1
+    return int(num_workers)
@@ -1,8 +1,6 @@
-
-
 import numpy as np
 
-from gmprocess.smoothing.konno_ohmachi import konno_ohmachi_smooth
+from gmprocess.smoothing.konno_ohmachi import konno_ohmachi_smooth_many
 
 
 def fft_smooth(trace, nfft, bandwidth=20):
@@ -22,21 +20,54 @@ def fft_smooth(trace, nfft, bandwidth=20):
     Returns:
         numpy.ndarray: Smoothed amplitude data and frequencies.
     """
+    spec, freqs = compute_fft(trace, nfft)
+    return smooth_spectrum(spec, freqs, nfft, bandwidth)
+
+
+def compute_fft(trace, nfft):
+    """
+    Compute the amplitude spectrum of a trace.
+
+    Args:
+        trace (StationTrace):
+            Trace of strong motion data.
+        nfft (int):
+            Number of data points for the fourier transform.
 
-    # Compute the FFT, normalizing by the number of data points
+    Returns:
+        numpy.ndarray: Amplitude spectrum (normalized by the sampling rate)
+        and frequencies.
+    """
     dt = trace.stats.delta
     spec = abs(np.fft.rfft(trace.data, n=nfft)) * dt
 
     # Get the frequencies associated with the FFT
     freqs = np.fft.rfftfreq(nfft, dt)
+    return spec, freqs
+
+
+def smooth_spectrum(spec, freqs, nfft, bandwidth=20):
+    """
+    Smooths amplitude spectra following the algorithm of Konno and Ohmachi.
+
+    Args:
+        spec (numpy.ndarray):
+            Amplitude spectrum from compute_fft, or 2D array with one such
+            spectrum per row.
+        freqs (numpy.ndarray):
+            Frequencies of the spectra.
+        nfft (int):
+            Number of data points used for the fourier transform.
+        bandwidth (float):
+            Konno-Omachi smoothing bandwidth parameter.
 
+    Returns:
+        numpy.ndarray: Smoothed amplitude data and frequencies.
+    """
     # Do a maximum of 301 K-O frequencies in the range of the fft freqs
     nkofreqs = min(nfft, 302) - 1
     ko_freqs = np.logspace(np.log10(freqs[1]), np.log10(freqs[-1]), nkofreqs)
-    # An array to hold the output
-    spec_smooth = np.empty_like(ko_freqs)
 
     # Konno Omachi Smoothing
-    konno_ohmachi_smooth(
-        spec.astype(np.double), freqs, ko_freqs, spec_smooth, bandwidth)
+    spec_smooth = konno_ohmachi_smooth_many(spec, freqs, ko_freqs, bandwidth)
     return spec_smooth, ko_freqs
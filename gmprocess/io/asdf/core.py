@@ -1,27 +1,62 @@
+# stdlib imports
+import os.path
+import shutil
+import tempfile
+
 # third party imports
 import h5py
 
 # local imports
 from .stream_workspace import StreamWorkspace
+from gmprocess.io.utils import is_path, open_data_file
+from gmprocess.io.read import SNIFF_BYTES
 
 TIMEPAT = '[0-9]{4}-[0-9]{2}-[0-9]{2}T'
+HDF5_SIGNATURE = b'\x89HDF\r\n\x1a\n'
+
+
+def sniff_asdf(prefix):
+    """Check the first bytes of a file for the HDF5 signature.
+
+    The signature is either at the start of the file or after a user block
+    of 512, 1024, 2048... bytes.
+
+    Args:
+        prefix (bytes): First bytes of the candidate ASDF file.
+
+    Returns:
+        bool: False if the file cannot be ASDF, True otherwise.
+    """
+    offset = 0
+    while offset + len(HDF5_SIGNATURE) <= len(prefix):
+        if prefix[offset:offset + len(HDF5_SIGNATURE)] == HDF5_SIGNATURE:
+            return True
+        offset = max(512, 2 * offset)
+    return False
 
 
 def is_asdf(filename):
     """Verify that the input file is an ASDF file.
 
+    Data in memory is only opened with h5py if it starts with the HDF5
+    signature.
+
     Args:
-        filename (str): Path to candidate ASDF file.
+        filename (str or file-like): Path to candidate ASDF file.
 
     Returns:
         bool: True if ASDF, False if not.
     """
     try:
-        f = h5py.File(filename, 'r')
-        if 'AuxiliaryData' in f:
-            return True
-        else:
-            return False
+        if is_path(filename):
+            with h5py.File(filename, 'r') as f:
+                return 'AuxiliaryData' in f
+        with open_data_file(filename, 'rb') as data:
+            if not sniff_asdf(data.read(SNIFF_BYTES)):
+                return False
+            data.seek(0)
+            with h5py.File(data, 'r') as f:
+                return 'AuxiliaryData' in f
     except OSError:
         return False
 
@@ -30,8 +65,9 @@ def read_asdf(filename, eventid=None, stations=None, label=None):
     """Read Streams of data (complete with processing metadata) from an ASDF file.
 
     Args:
-        filename (str):
-            Path to valid ASDF file.
+        filename (str or file-like):
+            Path to valid ASDF file. ASDF data in memory is first written
+            to a temporary file, since pyasdf can only open files on disk.
         label (str): Optional processing label to filter streams.
 
     Returns:
@@ -39,6 +75,14 @@ def read_asdf(filename, eventid=None, stations=None, label=None):
             List of StationStreams containing processing
             and channel metadata.
     """
+    if not is_path(filename):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_file = os.path.join(temp_dir, 'workspace.h5')
+            with open(temp_file, 'wb') as f, \
+                    open_data_file(filename, 'rb') as data:
+                shutil.copyfileobj(data, f)
+            return read_asdf(temp_file, eventid=eventid, stations=stations,
+                             label=label)
     workspace = StreamWorkspace.open(filename)
     eventids = workspace.getEventIds()
     allstreams = []
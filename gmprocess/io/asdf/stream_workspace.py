@@ -1,12 +1,17 @@
 # stdlib imports
+from collections import OrderedDict
 import json
 import re
 import copy
+import functools
 
 # third party imports
 import pyasdf
 import numpy as np
 from obspy.core.utcdatetime import UTCDateTime
+from obspy.core.event import ResourceIdentifier
+from obspy.core.util import AttribDict
+from pyasdf.utils import labelstring2list
 import prov
 import pandas as pd
 import openpyxl
@@ -15,9 +20,44 @@ import openpyxl
 from gmprocess.stationtrace import StationTrace, TIMEFMT_MS
 from gmprocess.stationstream import StationStream
 from gmprocess.metrics.station_summary import StationSummary
+from gmprocess.exception import GMProcessException
 
 TIMEPAT = '[0-9]{4}-[0-9]{2}-[0-9]{2}T'
 
+# Trace parameters whose values are dictionaries of numpy arrays. They are
+# stored as JSON lists and turned back into arrays when read.
+ARRAY_PARAMETERS = [
+    'signal_spectrum',
+    'noise_spectrum',
+    'smooth_signal_spectrum',
+    'smooth_noise_spectrum',
+    'snr'
+]
+
+
+# Private members of pyasdf.ASDFDataSet used to read waveforms lazily and to
+# replace auxiliary data, which pyasdf has no public API for. They were
+# checked against pyasdf 0.8; get them through _get_pyasdf_private.
+PYASDF_PRIVATE = [
+    '_waveform_group',
+    '_auxiliary_data_group',
+    '_get_idx_and_size_estimate'
+]
+
+# Auxiliary data type of the metrics tables, with one table per event
+METRICS_TABLE = 'WaveFormMetricsTable'
+
+# Fields of the metrics tables other than the metrics, and their types
+METRICS_TABLE_COLUMNS = OrderedDict([
+    ('STATION', 'S'),
+    ('NAME', 'S'),
+    ('SOURCE', 'S'),
+    ('NETID', 'S'),
+    ('LABEL', 'S'),
+    ('LAT', np.float64),
+    ('LON', np.float64)
+])
+
 
 class StreamWorkspace(object):
     def __init__(self, filename, exists=False):
@@ -31,6 +71,7 @@ class StreamWorkspace(object):
         else:
             compression = None
         self.dataset = pyasdf.ASDFDataSet(filename, compression=compression)
+        self._build_index()
 
     @classmethod
     def open(cls, filename):
@@ -58,15 +99,11 @@ class StreamWorkspace(object):
         """
         fmt = 'Events: %i Stations: %i Streams: %i'
         nevents = len(self.dataset.events)
-        stations = []
-        nstreams = 0
-        for waveform in self.dataset.waveforms:
-            inventory = waveform['StationXML']
-            nstreams += len(waveform.get_waveform_tags())
-            for station in inventory.networks[0].stations:
-                stations.append(station.code)
-        stations = set(stations)
+        # waveform groups are named NET.STA
+        stations = set([station_name.split('.')[-1]
+                        for station_name in self._tags])
         nstations = len(stations)
+        nstreams = sum([len(tags) for tags in self._tags.values()])
         return fmt % (nevents, nstations, nstreams)
 
     def addEvent(self, event):
@@ -91,6 +128,7 @@ class StreamWorkspace(object):
         if not self.hasEvent(eventid):
             self.addEvent(event)
         station_dict = {}
+        station_names = set()
         for stream in streams:
             station = stream[0].stats['station']
             # is this a raw file? Check the trace for provenance info.
@@ -110,6 +148,9 @@ class StreamWorkspace(object):
                     tag = '%s_%05i' % (station.lower(), station_sequence)
                 level = 'processed'
             self.dataset.add_waveforms(stream, tag=tag, event_id=event)
+            for trace in stream:
+                station_names.add('%s.%s' % (trace.stats.network,
+                                             trace.stats.station))
 
             # add processing provenance info from streams
             if level == 'processed':
@@ -122,6 +163,7 @@ class StreamWorkspace(object):
                     channel_tag = '%s_%s' % (tag, channel)
                     self.dataset.add_provenance_document(provdoc,
                                                          name=channel_tag)
+                    self._provenance.add(channel_tag)
 
             for trace in stream:
                 path = '%s_%s' % (tag, trace.stats.channel)
@@ -147,6 +189,9 @@ class StreamWorkspace(object):
             inventory = stream.getInventory()
             self.dataset.add_stationxml(inventory)
 
+        for station_name in station_names:
+            self._index_station(station_name)
+
     def getEventIds(self):
         """Return list of event IDs for events in ASDF file.
 
@@ -159,14 +204,114 @@ class StreamWorkspace(object):
             idlist.append(eid)
         return idlist
 
+    def _get_lazy_trace(self, trace_name, inventory, starttime=None,
+                        endtime=None):
+        """Get a trace whose samples are read when they are first used.
+
+        The header is built from the attributes of the waveform dataset in
+        the same way as pyasdf does when it reads the waveform.
+
+        Args:
+            trace_name (str): Name of the waveform dataset.
+            inventory (Inventory): Inventory of the station.
+            starttime (UTCDateTime): Only read the samples after this time.
+            endtime (UTCDateTime): Only read the samples before this time.
+
+        Returns:
+            LazyStationTrace: Trace without its samples.
+        """
+        network, station, location, channel = trace_name.split('.')[:4]
+        channel = channel[:channel.find('__')]
+        station_name = '%s.%s' % (network, station)
+        waveform_group = _get_pyasdf_private(self.dataset, '_waveform_group')
+        trace_dataset = waveform_group[station_name][trace_name]
+        attrs = dict(trace_dataset.attrs)
+        get_idx = _get_pyasdf_private(self.dataset,
+                                      '_get_idx_and_size_estimate')
+        idx_start, idx_end, data_starttime, _ = \
+            get_idx(trace_name, starttime, endtime)
+
+        details = AttribDict()
+        details.format_version = self.dataset.asdf_format_version
+        for name in ['event_id', 'origin_id', 'magnitude_id',
+                     'focal_mechanism_id']:
+            if name in attrs:
+                ids = attrs[name].tobytes().decode().split(',')
+                details[name + 's'] = [ResourceIdentifier(rid) for rid in ids]
+        if 'provenance_id' in attrs:
+            details.provenance_id = attrs['provenance_id'].tobytes().decode()
+        if 'labels' in attrs:
+            details.labels = labelstring2list(attrs['labels'])
+        details.tag = trace_name.split('__')[-1]
+
+        header = {
+            'network': network,
+            'station': station,
+            'location': location,
+            'channel': channel,
+            'starttime': data_starttime,
+            'sampling_rate': attrs['sampling_rate'],
+            '_format': 'ASDF',
+            'asdf': details
+        }
+        loader = functools.partial(_read_samples, trace_dataset,
+                                   idx_start, idx_end)
+        return LazyStationTrace(loader, max(idx_end - idx_start, 0),
+                                trace_dataset.dtype, header=header,
+                                inventory=inventory)
+
+    def _build_index(self):
+        """Index the waveforms in the file by event, station and tag.
+
+        The index is built from the attributes of the waveform datasets, so
+        no waveform data is read. It holds:
+            - _tags: {station_name: {tag: [trace_name, ...]}} for all
+              waveforms, where station_name is the NET.STA name of the
+              waveform group and trace_name is the name of the waveform
+              dataset in that group.
+            - _index: {eventid: {station_name: {tag: [trace_name, ...]}}}
+              for the waveforms associated with each event.
+            - _provenance: Set of the names of the provenance documents.
+        """
+        self._tags = {}
+        self._index = {}
+        self._provenance = set(self.dataset.provenance.list())
+        waveform_group = _get_pyasdf_private(self.dataset, '_waveform_group')
+        for station_name in waveform_group.keys():
+            self._index_station(station_name)
+
+    def _index_station(self, station_name):
+        """Update the index with the waveforms of one station.
+
+        Args:
+            station_name (str): Name (NET.STA) of the waveform group.
+        """
+        for event_stations in self._index.values():
+            event_stations.pop(station_name, None)
+        tags = {}
+        group = _get_pyasdf_private(
+            self.dataset, '_waveform_group')[station_name]
+        for trace_name, trace_dataset in group.items():
+            if trace_name == 'StationXML':
+                continue
+            tag = trace_name.split('__')[-1]
+            tags.setdefault(tag, []).append(trace_name)
+            if 'event_id' not in trace_dataset.attrs:
+                continue
+            event_ids = trace_dataset.attrs['event_id'].tobytes().decode()
+            for eventid in event_ids.split(','):
+                event_tags = self._index.setdefault(
+                    eventid, {}).setdefault(station_name, {})
+                event_tags.setdefault(tag, []).append(trace_name)
+        self._tags[station_name] = tags
+
     def getLabels(self):
         """Return all of the processing labels.
 
         Returns:
             list: List of processing labels.
         """
-        provtags = self.dataset.provenance.list()
-        labels = list(set([ptag.split('_')[1] for ptag in provtags]))
+        labels = list(set([ptag.split('_')[1] for ptag in self._provenance]))
         return labels
 
     def getStreamTags(self, eventid, label=None):
@@ -183,21 +328,17 @@ class StreamWorkspace(object):
             fmt = 'Event with a resource id containing %s could not be found.'
             raise KeyError(fmt % eventid)
         matching_tags = []
-        for waveform in self.dataset.waveforms:
-            tags = waveform.get_waveform_tags()
-            tags
+        for tags in self._index.get(eventid, {}).values():
             for tag in tags:
-                event_match = eventid in waveform[tag][0].stats.asdf.event_ids
-                label_match = True
-                if label is not None and label not in tag:
-                    label_match = False
-                if event_match and label_match:
+                if label is None or label in tag:
                     matching_tags.append(tag)
 
         matching_tags = list(set(matching_tags))
         return matching_tags
 
-    def getStreams(self, eventid, stations=None, labels=None, get_raw=False):
+    def getStreams(self, eventid, stations=None, labels=None, get_raw=False,
+                   starttime=None, endtime=None, lazy=False,
+                   get_provenance=True):
         """Get Stream from ASDF file given event id and input tags.
 
         Args:
@@ -207,13 +348,27 @@ class StreamWorkspace(object):
                 List of stations to search for.
             labels (list):
                 List of processing labels to search for.
+            get_raw (bool):
+                Get the raw streams instead of the processed ones.
+            starttime (UTCDateTime):
+                Only read the samples after this time.
+            endtime (UTCDateTime):
+                Only read the samples before this time.
+            lazy (bool):
+                Do not read the samples until the data of a trace is first
+                used (see LazyStationTrace). The data must be used before
+                the workspace is closed.
+            get_provenance (bool):
+                Read the provenance documents of the traces.
 
         Returns:
             list: List of StationStream objects.
         """
         auxholder = []
+        aux_paths = set()
         if 'ProcessingParameters' in self.dataset.auxiliary_data:
             auxholder = self.dataset.auxiliary_data.ProcessingParameters
+            aux_paths = set(auxholder.list())
         streams = []
         all_tags = []
         if not get_raw:
@@ -226,45 +381,60 @@ class StreamWorkspace(object):
                     all_tags.append('%s_%s' % (station.lower(), label))
         else:
             all_tags = ['raw_recording']
-        for waveform in self.dataset.waveforms:
-            ttags = waveform.get_waveform_tags()
-            if not get_raw and 'raw_recording' in ttags:
-                ttags.remove('raw_recording')
-            wtags = []
+        event_stations = self._index.get(eventid, {})
+        for station_name in sorted(event_stations):
+            ttags = set(event_stations[station_name])
+            if not get_raw:
+                ttags.discard('raw_recording')
             if not len(all_tags):
                 wtags = ttags
             else:
-                wtags = list(set(all_tags).intersection(set(ttags)))
-            for tag in wtags:
-                if eventid in waveform[tag][0].stats.asdf.event_ids:
-                    tstream = waveform[tag].copy()
-                    inventory = waveform['StationXML']
-                    traces = []
-                    for ttrace in tstream:
+                wtags = ttags.intersection(all_tags)
+            if not wtags:
+                continue
+            waveform = self.dataset.waveforms[station_name]
+            inventory = waveform['StationXML']
+            for tag in sorted(wtags):
+                if lazy:
+                    tstream = [
+                        self._get_lazy_trace(trace_name, inventory,
+                                             starttime, endtime)
+                        for trace_name in sorted(self._tags[station_name][tag])
+                    ]
+                else:
+                    tstream = waveform.get_item(tag, starttime=starttime,
+                                                endtime=endtime)
+                traces = []
+                for ttrace in tstream:
+                    if lazy:
+                        trace = ttrace
+                    else:
                         trace = StationTrace(data=ttrace.data,
                                              header=ttrace.stats,
                                              inventory=inventory)
-                        tpl = (trace.stats.network.lower(),
-                               trace.stats.station.lower(),
-                               trace.stats.channel.lower())
-                        channel = '%s_%s_%s' % tpl
-                        channel_tag = '%s_%s' % (tag, channel)
-                        if channel_tag in self.dataset.provenance.list():
-                            provdoc = self.dataset.provenance[channel_tag]
-                            trace.setProvenanceDocument(provdoc)
-                        trace_path = '%s_%s' % (tag, trace.stats.channel)
-                        if trace_path in auxholder:
-                            bytelist = auxholder[trace_path].data[:].tolist()
-                            jsonstr = ''.join([chr(b) for b in bytelist])
-                            jdict = json.loads(jsonstr)
-                            # jdict = unstringify_dict(jdict)
-                            for key, value in jdict.items():
-                                trace.setParameter(key, value)
-
-                        traces.append(trace)
-                    stream = StationStream(traces=traces)
-                    stream.tag = tag  # testing this out
-                    streams.append(stream)
+                    tpl = (trace.stats.network.lower(),
+                           trace.stats.station.lower(),
+                           trace.stats.channel.lower())
+                    channel = '%s_%s_%s' % tpl
+                    channel_tag = '%s_%s' % (tag, channel)
+                    if get_provenance and channel_tag in self._provenance:
+                        provdoc = self.dataset.provenance[channel_tag]
+                        trace.setProvenanceDocument(provdoc)
+                    trace_path = '%s_%s' % (tag, trace.stats.channel)
+                    if trace_path in aux_paths:
+                        bytelist = auxholder[trace_path].data[:].tolist()
+                        jsonstr = ''.join([chr(b) for b in bytelist])
+                        jdict = json.loads(jsonstr)
+                        # jdict = unstringify_dict(jdict)
+                        for key, value in jdict.items():
+                            if key in ARRAY_PARAMETERS:
+                                value = _arrayify_dict(value)
+                            trace.setParameter(key, value)
+
+                    traces.append(trace)
+                stream = StationStream(traces=traces)
+                stream.tag = tag  # testing this out
+                streams.append(stream)
         return streams
 
     def getStations(self, eventid=None):
@@ -277,25 +447,27 @@ class StreamWorkspace(object):
         Returns:
             list: List of station codes contained in workspace.
         """
+        if eventid is None:
+            station_tags = self._tags
+        else:
+            station_tags = self._index.get(eventid, {})
         stations = []
-        for waveform in self.dataset.waveforms:
-            tags = waveform.get_waveform_tags()
-            for tag in tags:
-                if eventid is None:
-                    event_match = True
-                else:
-                    event_match = eventid in waveform[tag][0].stats.asdf.event_ids
-                if not event_match:
-                    continue
+        for station_name in sorted(station_tags):
+            for tag in sorted(station_tags[station_name]):
                 station, _ = tag.split('_')
                 if station not in stations:
                     stations.append(station)
         return stations
 
     def setStreamMetrics(self, eventid, stations=None,
-                         labels=None, imclist=None, imtlist=None, origin=None):
+                         labels=None, imclist=None, imtlist=None, origin=None,
+                         store_table=False):
         """Create station metrics for specified event/streams.
 
+        The metrics of each stream are stored as XML, replacing any metrics
+        already stored for the stream. With store_table, they are also
+        stored in the metrics table of the event (see getMetricsArray).
+
         Args:
             eventid (str):
                 ID of event to search for in ASDF file.
@@ -309,6 +481,8 @@ class StreamWorkspace(object):
                 List of valid IMT names.
             origin (obspy event origin object):
                 Origin object for the event.
+            store_table (bool):
+                Also store the metrics in the metrics table of the event.
         """
         if not self.hasEvent(eventid):
             fmt = 'No event matching %s found in workspace.'
@@ -316,6 +490,7 @@ class StreamWorkspace(object):
 
         streams = self.getStreams(eventid, stations=stations, labels=labels)
 
+        rows = []
         for stream in streams:
             tag = stream.tag
             station, label = tag.split('_')
@@ -332,11 +507,136 @@ class StreamWorkspace(object):
             # approached failed. Suggestions are welcome.
             jsonarray = np.frombuffer(xmlstr, dtype=np.uint8)
             dtype = 'WaveFormMetrics'
+            # replace the metrics of a stream that already has them, so that
+            # the XML and the metrics table hold the same values
+            if dtype in self.dataset.auxiliary_data:
+                xml_group = _get_pyasdf_private(
+                    self.dataset, '_auxiliary_data_group')[dtype]
+                if path in xml_group:
+                    del xml_group[path]
             self.dataset.add_auxiliary_data(jsonarray,
                                             data_type=dtype,
                                             path=path,
                                             parameters={})
 
+            if store_table:
+                stats = stream[0].stats
+                row = {
+                    'STATION': stats.station,
+                    'NAME': stats.standard['station_name'],
+                    'SOURCE': stats.standard['source'],
+                    'NETID': stats.network,
+                    'LABEL': label,
+                    'LAT': stats.coordinates['latitude'],
+                    'LON': stats.coordinates['longitude']
+                }
+                for imt, imcdict in summary.pgms.items():
+                    for imc, value in imcdict.items():
+                        row['%s_%s' % (imt, imc)] = value
+                rows.append(row)
+
+        if len(rows):
+            self._update_metrics_table(eventid, rows)
+
+    def _update_metrics_table(self, eventid, rows):
+        """Add rows to the metrics table of an event.
+
+        Rows already in the table for the same station and label are
+        replaced. The table is rewritten, with a column for every metric of
+        the old and new rows; metrics missing from a row are NaN.
+
+        Args:
+            eventid (str): ID of the event.
+            rows (list): Dictionary of the columns of each row.
+        """
+        keys = set([(row['STATION'].lower(), row['LABEL']) for row in rows])
+        table = self.getMetricsArray(eventid)
+        if table is not None:
+            old_rows = [
+                dict(zip(table.dtype.names, record.tolist()))
+                for record in table
+                if (record['STATION'].lower(), record['LABEL']) not in keys
+            ]
+            rows = old_rows + rows
+            aux_group = _get_pyasdf_private(self.dataset,
+                                            '_auxiliary_data_group')
+            del aux_group[METRICS_TABLE][eventid]
+
+        metrics = set()
+        for row in rows:
+            metrics.update(row.keys())
+        metrics = sorted(metrics.difference(METRICS_TABLE_COLUMNS))
+
+        # strings are stored as fixed width UTF-8
+        columns = {}
+        for name, dtype in METRICS_TABLE_COLUMNS.items():
+            values = [row[name] for row in rows]
+            if dtype == 'S':
+                values = [str(value).encode('utf-8') for value in values]
+            columns[name] = np.array(values, dtype=dtype)
+        for name in metrics:
+            columns[name] = np.array([row.get(name, np.nan) for row in rows],
+                                     dtype=np.float64)
+        dtype = [(name, column.dtype) for name, column in columns.items()]
+        table = np.empty(len(rows), dtype=dtype)
+        for name, column in columns.items():
+            table[name] = column
+        self.dataset.add_auxiliary_data(table,
+                                        data_type=METRICS_TABLE,
+                                        path=eventid,
+                                        parameters={})
+
+    def getMetricsArray(self, eventid, stations=None, labels=None):
+        """Get the metrics table of an event, written by setStreamMetrics.
+
+        The table is a structured array with a row for each stream. The
+        STATION, NAME, SOURCE, NETID and LABEL fields are strings, LAT and
+        LON are the station coordinates, and there is a float field named
+        <IMT>_<IMC> (e.g., SA(1.0)_ROTD50.0) for each metric. Unlike the
+        XML metrics, the values are not rounded. pd.DataFrame(array) gives
+        the table as a DataFrame.
+
+        Args:
+            eventid (str):
+                ID of event to search for in ASDF file.
+            stations (list):
+                List of stations to return metrics from.
+            labels (list):
+                List of processing labels to return metrics from.
+
+        Returns:
+            ndarray: Structured array of the metrics, or None if there is no
+            metrics table for the event.
+        """
+        if METRICS_TABLE not in self.dataset.auxiliary_data:
+            return None
+        table_group = _get_pyasdf_private(
+            self.dataset, '_auxiliary_data_group')[METRICS_TABLE]
+        if eventid not in table_group:
+            return None
+        table = table_group[eventid][()]
+        # turn the UTF-8 bytes into str
+        dtype = []
+        for name in table.dtype.names:
+            if table.dtype[name].kind == 'S':
+                dtype.append((name, 'U%i' % table.dtype[name].itemsize))
+            else:
+                dtype.append((name, table.dtype[name]))
+        strtable = np.empty(len(table), dtype=dtype)
+        for name in table.dtype.names:
+            if table.dtype[name].kind == 'S':
+                strtable[name] = np.char.decode(table[name], 'utf-8')
+            else:
+                strtable[name] = table[name]
+        table = strtable
+
+        if stations is not None:
+            stations = [station.lower() for station in stations]
+            table = table[np.isin(np.char.lower(table['STATION']), stations)]
+        if labels is not None:
+            table = table[np.isin(table['LABEL'], labels)]
+        return table
+
     def getMetricsTable(self, eventid, stations=None, labels=None):
         """Return a pandas DataFrame summarizing the metrics for given Streams.
 
@@ -364,24 +664,38 @@ class StreamWorkspace(object):
         if labels is None:
             labels = self.getLabels()
 
-        df = None
+        # waveform group (NET.STA) of each stream of the event
+        stream_groups = {}
+        for station_name in sorted(self._index.get(eventid, {})):
+            for tag in self._index[eventid][station_name]:
+                stream_groups.setdefault(tag, station_name)
+
+        headers = {}
+        rows = []
         for station in stations:
             for label in labels:
                 summary = self.getStreamMetrics(eventid, station, label)
-                stream = self.getStreams(eventid,
-                                         stations=[station],
-                                         labels=[label])[0]
+                tag = '%s_%s' % (station.lower(), label)
+                station_name = stream_groups[tag]
+                if station_name not in headers:
+                    # only the header of one trace is needed
+                    inventory = self.dataset.waveforms[station_name].StationXML
+                    trace_name = sorted(self._tags[station_name][tag])[0]
+                    trace = self._get_lazy_trace(trace_name, inventory)
+                    headers[station_name] = trace.stats
+                stats = headers[station_name]
                 row = summary.toSeries()
-                row['STATION'] = stream[0].stats.station
-                row['NAME'] = stream[0].stats.standard['station_name']
-                row['SOURCE'] = stream[0].stats.standard['source']
-                row['NETID'] = stream[0].stats.network
-                row['LAT'] = stream[0].stats.coordinates['latitude']
-                row['LON'] = stream[0].stats.coordinates['longitude']
-
-                if df is None:
-                    df = pd.DataFrame(columns=row.index)
-                df = df.append(row, ignore_index=True)
+                row['STATION'] = stats.station
+                row['NAME'] = stats.standard['station_name']
+                row['SOURCE'] = stats.standard['source']
+                row['NETID'] = stats.network
+                row['LAT'] = stats.coordinates['latitude']
+                row['LON'] = stats.coordinates['longitude']
+                rows.append(row)
+
+        if not len(rows):
+            return None
+        df = pd.DataFrame(rows, columns=rows[0].index)
 
         # TODO - reorder df columns. This is complicated with multi-index.
 
@@ -409,9 +723,8 @@ class StreamWorkspace(object):
         if stream_path not in auxholder:
             fmt = 'Waveform metrics for event %s and stream %s not found in workspace.'
             raise KeyError(fmt % (eventid, tag))
-        bytelist = auxholder[stream_path].data[:].tolist()
-        xmlstr = ''.join([chr(b) for b in bytelist])
-        summary = StationSummary.fromMetricXML(xmlstr.encode('utf-8'))
+        xmlbytes = auxholder[stream_path].data[()].tobytes()
+        summary = StationSummary.fromMetricXML(xmlbytes)
         return summary
 
     def summarizeLabels(self):
@@ -562,8 +875,8 @@ class StreamWorkspace(object):
         cols = ['Record', 'Processing Step',
                 'Step Attribute', 'Attribute Value']
         df = pd.DataFrame(columns=cols)
+        tlist = sorted(self._provenance)
         for tag in all_tags:
-            tlist = self.dataset.provenance.list()
             reg = re.compile(tag)
             taglist = list(filter(reg.match, tlist))
             for trace_tag in taglist:
@@ -599,13 +912,121 @@ class StreamWorkspace(object):
         return df
 
 
+class LazyStationTrace(StationTrace):
+    """StationTrace that reads its samples when the data is first used.
+
+    The header is complete when the trace is created, so the trace can be
+    used for its metadata without reading the samples. They are read by
+    calling the loader the first time the data attribute is used; copying
+    or pickling the trace also reads them.
+    """
+
+    def __init__(self, loader, npts, dtype, header=None, inventory=None):
+        """Construct LazyStationTrace.
+
+        Args:
+            loader (callable):
+                Function with no arguments that returns the samples.
+            npts (int):
+                Number of samples that the loader returns.
+            dtype (dtype):
+                Type of the samples.
+            header (dict-like):
+                Dictionary of metadata (see trace.stats docs).
+            inventory (Inventory):
+                Obspy Inventory object.
+        """
+        super(LazyStationTrace, self).__init__(
+            data=np.array([], dtype=dtype), header=header,
+            inventory=inventory)
+        self.stats.npts = npts
+        self._loader = loader
+
+    @property
+    def data(self):
+        if self._loader is not None:
+            # setting the data clears the loader
+            self.data = self._loader()
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
+        self._loader = None
+
+    def __len__(self):
+        return self.stats.npts
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_data'] = self.data
+        state['_loader'] = None
+        return state
+
+    def __str__(self, id_length=None, indent=0):
+        """
+        Extends StationTrace __str__ without reading the samples.
+        """
+        loader = self._loader
+        # waveforms in ASDF files are never masked, so the empty array
+        # stands in for the samples
+        self._loader = None
+        try:
+            return super(LazyStationTrace, self).__str__(id_length, indent)
+        finally:
+            self._loader = loader
+
+
+def _get_pyasdf_private(dataset, name):
+    """Get a private member of a pyasdf ASDFDataSet.
+
+    Args:
+        dataset (ASDFDataSet): Dataset of the workspace.
+        name (str): Name of the member, one of PYASDF_PRIVATE.
+
+    Returns:
+        Value of the member.
+
+    Raises:
+        GMProcessException: If the installed pyasdf does not have the member.
+    """
+    try:
+        return getattr(dataset, name)
+    except AttributeError:
+        fmt = ('pyasdf %s does not have ASDFDataSet.%s, which the workspace '
+               'needs; install a pyasdf version that has it (0.8 is known '
+               'to work).')
+        raise GMProcessException(fmt % (pyasdf.__version__, name))
+
+
+def _read_samples(trace_dataset, idx_start, idx_end):
+    return trace_dataset[idx_start:idx_end]
+
+
 def _stringify_dict(indict):
+    # Build a new dictionary so that the trace parameters themselves are
+    # left untouched
+    outdict = {}
     for key, value in indict.items():
         if isinstance(value, UTCDateTime):
-            indict[key] = value.strftime(TIMEFMT_MS)
+            outdict[key] = value.strftime(TIMEFMT_MS)
+        elif isinstance(value, np.ndarray):
+            outdict[key] = value.tolist()
         elif isinstance(value, dict):
-            indict[key] = _stringify_dict(value)
-    return indict
+            outdict[key] = _stringify_dict(value)
+        else:
+            outdict[key] = value
+    return outdict
+
+
+def _arrayify_dict(indict):
+    outdict = {}
+    for key, value in indict.items():
+        if isinstance(value, list):
+            outdict[key] = np.array(value)
+        else:
+            outdict[key] = value
+    return outdict
 
 
 def unstringify_dict(indict):
@@ -13,6 +13,8 @@ from obspy.core.utcdatetime import UTCDateTime
 from gmprocess.stationstream import StationStream
 from gmprocess.stationtrace import StationTrace, PROCESS_LEVELS
 from gmprocess.io.seedname import get_channel_name
+from gmprocess.io.fixed_width import decode_fixed_width
+from gmprocess.io.utils import get_first_line, open_data_file
 
 
 INTIMEFMT = '%Y/%m/%d %H:%M:%S'
@@ -32,8 +34,20 @@ NETWORK = 'I1'
 LEVELS = {'VOL1DS': 'V1'}
 
 
+def sniff_bhrc(prefix):
+    """Check the first line of a file for the BHRC volume marker.
+
+    Args:
+        prefix (bytes): First bytes of the candidate BHRC file.
+
+    Returns:
+        bool: False if the file cannot be BHRC, True otherwise.
+    """
+    return get_first_line(prefix).startswith('* VOL')
+
+
 def is_bhrc(filename):
-    with open(filename, 'rt') as f:
+    with open_data_file(filename) as f:
         lines = [next(f) for x in range(TEXT_HDR_ROWS)]
 
     has_line1 = lines[0].startswith('* VOL')
@@ -47,17 +61,19 @@ def read_bhrc(filename):
     """Read the Iran BHRC strong motion data format.
 
     Args:
-        filename (str): path to BHRC data file.
+        filename (str or file-like): path to BHRC data file.
 
     Returns:
         list: Sequence of one StationStream object containing 3 StationTrace objects.
     """
-    header1, offset = _read_header_lines(filename, 0)
-    data1, offset = _read_data(filename, offset, header1)
-    header2, offset = _read_header_lines(filename, offset)
-    data2, offset = _read_data(filename, offset, header2)
-    header3, offset = _read_header_lines(filename, offset)
-    data3, offset = _read_data(filename, offset, header3)
+    with open_data_file(filename) as f:
+        lines = f.readlines()
+    header1, offset = _read_header_lines(lines, 0)
+    data1, offset = _read_data(lines, offset, header1)
+    header2, offset = _read_header_lines(lines, offset)
+    data2, offset = _read_data(lines, offset, header2)
+    header3, offset = _read_header_lines(lines, offset)
+    data3, offset = _read_data(lines, offset, header3)
     trace1 = StationTrace(data1, header1)
     trace2 = StationTrace(data2, header2)
     trace3 = StationTrace(data3, header3)
@@ -65,12 +81,12 @@ def read_bhrc(filename):
     return [stream]
 
 
-def _read_header_lines(filename, offset):
+def _read_header_lines(all_lines, offset):
     """Read the header lines for each channel.
 
     Args:
-        filename (str): 
-            Input BHRC file name.
+        all_lines (list):
+            Lines (str) of the BHRC file.
         offset (int): 
             Number of lines to skip from the beginning of the file.
 
@@ -78,10 +94,7 @@ def _read_header_lines(filename, offset):
         tuple: (header dictionary containing Stats dictionary with extra sub-dicts, 
                 updated offset rows)
     """
-    with open(filename, 'rt') as f:
-        for _ in range(offset):
-            next(f)
-        lines = [next(f) for x in range(TEXT_HDR_ROWS)]
+    lines = all_lines[offset:offset + TEXT_HDR_ROWS]
 
     offset += TEXT_HDR_ROWS
 
@@ -172,12 +185,12 @@ def _read_header_lines(filename, offset):
     return (header, offset)
 
 
-def _read_data(filename, offset, header):
+def _read_data(lines, offset, header):
     """Read acceleration data from BHRC file.
 
     Args:
-        filename (str): 
-            BHRC strong motion filename.
+        lines (list):
+            Lines (str) of the BHRC strong motion file.
         offset (int):
             Number of rows from the beginning of the file to skip.
         header (dict):
@@ -189,9 +202,7 @@ def _read_data(filename, offset, header):
     widths = [COLWIDTH] * COLS_PER_ROW
     npoints = header['npts']
     nrows = int(np.ceil(npoints / COLS_PER_ROW))
-    data = np.genfromtxt(filename, skip_header=offset,
-                         max_rows=nrows, filling_values=np.nan,
-                         delimiter=widths)
+    data = decode_fixed_width(lines[offset:offset + nrows], widths)
     data = data.flatten()
     data = data[0:header['npts']]
 
@@ -0,0 +1,231 @@
+"""
+Persistent cache of parsed strong motion data files.
+
+Parsing the text formats is slow, so the streams read from a file can be
+stored on disk and read back the next time the same file is read. Each
+cached file is a numpy .npz file holding the data array of every trace and
+the pickled stats, provenance and parameters of the traces. Entries are
+keyed by the path, size and modification time of the data file, the
+arguments to the reader and the version of gmprocess, so entries for files
+that have changed are never used; they are removed when the cache grows
+past its size limit, starting with the least recently used entry.
+
+The cache is enabled with the 'cache' options in the 'read' section of the
+config file. Cache directories should only be shared by trusted users,
+since the headers are pickled.
+"""
+
+# stdlib imports
+import functools
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+
+# third party imports
+import numpy as np
+
+# local imports
+import gmprocess
+from gmprocess.config import get_config
+from gmprocess.stationstream import StationStream
+from gmprocess.stationtrace import StationTrace
+
+# Version of the layout of the cached files; change this to invalidate all
+# existing entries
+CACHE_VERSION = 1
+
+# Defaults for the cache options in the config file
+DEFAULT_DIRECTORY = os.path.join('~', '.gmprocess', 'cache')
+DEFAULT_MAX_SIZE = 1024  # megabytes
+
+CACHE_EXT = '.npz'
+
+
+class ReadCache(object):
+    """Cache of the streams read from data files, stored on disk."""
+
+    def __init__(self, directory, max_size=DEFAULT_MAX_SIZE):
+        """Create a cache in a directory, which is created if needed.
+
+        Args:
+            directory (str):
+                Directory holding the cached files.
+            max_size (float):
+                Size limit of the cache, in megabytes.
+        """
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        self.max_size = int(max_size * 1024 * 1024)
+        os.makedirs(self.directory, exist_ok=True)
+        self._size = sum(size for _, size, _ in self._entries())
+
+    def get(self, filename, read_format=None, **kwargs):
+        """Get the streams read from a file, if they are in the cache.
+
+        Args:
+            filename (str):
+                Path to the data file.
+            read_format (str):
+                Format the file was read with, or None.
+            kwargs (ref):
+                Other arguments the file was read with.
+
+        Returns:
+            list: Sequence of StationStreams, or None if the file is not in
+            the cache.
+        """
+        cache_file = self._get_cache_file(filename, read_format, kwargs)
+        if cache_file is None or not os.path.isfile(cache_file):
+            return None
+        try:
+            with np.load(cache_file, allow_pickle=False) as contents:
+                headers = pickle.loads(contents['headers'].tobytes())
+                arrays = [contents['data_%i' % idx]
+                          for idx in range(len(headers))]
+        except Exception as e:
+            # a corrupt or partly removed entry is just a miss
+            logging.debug('Could not read cache file %s: %s' %
+                          (cache_file, str(e)))
+            return None
+        # mark the entry as recently used
+        try:
+            os.utime(cache_file)
+        except OSError:
+            pass
+
+        streams = []
+        for (stream_idx, stats, provenance, parameters), data in zip(
+                headers, arrays):
+            trace = StationTrace(data=data, header=stats)
+            trace.provenance = provenance
+            trace.parameters = parameters
+            while len(streams) <= stream_idx:
+                streams.append([])
+            streams[stream_idx].append(trace)
+        return [StationStream(traces=traces) for traces in streams]
+
+    def put(self, filename, streams, read_format=None, **kwargs):
+        """Store the streams read from a file.
+
+        Args:
+            filename (str):
+                Path to the data file.
+            streams (list):
+                Sequence of StationStreams read from the file.
+            read_format (str):
+                Format the file was read with, or None.
+            kwargs (ref):
+                Other arguments the file was read with.
+        """
+        cache_file = self._get_cache_file(filename, read_format, kwargs)
+        if cache_file is None:
+            return
+        headers = []
+        arrays = {}
+        for stream_idx, stream in enumerate(streams):
+            for trace in stream:
+                arrays['data_%i' % len(headers)] = trace.data
+                headers.append((stream_idx, trace.stats, trace.provenance,
+                                trace.parameters))
+        arrays['headers'] = np.frombuffer(pickle.dumps(headers),
+                                          dtype=np.uint8)
+
+        # write to a temporary file first so that other processes never see
+        # a partly written entry; failing to write the entry (e.g., because
+        # the disk is full) must not stop the file from being read
+        temp_file = None
+        try:
+            fd, temp_file = tempfile.mkstemp(suffix=CACHE_EXT,
+                                             dir=self.directory)
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f, **arrays)
+            os.replace(temp_file, cache_file)
+        except Exception as e:
+            logging.warning('Could not write cache file %s: %s' %
+                            (cache_file, str(e)))
+            if temp_file is not None and os.path.exists(temp_file):
+                try:
+                    os.remove(temp_file)
+                except OSError:
+                    pass
+            return
+        self._size += os.path.getsize(cache_file)
+        if self._size > self.max_size:
+            self.prune()
+
+    def prune(self):
+        """Remove the least recently used entries until the cache fits."""
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        size = sum(entry[1] for entry in entries)
+        for path, entry_size, _ in entries:
+            if size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                # removed by another process
+                pass
+            size -= entry_size
+        self._size = size
+
+    def clear(self):
+        """Remove all entries."""
+        for path, _, _ in self._entries():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._size = 0
+
+    def _entries(self):
+        """Get the path, size and last use time of each entry."""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(CACHE_EXT):
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((entry.path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _get_cache_file(self, filename, read_format, kwargs):
+        """Get the path of the entry for a data file.
+
+        Returns:
+            str: Path of the entry, or None if the data file cannot be
+            found.
+        """
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return None
+        key = repr((os.path.abspath(filename), stat.st_size, stat.st_mtime_ns,
+                    read_format, sorted(kwargs.items()),
+                    gmprocess.__version__, CACHE_VERSION))
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, digest + CACHE_EXT)
+
+
+@functools.lru_cache(maxsize=None)
+def get_read_cache():
+    """Get the cache used by read_data, as set up in the config file.
+
+    Returns:
+        ReadCache: The cache, or None if caching is not enabled or the cache
+        directory cannot be used.
+    """
+    config = get_config() or {}
+    cache_conf = (config.get('read', None) or {}).get('cache', None) or {}
+    if not cache_conf.get('enabled', False):
+        return None
+    directory = cache_conf.get('directory', None) or DEFAULT_DIRECTORY
+    max_size = cache_conf.get('max_size', DEFAULT_MAX_SIZE)
+    try:
+        return ReadCache(directory, max_size=max_size)
+    except OSError as e:
+        logging.warning('Could not use cache directory %s, files will not '
+                        'be cached: %s' % (directory, str(e)))
+        return None
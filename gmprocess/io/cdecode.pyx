@@ -0,0 +1,50 @@
+
+# third party imports
+import numpy as np
+cimport numpy as np
+cimport cython
+from libc.stdlib cimport strtod
+from libc.string cimport memcpy
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def decode_fields(const unsigned char[:] buffer, int width, double missing):
+    """
+    Decode a buffer of consecutive fixed-width numeric fields.
+
+    Args:
+        buffer (bytes): Fields, with no separators between them.
+        width (int): Width of each field in characters (at most 63).
+        missing (float): Value of fields that are blank or not numbers.
+
+    Returns:
+        np.ndarray: Array of float64, one value per field.
+    """
+    cdef Py_ssize_t nfields = buffer.shape[0] // width
+    cdef np.ndarray[double, ndim=1, mode='c'] values = np.empty(nfields)
+    cdef double *values_ptr = <double *>values.data
+    cdef const unsigned char *buffer_ptr
+    cdef char field[64]
+    cdef char *end
+    cdef Py_ssize_t idx
+
+    if width < 1 or width > 63:
+        raise ValueError('Field width must be between 1 and 63.')
+    if nfields == 0:
+        return values
+    buffer_ptr = &buffer[0]
+    with nogil:
+        for idx in range(nfields):
+            memcpy(field, buffer_ptr + idx * width, width)
+            field[width] = 0
+            values_ptr[idx] = strtod(field, &end)
+            if end == field:
+                values_ptr[idx] = missing
+                continue
+            # only whitespace may follow the number
+            while end[0] == b' ' or end[0] == b'\t':
+                end += 1
+            if end[0] != 0:
+                values_ptr[idx] = missing
+    return values
@@ -17,6 +17,8 @@ from gmprocess.exception import GMProcessException
 from gmprocess.stationstream import StationStream
 from gmprocess.stationtrace import StationTrace, TIMEFMT, PROCESS_LEVELS
 from gmprocess.io.seedname import get_channel_name
+from gmprocess.io.fixed_width import decode_fixed_width
+from gmprocess.io.utils import get_first_line, open_data_file
 
 
 MSEC_TO_SEC = 1/1000.0
@@ -158,6 +160,21 @@ SENSOR_TYPES = {
 }
 
 
+def sniff_cosmos(prefix):
+    """Check the first line of a file for the COSMOS markers.
+
+    Args:
+        prefix (bytes): First bytes of the candidate COSMOS file.
+
+    Returns:
+        bool: False if the file cannot be COSMOS V0/V1, True otherwise.
+    """
+    line = get_first_line(prefix).lower()
+    if line.find('(format v') < 0:
+        return False
+    return any(line.find(marker.lower()) >= 0 for marker in VALID_MARKERS)
+
+
 def is_cosmos(filename):
     """Check to see if file is a COSMOS V0/V1 strong motion file.
 
@@ -168,7 +185,7 @@ def is_cosmos(filename):
     """
     logging.debug("Checking if format is cosmos.")
     try:
-        line = open(filename, 'rt').readline()
+        line = open_data_file(filename).readline()
         for marker in VALID_MARKERS:
             if line.lower().find(marker.lower()) >= 0:
                 if line.lower().find('(format v') >= 0:
@@ -186,7 +203,7 @@ def read_cosmos(filename, **kwargs):
     This will be set to either "V1" or "V2".
 
     Args:
-        filename (str): Path to possible COSMOS V1/V2 data file.
+        filename (str or file-like): Path to possible COSMOS V1/V2 data file.
         kwargs (ref):
             valid_station_types (list): List of valid station types. See table
                 6  in the COSMOS strong motion data format documentation for
@@ -204,16 +221,17 @@ def read_cosmos(filename, **kwargs):
     # get list of valid stations
     location = kwargs.get('location', '')
 
-    # count the number of lines in the file
-    with open(filename) as f:
-        line_count = sum(1 for _ in f)
+    # read the whole file once; every channel is parsed from these lines
+    with open_data_file(filename) as f:
+        lines = f.readlines()
+    line_count = len(lines)
 
     # read as many channels as are present in the file
     line_offset = 0
     stream = StationStream([])
     while line_offset < line_count:
         trace, line_offset = _read_channel(
-            filename, line_offset, location=location)
+            lines, line_offset, location=location)
         # store the trace if the station type is in the valid_station_types
         # list or store the trace if there is no valid_station_types list
         if valid_station_types is not None:
@@ -225,44 +243,41 @@ def read_cosmos(filename, **kwargs):
     return [stream]
 
 
-def _read_channel(filename, line_offset, location=''):
+def _read_channel(lines, line_offset, location=''):
     """Read channel data from COSMOS V1/V2 text file.
 
     Args:
-        filename (str): Input COSMOS V1/V2 filename.
+        lines (list): Lines (str) of the COSMOS V1/V2 file.
         line_offset (int): Line offset to beginning of channel text block.
 
     Returns:
         tuple: (obspy Trace, int line offset)
     """
     # read station, location, and process level from text header
-    with open(filename, 'rt') as f:
-        for _ in range(line_offset):
-            next(f)
-        lines = [next(f) for x in range(TEXT_HDR_ROWS)]
+    hdr_lines = lines[line_offset:line_offset + TEXT_HDR_ROWS]
 
     # read in lines of integer data
     skiprows = line_offset + TEXT_HDR_ROWS
-    int_lines, int_data = _read_lines(skiprows, filename)
+    int_lines, int_data = _read_lines(skiprows, lines)
     int_data = int_data.astype(np.int32)
 
     # read in lines of float data
     skiprows += int_lines + 1
-    flt_lines, flt_data = _read_lines(skiprows, filename)
+    flt_lines, flt_data = _read_lines(skiprows, lines)
 
     # read in comment lines
     skiprows += flt_lines + 1
-    cmt_lines, cmt_data = _read_lines(skiprows, filename)
+    cmt_lines, cmt_data = _read_lines(skiprows, lines)
     skiprows += cmt_lines + 1
 
     # according to the powers that defined the Network.Station.Channel.Location
     # "standard", Location is a two character field.  Most data providers,
     # including cosmos here, don't provide this.  We'll flag it as "--".
-    hdr = _get_header_info(int_data, flt_data, lines,
+    hdr = _get_header_info(int_data, flt_data, hdr_lines,
                            cmt_data, location=location)
 
     # read in the data
-    nrows, data = _read_lines(skiprows, filename)
+    nrows, data = _read_lines(skiprows, lines)
     # check units
     unit = hdr['format_specific']['physical_units']
     if unit in UNIT_CONVERSIONS:
@@ -632,46 +647,37 @@ def _check_assign(value, unknown, default):
         return default
 
 
-def _read_lines(skip_rows, filename):
+def _read_lines(skip_rows, lines):
     """Read lines of comments and data exluding headers.
 
     Args:
         skip_rows (int): Number of rows to skip.
-        filename (str): Path to possible COSMOS V0/V1 data file.
+        lines (list): Lines (str) of the COSMOS V0/V1 data file.
     Returns:
         array-like: List of comments or array of data.
     """
     # read the headers
-    header = np.genfromtxt(filename,
-                           skip_header=skip_rows - 1,
-                           max_rows=1,
-                           dtype='str')
+    header = lines[skip_rows - 1].split()
 
     # parse the number of points and convert the header to a string
     npts = int(header[0])
-    header = np.array_str(header).lower().replace(
-        "'", '').replace(' ', '').lower()
+    header = ''.join(header).lower()
 
     # determine whether the following lines are comments or data
-    if header.lower().find('comment') >= 0:
+    if header.find('comment') >= 0:
         num_lines = npts
 
-        # read and store comment lines
-        with open(filename, 'rt') as f:
-            file = f.readlines()
-        max_lines = skip_rows + num_lines
-        comment = [file[idx] for idx in range(skip_rows, max_lines)]
-        data_arr = comment
+        # store comment lines
+        data_arr = lines[skip_rows:skip_rows + num_lines]
     else:
         # parse out the format of the data
-        format_data = re.findall('\d+', header[header.find('format=') + 8:])
+        format_data = re.findall(r'\d+', header[header.find('format=') + 8:])
         cols = int(format_data[0])
         fmt = int(format_data[1])
         num_lines = int(np.ceil(npts / cols))
-        widths = [fmt] * cols
 
         # read data
-        data_arr = np.genfromtxt(filename, skip_header=skip_rows,
-                                 max_rows=num_lines, dtype=np.float64,
-                                 delimiter=widths).flatten()
+        data_arr = decode_fixed_width(
+            lines[skip_rows:skip_rows + num_lines], [fmt] * cols).flatten()
     return num_lines, data_arr
+
@@ -9,6 +9,8 @@ from obspy.core.trace import Stats
 
 # local imports
 from gmprocess.io.seedname import get_channel_name
+from gmprocess.io.fixed_width import decode_fixed_width
+from gmprocess.io.utils import get_first_line, open_data_file
 from gmprocess.stationtrace import StationTrace, PROCESS_LEVELS
 from gmprocess.stationstream import StationStream
 
@@ -21,6 +23,18 @@ COLWIDTH = 10
 NCOLS = 4
 
 
+def sniff_cwb(prefix):
+    """Check the first line of a file for the CWB marker.
+
+    Args:
+        prefix (bytes): First bytes of the candidate CWB file.
+
+    Returns:
+        bool: False if the file cannot be CWB, True otherwise.
+    """
+    return get_first_line(prefix).startswith('#Earthquake Information')
+
+
 def is_cwb(filename):
     """Check to see if file is a Taiwan Central Weather Bureau strong motion file.
 
@@ -31,7 +45,7 @@ def is_cwb(filename):
     """
     logging.debug("Checking if format is cwb.")
     try:
-        f = open(filename, 'rt')
+        f = open_data_file(filename)
         line = f.readline()
         f.close()
         if line.startswith('#Earthquake Information'):
@@ -45,7 +59,7 @@ def read_cwb(filename, **kwargs):
     """Read Taiwan Central Weather Bureau strong motion file.
 
     Args:
-        filename (str): Path to possible CWB data file.
+        filename (str or file-like): Path to possible CWB data file.
         kwargs (ref): Other arguments will be ignored.
 
     Returns:
@@ -55,15 +69,15 @@ def read_cwb(filename, **kwargs):
     logging.debug("Starting read_cwb.")
     if not is_cwb(filename):
         raise Exception('%s is not a valid CWB strong motion data file.' % filename)
-    f = open(filename, 'rt')
+    with open_data_file(filename) as f:
+        lines = f.readlines()
     # according to the powers that defined the Network.Station.Channel.Location
     # "standard", Location is a two character field.  Most data providers,
     # including CWB here, don't provide this.  We'll flag it as "--".
-    data = np.genfromtxt(filename, skip_header=HDR_ROWS,
-                         delimiter=[COLWIDTH] * NCOLS)  # time, Z, NS, EW
+    data = decode_fixed_width(
+        lines[HDR_ROWS:], [COLWIDTH] * NCOLS)  # time, Z, NS, EW
 
-    hdr = _get_header_info(f, data)
-    f.close()
+    hdr = _get_header_info(lines, data)
 
     hdr_z = hdr.copy()
     hdr_z['channel'] = get_channel_name(
@@ -107,7 +121,7 @@ def read_cwb(filename, **kwargs):
     return [stream]
 
 
-def _get_header_info(file, data):
+def _get_header_info(lines, data):
     """Return stats structure from various headers.
 
     Output is a dictionary like this:
@@ -145,7 +159,7 @@ def _get_header_info(file, data):
         - dc_offset_h2 (float)
 
     Args:
-        file (TextIOWrapper): File object containing data
+        lines (list): Lines (str) of the CWB file
         data (ndarray): Array of strong motion data
 
     Returns:
@@ -156,8 +170,7 @@ def _get_header_info(file, data):
     standard = {}
     format_specific = {}
     hdr['location'] = '--'
-    while True:
-        line = file.readline()
+    for line in lines:
         if line.startswith('#StationCode'):
             hdr['station'] = line.split(':')[1].strip()
             logging.debug("station: %s" % hdr['station'])
@@ -18,6 +18,8 @@ from gmprocess.io.seedname import get_channel_name
 from gmprocess.stationtrace import StationTrace, TIMEFMT, PROCESS_LEVELS
 from gmprocess.stationstream import StationStream
 from gmprocess.io.utils import is_evenly_spaced, resample_uneven_trace
+from gmprocess.io.fixed_width import decode_fixed_width
+from gmprocess.io.utils import get_first_line, open_data_file
 
 V1_TEXT_HDR_ROWS = 13
 V1_INT_HDR_ROWS = 7
@@ -89,6 +91,20 @@ def _get_time(line):
     return None
 
 
+def sniff_dmg(prefix):
+    """Check the first line of a file for the DMG volume markers.
+
+    Args:
+        prefix (bytes): First bytes of the candidate DMG file.
+
+    Returns:
+        bool: False if the file cannot be DMG, True otherwise.
+    """
+    line = get_first_line(prefix).upper()
+    markers = [V1_MARKER, V2_MARKER, V3_MARKER]
+    return any(line.find(marker) >= 0 for marker in markers)
+
+
 def is_dmg(filename):
     """Check to see if file is a DMG strong motion file.
 
@@ -103,7 +119,7 @@ def is_dmg(filename):
     """
     logging.debug("Checking if format is dmg.")
     try:
-        f = open(filename, 'rt')
+        f = open_data_file(filename)
         first_line = f.readline().upper()
         second_line = f.readline().upper()
         third_line = f.readline().upper()
@@ -132,7 +148,7 @@ def read_dmg(filename, **kwargs):
         CSMIP is synonymous to as DMG in this reader.
 
     Args:
-        filename (str): Path to possible DMG data file.
+        filename (str or file-like): Path to possible DMG data file.
         kwargs (ref):
             units (str): String determining which timeseries is return. Valid
                     options include 'acc', 'vel', 'disp'. Default is 'acc'.
@@ -155,7 +171,7 @@ def read_dmg(filename, **kwargs):
         raise Exception('DMG: Not a valid choice of units.')
 
     # Check for DMG format and determine volume type
-    line = open(filename, 'rt').readline()
+    line = open_data_file(filename).readline()
     if is_dmg(filename):
         if line.lower().find('uncorrected') >= 0:
             reader = 'V1'
@@ -164,9 +180,10 @@ def read_dmg(filename, **kwargs):
         elif line.lower().find('response') >= 0:
             reader = 'V3'
 
-    # Count the number of lines in the file
-    with open(filename) as f:
-        line_count = sum(1 for _ in f)
+    # Read the whole file once; every channel is parsed from these lines
+    with open_data_file(filename) as f:
+        lines = f.readlines()
+    line_count = len(lines)
 
     # Read as many channels as are present in the file
     line_offset = 0
@@ -174,12 +191,12 @@ def read_dmg(filename, **kwargs):
     while line_offset < line_count:
         if reader == 'V2':
             traces, line_offset = _read_volume_two(
-                filename, line_offset, location=location, units=units)
+                lines, line_offset, location=location, units=units)
             if traces is not None:
                 trace_list += traces
         elif reader == 'V1':
             traces, line_offset = _read_volume_one(
-                filename, line_offset, location=location, units=units)
+                lines, line_offset, location=location, units=units)
             if traces is not None:
                 trace_list += traces
         else:
@@ -192,35 +209,31 @@ def read_dmg(filename, **kwargs):
     return [stream]
 
 
-def _read_volume_one(filename, line_offset, location='', units='acc'):
+def _read_volume_one(all_lines, line_offset, location='', units='acc'):
     """Read channel data from DMG Volume 1 text file.
 
     Args:
-        filename (str): Input DMG V1 filename.
+        all_lines (list): Lines (str) of the DMG V1 file.
         line_offset (int): Line offset to beginning of channel text block.
         units (str): units to get
     Returns:
         tuple: (list of obspy Trace, int line offset)
     """
     # Parse the header portion of the file
-    try:
-        with open(filename, 'rt') as f:
-            for _ in range(line_offset):
-                next(f)
-            lines = [next(f) for x in range(V1_TEXT_HDR_ROWS)]
     # Accounts for blank lines at end of files
-    except StopIteration:
+    if line_offset + V1_TEXT_HDR_ROWS > len(all_lines):
         return (None, 1 + line_offset)
+    lines = all_lines[line_offset:line_offset + V1_TEXT_HDR_ROWS]
 
     unit = _get_units(lines[11])
     # read in lines of integer data
     skip_rows = V1_TEXT_HDR_ROWS + line_offset
-    int_data = _read_lines(skip_rows, V1_INT_HDR_ROWS, V2_INT_FMT, filename)
+    int_data = _read_lines(skip_rows, V1_INT_HDR_ROWS, V2_INT_FMT, all_lines)
     int_data = int_data[0:100].astype(np.int32)
 
     # read in lines of float data
     skip_rows += V1_INT_HDR_ROWS
-    flt_data = _read_lines(skip_rows, V1_REAL_HDR_ROWS, V2_REAL_FMT, filename)
+    flt_data = _read_lines(skip_rows, V1_REAL_HDR_ROWS, V2_REAL_FMT, all_lines)
     skip_rows += V1_REAL_HDR_ROWS
 
     # according to the powers that defined the Network.Station.Channel.Location
@@ -233,24 +246,23 @@ def _read_volume_one(filename, line_offset, location='', units='acc'):
 
     # sometimes (??) a line of text is inserted in between the float header and
     # the beginning of the data. Let's check for this...
-    with open(filename, 'rt') as f:
-        for _ in range(skip_rows):
-            next(f)
-        test_line = f.readline()
+    test_line = ''
+    if skip_rows < len(all_lines):
+        test_line = all_lines[skip_rows]
 
     has_text = re.search('[A-Z]+|[a-z]+', test_line) is not None
     if has_text:
         skip_rows += 1
         widths = [9] * 8
         max_rows = int(np.ceil(hdr['npts'] / 8))
-        data = _read_lines(skip_rows, max_rows, widths, filename)
+        data = _read_lines(skip_rows, max_rows, widths, all_lines)
         acc_data = data[:hdr['npts']]
         evenly_spaced = True
     else:
         # acceleration data is interleaved between time data
         max_rows = int(np.ceil(hdr['npts'] / 5))
         widths = [7] * 10
-        data = _read_lines(skip_rows, max_rows, widths, filename)
+        data = _read_lines(skip_rows, max_rows, widths, all_lines)
         acc_data = data[1::2][:hdr['npts']]
         times = data[0::2][:hdr['npts']]
         evenly_spaced = is_evenly_spaced(times)
@@ -275,33 +287,29 @@ def _read_volume_one(filename, line_offset, location='', units='acc'):
     return (traces, new_offset)
 
 
-def _read_volume_two(filename, line_offset, location='', units='acc'):
+def _read_volume_two(all_lines, line_offset, location='', units='acc'):
     """Read channel data from DMG text file.
 
     Args:
-        filename (str): Input DMG V2 filename.
+        all_lines (list): Lines (str) of the DMG V2 file.
         line_offset (int): Line offset to beginning of channel text block.
         units (str): units to get
     Returns:
         tuple: (list of obspy Trace, int line offset)
     """
-    try:
-        with open(filename, 'rt') as f:
-            for _ in range(line_offset):
-                next(f)
-            lines = [next(f) for x in range(V2_TEXT_HDR_ROWS)]
     # Accounts for blank lines at end of files
-    except StopIteration:
+    if line_offset + V2_TEXT_HDR_ROWS > len(all_lines):
         return (None, 1 + line_offset)
+    lines = all_lines[line_offset:line_offset + V2_TEXT_HDR_ROWS]
 
     # read in lines of integer data
     skip_rows = V2_TEXT_HDR_ROWS + line_offset
-    int_data = _read_lines(skip_rows, V2_INT_HDR_ROWS, V2_INT_FMT, filename)
+    int_data = _read_lines(skip_rows, V2_INT_HDR_ROWS, V2_INT_FMT, all_lines)
     int_data = int_data[0:100].astype(np.int32)
 
     # read in lines of float data
     skip_rows += V2_INT_HDR_ROWS
-    flt_data = _read_lines(skip_rows, V2_REAL_HDR_ROWS, V2_REAL_FMT, filename)
+    flt_data = _read_lines(skip_rows, V2_REAL_HDR_ROWS, V2_REAL_FMT, all_lines)
     flt_data = flt_data[:100]
     skip_rows += V2_REAL_HDR_ROWS
 
@@ -315,8 +323,8 @@ def _read_volume_two(filename, line_offset, location='', units='acc'):
     # read acceleration data
     if hdr['npts'] > 0:
         acc_rows, acc_fmt, unit = _get_data_format(
-            filename, skip_rows, hdr['npts'])
-        acc_data = _read_lines(skip_rows + 1, acc_rows, acc_fmt, filename)
+            all_lines, skip_rows, hdr['npts'])
+        acc_data = _read_lines(skip_rows + 1, acc_rows, acc_fmt, all_lines)
         acc_data = acc_data[:hdr['npts']]
         if unit in UNIT_CONVERSIONS:
             acc_data *= UNIT_CONVERSIONS[unit]
@@ -334,8 +342,8 @@ def _read_volume_two(filename, line_offset, location='', units='acc'):
     vel_hdr['npts'] = int_data[63]
     if vel_hdr['npts'] > 0:
         vel_rows, vel_fmt, unit = _get_data_format(
-            filename, skip_rows, vel_hdr['npts'])
-        vel_data = _read_lines(skip_rows + 1, vel_rows, vel_fmt, filename)
+            all_lines, skip_rows, vel_hdr['npts'])
+        vel_data = _read_lines(skip_rows + 1, vel_rows, vel_fmt, all_lines)
         vel_data = vel_data[:vel_hdr['npts']]
         if unit in UNIT_CONVERSIONS:
             vel_data *= UNIT_CONVERSIONS[unit]
@@ -353,8 +361,8 @@ def _read_volume_two(filename, line_offset, location='', units='acc'):
     disp_hdr['npts'] = int_data[65]
     if disp_hdr['npts'] > 0:
         disp_rows, disp_fmt, unit = _get_data_format(
-            filename, skip_rows, disp_hdr['npts'])
-        disp_data = _read_lines(skip_rows + 1, disp_rows, disp_fmt, filename)
+            all_lines, skip_rows, disp_hdr['npts'])
+        disp_data = _read_lines(skip_rows + 1, disp_rows, disp_fmt, all_lines)
         disp_data = disp_data[:disp_hdr['npts']]
         if unit in UNIT_CONVERSIONS:
             disp_data *= UNIT_CONVERSIONS[unit]
@@ -705,33 +713,34 @@ def _get_channel(angle, sampling_rate):
     return channel
 
 
-def _read_lines(skip_rows, max_rows, widths, filename):
+def _read_lines(skip_rows, max_rows, widths, lines):
     """Read lines of headers and.
 
     Args:
         skip_rows (int): Number of rows to skip.
-        filename (str): Path to possible DMG data file.
+        max_rows (int): Number of rows to read.
+        widths (list): Width of each field of a row.
+        lines (list): Lines (str) of the DMG data file.
     Returns:
         array-like: List of comments or array of data.
     """
-    data_arr = np.genfromtxt(filename, skip_header=skip_rows,
-                             max_rows=max_rows, dtype=np.float64,
-                             delimiter=widths).flatten()
+    max_rows = int(max_rows)
+    data_arr = decode_fixed_width(
+        lines[skip_rows:skip_rows + max_rows], widths).flatten()
     return data_arr
 
 
-def _get_data_format(filename, skip_rows, npts):
+def _get_data_format(lines, skip_rows, npts):
     """Read data header and return the format.
 
     Args:
+        lines (list): Lines (str) of the DMG data file.
         skip_rows (int): Number of rows to skip.
-        filename (str): Path to possible DMG data file.
         npts (int): Number of data points.
     Returns:
         tuple: (int number of rows, list list of widths).
     """
-    fmt_line = np.genfromtxt(filename, skip_header=skip_rows,
-                             max_rows=1, dtype=str)
+    fmt_line = lines[skip_rows].split()
     fmt = fmt_line[-1]
     # Check for a format in header or use default
     if fmt.find('f') >= 0 and fmt.find('(') >= 0 and fmt.find(')') >= 0:
@@ -0,0 +1,112 @@
+"""
+Decoders for the numeric text blocks found in strong motion data files.
+
+Most of the text formats store their headers and data as Fortran-style
+fixed-width fields. Rather than splitting each line separately, the lines of
+a block are padded to the same length and joined into one contiguous byte
+buffer, which is viewed as an array of fields and converted to float in a
+single step. If the compiled extension is available, the conversion is done
+in C; otherwise numpy is used.
+"""
+
+# third party imports
+import numpy as np
+
+try:
+    from gmprocess.io.cdecode import decode_fields as _decode_fields_c
+except ImportError:
+    _decode_fields_c = None
+
+# Fields wider than this are always decoded with numpy
+MAX_C_FIELD_WIDTH = 63
+
+
+def decode_fixed_width(lines, widths, missing=np.nan):
+    """Decode lines of fixed-width numeric fields.
+
+    This gives the same values as np.genfromtxt with delimiter=widths:
+    characters past the last field are ignored, and fields that are blank,
+    missing from a short line or not valid numbers are set to missing.
+
+    Args:
+        lines (list):
+            Lines (str) of the block, with or without line endings.
+        widths (list):
+            Width (int) of each field of a line, in characters.
+        missing (float):
+            Value of fields that cannot be decoded.
+
+    Returns:
+        ndarray: Array of float64 with shape (len(lines), len(widths)).
+    """
+    widths = [int(width) for width in widths]
+    nrows = len(lines)
+    ncols = len(widths)
+    line_width = sum(widths)
+    text = ''.join([line.rstrip('\r\n').ljust(line_width)[:line_width]
+                    for line in lines])
+    buffer = text.encode('latin-1', errors='replace')
+
+    if len(set(widths)) == 1:
+        values = _decode_fields(buffer, widths[0], missing)
+        return values.reshape((nrows, ncols))
+
+    # fields of different widths are decoded one column at a time
+    chars = np.frombuffer(buffer, dtype=np.uint8).reshape(
+        (nrows, line_width))
+    values = np.empty((nrows, ncols))
+    offset = 0
+    for idx, width in enumerate(widths):
+        column = np.ascontiguousarray(chars[:, offset:offset + width])
+        values[:, idx] = _decode_fields(column.tobytes(), width, missing)
+        offset += width
+    return values
+
+
+def decode_whitespace(lines):
+    """Decode lines of whitespace separated numbers.
+
+    Args:
+        lines (list):
+            Lines (str) of the block.
+
+    Returns:
+        ndarray: Flattened array of float64 values, in reading order.
+    """
+    return np.array(' '.join(lines).split(), dtype=np.float64)
+
+
+def _decode_fields(buffer, width, missing):
+    """Decode a buffer of consecutive fields that have the same width.
+
+    Args:
+        buffer (bytes):
+            Fields, with no separators between them.
+        width (int):
+            Width of each field in characters.
+        missing (float):
+            Value of fields that cannot be decoded.
+
+    Returns:
+        ndarray: Array of float64, one value per field.
+    """
+    if _decode_fields_c is not None and width <= MAX_C_FIELD_WIDTH:
+        return _decode_fields_c(buffer, width, missing)
+    chars = np.frombuffer(buffer, dtype=np.uint8).reshape((-1, width))
+    fields = chars.view('S%i' % width).ravel().copy()
+    blank = (chars == ord(' ')).all(axis=1)
+    fields[blank] = b'0'
+    try:
+        values = fields.astype(np.float64)
+    except ValueError:
+        values = np.array([_to_float(field, missing) for field in fields])
+    values[blank] = missing
+    return values
+
+
+def _to_float(field, missing):
+    """Convert one field to float, or missing if it is not a number."""
+    try:
+        return float(field)
+    except ValueError:
+        return missing
@@ -11,6 +11,8 @@ import numpy as np
 
 # local imports
 from gmprocess.io.seedname import get_channel_name
+from gmprocess.io.fixed_width import decode_fixed_width, decode_whitespace
+from gmprocess.io.utils import get_first_line, open_data_file
 from gmprocess.stationtrace import StationTrace, PROCESS_LEVELS
 from gmprocess.stationstream import StationStream
 
@@ -32,6 +34,18 @@ ANGLES = {'N': 0,
 # ftp://ftp.geonet.org.nz/strong/processed/Docs/GNS%20ACCELEROGRAM%20DATA%20FILE%20FORMAT%202012-03-15.docx
 
 
+def sniff_geonet(prefix):
+    """Check the first line of a file for the GNS marker.
+
+    Args:
+        prefix (bytes): First bytes of the candidate GNS file.
+
+    Returns:
+        bool: False if the file cannot be GNS V1/V2, True otherwise.
+    """
+    return get_first_line(prefix).find('GNS Science') >= 0
+
+
 def is_geonet(filename):
     """Check to see if file is a New Zealand GNS V1 or V2 strong motion file.
 
@@ -42,7 +56,7 @@ def is_geonet(filename):
     """
     logging.debug("Checking if format is geonet.")
     try:
-        line = open(filename, 'rt').readline()
+        line = open_data_file(filename).readline()
         if line.find('GNS Science') >= 0:
             c1 = line.find('Corrected accelerogram') >= 0
             c2 = line.find('Uncorrected accelerogram') >= 0
@@ -61,7 +75,7 @@ def read_geonet(filename, **kwargs):
     This will be set to either "V1" or "V2".
 
     Args:
-        filename (str): Path to possible GNS V1/V2 data file.
+        filename (str or file-like): Path to possible GNS V1/V2 data file.
         kwargs (ref): Other arguments will be ignored.
 
     Returns:
@@ -71,9 +85,11 @@ def read_geonet(filename, **kwargs):
     logging.debug("Starting read_geonet.")
     if not is_geonet(filename):
         raise Exception('%s is not a valid GEONET strong motion data file.' % filename)
-    trace1, offset1, _ = _read_channel(filename, 0)
-    trace2, offset2, _ = _read_channel(filename, offset1)
-    trace3, _, _ = _read_channel(filename, offset2)
+    with open_data_file(filename) as f:
+        lines = f.readlines()
+    trace1, offset1, _ = _read_channel(lines, 0)
+    trace2, offset2, _ = _read_channel(lines, offset1)
+    trace3, _, _ = _read_channel(lines, offset2)
 
     # occasionally, geonet horizontal components are
     # identical.  To handle this, we'll set the second
@@ -106,20 +122,17 @@ def read_geonet(filename, **kwargs):
     return [stream]
 
 
-def _read_channel(filename, line_offset):
+def _read_channel(all_lines, line_offset):
     """Read channel data from GNS V1 text file.
 
     Args:
-        filename (str): Input GNS V1 filename.
+        all_lines (list): Lines (str) of the GNS V1 file.
         line_offset (int): Line offset to beginning of channel text block.
     Returns:
         tuple: (obspy Trace, int line offset)
     """
     # read station and location strings from text header
-    with open(filename, 'rt') as f:
-        for _ in range(line_offset):
-            next(f)
-        lines = [next(f) for x in range(TEXT_HDR_ROWS)]
+    lines = all_lines[line_offset:line_offset + TEXT_HDR_ROWS]
 
     # this code supports V1 and V2 format files.  Which one is this?
     data_format = 'V2'
@@ -142,8 +155,9 @@ def _read_channel(filename, line_offset):
 
     # read floating point header array
     skip_header = line_offset + TEXT_HDR_ROWS
-    hdr_data = np.genfromtxt(filename, skip_header=skip_header,
-                             max_rows=FP_HDR_ROWS)
+    hdr_data = decode_whitespace(
+        all_lines[skip_header:skip_header + FP_HDR_ROWS])
+    hdr_data = hdr_data.reshape((FP_HDR_ROWS, -1))
 
     # parse header dictionary from float header array
     hdr = _read_header(hdr_data, station, name,
@@ -158,9 +172,8 @@ def _read_channel(filename, line_offset):
     skip_header2 = line_offset + TEXT_HDR_ROWS + FP_HDR_ROWS
     widths = [8] * COLS_PER_ROW
     nrows = int(np.ceil(hdr['npts'] / COLS_PER_ROW))
-    data = np.genfromtxt(filename, skip_header=skip_header2,
-                         max_rows=nrows, filling_values=np.nan,
-                         delimiter=widths)
+    data = decode_fixed_width(
+        all_lines[skip_header2:skip_header2 + nrows], widths)
     data = data.flatten()
     data = data[0:hdr['npts']]
 
@@ -175,9 +188,8 @@ def _read_channel(filename, line_offset):
             nvel_rows2 = 0
         skip_header_vel = line_offset + TEXT_HDR_ROWS + FP_HDR_ROWS + nrows
         widths = [8] * COLS_PER_ROW
-        velocity = np.genfromtxt(filename, skip_header=skip_header_vel,
-                                 max_rows=nvel_rows, filling_values=np.nan,
-                                 delimiter=widths)
+        velocity = decode_fixed_width(
+            all_lines[skip_header_vel:skip_header_vel + nvel_rows], widths)
         velocity = velocity.flatten()
         velocity *= MMPS_TO_CMPS
     else:
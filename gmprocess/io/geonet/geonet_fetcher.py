@@ -1,12 +1,10 @@
 # stdlib imports
 from datetime import timedelta, datetime
-import tempfile
 import os.path
 import io
 import urllib
 import ftplib
 import logging
-import shutil
 
 # third party imports
 import pytz
@@ -19,6 +17,7 @@ import pandas as pd
 # local imports
 from gmprocess.io.fetcher import DataFetcher, _get_first_value
 from gmprocess.io.geonet.core import read_geonet
+from gmprocess.io.utils import get_source_name
 from gmprocess.streamcollection import StreamCollection
 from gmprocess.config import get_config
 
@@ -180,11 +179,8 @@ class GeoNetFetcher(DataFetcher):
             StreamCollection: StreamCollection object.
         """
         rawdir = self.rawdir
-        if self.rawdir is None:
-            rawdir = tempfile.mkdtemp()
-        else:
-            if not os.path.isdir(rawdir):
-                os.makedirs(rawdir)
+        if rawdir is not None and not os.path.isdir(rawdir):
+            os.makedirs(rawdir)
         etime = event_dict['time']
         neturl = GEOBASE.replace('[YEAR]', str(etime.year))
         monthstr = etime.strftime('%m_%b')
@@ -200,8 +196,10 @@ class GeoNetFetcher(DataFetcher):
                 raise Exception(msg)
 
         # cd to the desired output folder
-        os.chdir(rawdir)
+        if rawdir is not None:
+            os.chdir(rawdir)
         datafiles = []
+        datanames = []
 
         # we cannot depend on the time given to us by the GeoNet catalog to match
         # the directory name on the FTP site, so we must do a secondary matching.
@@ -232,32 +230,36 @@ class GeoNetFetcher(DataFetcher):
                     if not ftpfile.endswith('V1A'):
 
                         continue
-                    localfile = os.path.join(os.getcwd(), ftpfile)
-                    if localfile in datafiles:
+                    if ftpfile in datanames:
                         continue
-                    datafiles.append(localfile)
-                    f = open(localfile, 'wb')
+                    datanames.append(ftpfile)
                     logging.info('Retrieving remote file %s...\n' % ftpfile)
-                    ftp.retrbinary('RETR %s' % ftpfile, f.write)
-                    f.close()
+                    if rawdir is None:
+                        # keep the data in memory
+                        localfile = io.BytesIO()
+                        localfile.name = ftpfile
+                        ftp.retrbinary('RETR %s' % ftpfile, localfile.write)
+                    else:
+                        localfile = os.path.join(os.getcwd(), ftpfile)
+                        f = open(localfile, 'wb')
+                        ftp.retrbinary('RETR %s' % ftpfile, f.write)
+                        f.close()
+                    datafiles.append(localfile)
                 ftp.cwd('..')
                 ftp.cwd('..')
 
         ftp.quit()
         streams = []
         for dfile in datafiles:
-            logging.info('Reading GeoNet file %s...' % dfile)
+            logging.info('Reading GeoNet file %s...' % get_source_name(dfile))
             try:
                 tstreams = read_geonet(dfile)
                 streams += tstreams
             except Exception as e:
                 fmt = 'Failed to read GeoNet file "%s" due to error "%s". Continuing.'
-                tpl = (dfile, str(e))
+                tpl = (get_source_name(dfile), str(e))
                 logging.warn(fmt % tpl)
 
-        if self.rawdir is None:
-            shutil.rmtree(rawdir)
-
         stream_collection = StreamCollection(streams=streams,
                                              drop_non_free=self.drop_non_free)
         return stream_collection
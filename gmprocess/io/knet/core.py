@@ -12,6 +12,8 @@ import numpy as np
 
 # local imports
 from gmprocess.io.seedname import get_channel_name
+from gmprocess.io.fixed_width import decode_whitespace
+from gmprocess.io.utils import get_first_line, is_path, open_data_file
 from gmprocess.stationtrace import StationTrace, PROCESS_LEVELS
 from gmprocess.stationstream import StationStream
 
@@ -26,6 +28,18 @@ SRC = ('Japan National Research Institute '
        'for Earth Science and Disaster Resilience')
 
 
+def sniff_knet(prefix):
+    """Check the first line of a file for the KNET header.
+
+    Args:
+        prefix (bytes): First bytes of the candidate KNET file.
+
+    Returns:
+        bool: False if the file cannot be KNET, True otherwise.
+    """
+    return get_first_line(prefix).startswith(HDR1)
+
+
 def is_knet(filename):
     """Check to see if file is a Japanese KNET strong motion file.
 
@@ -35,14 +49,12 @@ def is_knet(filename):
         bool: True if GNS V1, False otherwise.
     """
     logging.debug("Checking if format is knet.")
-    if not os.path.isfile(filename):
+    if is_path(filename) and not os.path.isfile(filename):
         return False
+    # only the header is checked; reading the whole file just to check
+    # that it decodes is too slow when sniffing many files
     try:
-        open(filename, 'rt').read(os.stat(filename).st_size)
-    except UnicodeDecodeError:
-        return False
-    try:
-        with open(filename, 'rt') as f:
+        with open_data_file(filename) as f:
             lines = [next(f) for x in range(TEXT_HDR_ROWS)]
             if lines[0].startswith(HDR1) and lines[5].startswith(HDR2):
                 return True
@@ -55,7 +67,7 @@ def read_knet(filename):
     """Read Japanese KNET strong motion file.
 
     Args:
-        filename (str): Path to possible KNET data file.
+        filename (str or file-like): Path to possible KNET data file.
         kwargs (ref): Other arguments will be ignored.
     Returns:
         Stream: Obspy Stream containing three channels of acceleration data
@@ -66,8 +78,9 @@ def read_knet(filename):
         raise Exception('%s is not a valid KNET file' % filename)
 
     # Parse the header portion of the file
-    with open(filename, 'rt') as f:
-        lines = [next(f) for x in range(TEXT_HDR_ROWS)]
+    with open_data_file(filename) as f:
+        all_lines = f.readlines()
+    lines = all_lines[0:TEXT_HDR_ROWS]
 
     hdr = {}
     coordinates = {}
@@ -136,24 +149,10 @@ def read_knet(filename):
     sttime = sttime - timedelta(seconds=9 * 3600.)
     hdr['starttime'] = sttime
 
-    # read in the data - there is a max of 8 columns per line
-    # the code below handles the case when last line has
-    # less than 8 columns
-    if hdr['npts'] % COLS_PER_LINE != 0:
-        nrows = int(np.floor(hdr['npts'] / COLS_PER_LINE))
-        nrows2 = 1
-    else:
-        nrows = int(np.ceil(hdr['npts'] / COLS_PER_LINE))
-        nrows2 = 0
-    data = np.genfromtxt(filename, skip_header=TEXT_HDR_ROWS,
-                         max_rows=nrows, filling_values=np.nan)
-    data = data.flatten()
-    if nrows2:
-        skip_header = TEXT_HDR_ROWS + nrows
-        data2 = np.genfromtxt(filename, skip_header=skip_header,
-                              max_rows=nrows2, filling_values=np.nan)
-        data = np.hstack((data, data2))
-        nrows += nrows2
+    # read in the data - there is a max of 8 columns per line, and the
+    # last line may have fewer
+    nrows = int(np.ceil(hdr['npts'] / COLS_PER_LINE))
+    data = decode_whitespace(all_lines[TEXT_HDR_ROWS:TEXT_HDR_ROWS + nrows])
 
     # apply the correction factor we're given in the header
     data *= calib
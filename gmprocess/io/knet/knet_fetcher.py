@@ -2,11 +2,10 @@
 from datetime import datetime, timedelta
 import re
 from collections import OrderedDict
-import tempfile
+import io
 import os.path
 import tarfile
 import glob
-import shutil
 import logging
 import urllib
 
@@ -21,6 +20,7 @@ from obspy.core.utcdatetime import UTCDateTime
 # local imports
 from gmprocess.io.fetcher import DataFetcher, _get_first_value
 from gmprocess.io.knet.core import read_knet
+from gmprocess.io.utils import iter_archive
 from gmprocess.streamcollection import StreamCollection
 from gmprocess.config import get_config
 
@@ -255,35 +255,46 @@ class KNETFetcher(DataFetcher):
         Returns:
             StreamCollection: StreamCollection object.
         """
-        rawdir = self.rawdir
-        if self.rawdir is None:
-            rawdir = tempfile.mkdtemp()
-        else:
-            if not os.path.isdir(rawdir):
-                os.makedirs(rawdir)
-
         cgi_value = event_dict['cgi_value']
         firstid = cgi_value.split(',')[0]
         dtime = event_dict['time']
         fname = dtime.strftime('%Y%m%d%H%M%S') + '.tar'
 
-        localfile = os.path.join(rawdir, fname)
-
         url = RETRIEVE_URL
         payload = {'formattype': ['A'],
                    'eqidlist': cgi_value,
                    'datanames': '%s;alldata' % firstid,
                    'datakind': ['all']}
-        logging.info('Downloading Japanese data into %s...' % localfile)
+        logging.info('Downloading Japanese data %s...' % fname)
         req = requests.get(url, params=payload,
                            auth=(self.user, self.password))
 
         if req.status_code != URL_ERROR_CODE:
             raise urllib.error.HTTPError(req.text)
-        else:
-            with open(localfile, 'wb') as f:
-                for chunk in req:
-                    f.write(chunk)
+
+        if self.rawdir is None:
+            # read the kiknet/knet gzipped tarballs in the downloaded tarball
+            # from memory
+            streams = []
+            tarball = io.BytesIO(req.content)
+            for file_path, source in iter_archive(tarball, fname):
+                if 'img' in file_path or file_path.endswith('.gz'):
+                    continue
+                if '.' not in os.path.basename(file_path):
+                    continue
+                logging.info('Reading KNET/KikNet file %s...' % file_path)
+                streams += read_knet(source)
+            stream_collection = StreamCollection(
+                streams=streams, drop_non_free=self.drop_non_free)
+            return stream_collection
+
+        rawdir = self.rawdir
+        if not os.path.isdir(rawdir):
+            os.makedirs(rawdir)
+        localfile = os.path.join(rawdir, fname)
+        with open(localfile, 'wb') as f:
+            for chunk in req:
+                f.write(chunk)
         logging.info('Finished downloading into %s...' % localfile)
 
         # open the tarball, extract the kiknet/knet gzipped tarballs
@@ -323,9 +334,6 @@ class KNETFetcher(DataFetcher):
                 logging.info('Reading KNET/KikNet file %s...' % dfile)
                 streams += read_knet(dfile)
 
-        if self.rawdir is None:
-            shutil.rmtree(rawdir)
-
         stream_collection = StreamCollection(streams=streams,
                                              drop_non_free=self.drop_non_free)
         return stream_collection
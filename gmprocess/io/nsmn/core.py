@@ -14,6 +14,8 @@ from obspy.core.utcdatetime import UTCDateTime
 from gmprocess.stationstream import StationStream
 from gmprocess.stationtrace import StationTrace, PROCESS_LEVELS
 from gmprocess.io.seedname import get_channel_name
+from gmprocess.io.fixed_width import decode_whitespace
+from gmprocess.io.utils import get_first_line, open_data_file
 
 
 TIMEFMT = '%d/%m/%Y %H:%M:%S.%f'
@@ -42,8 +44,20 @@ ENCODING = 'ISO-8859-1'
 # ENCODING = 'utf-16-be'
 
 
+def sniff_nsmn(prefix):
+    """Check the first line of a file for the NSMN marker.
+
+    Args:
+        prefix (bytes): First bytes of the candidate NSMN file.
+
+    Returns:
+        bool: False if the file cannot be NSMN, True otherwise.
+    """
+    return MARKER in get_first_line(prefix)
+
+
 def is_nsmn(filename):
-    with open(filename, 'rt', encoding=ENCODING) as f:
+    with open_data_file(filename, encoding=ENCODING) as f:
         line = f.readline()
         if MARKER in line:
             return True
@@ -55,12 +69,14 @@ def read_nsmn(filename):
     """Read the Turkish NSMN strong motion data format.
 
     Args:
-        filename (str): path to NSMN data file.
+        filename (str or file-like): path to NSMN data file.
 
     Returns:
         list: Sequence of one StationStream object containing 3 StationTrace objects.
     """
-    header = _read_header(filename)
+    with open_data_file(filename, encoding=ENCODING) as f:
+        lines = f.readlines()
+    header = _read_header(lines[0:TEXT_HDR_ROWS])
     header1 = copy.deepcopy(header)
     header2 = copy.deepcopy(header)
     header3 = copy.deepcopy(header)
@@ -80,11 +96,8 @@ def read_nsmn(filename):
                                           True,
                                           False)
     # three columns of NS, EW, UD
-    # data = np.genfromtxt(filename, skip_header=TEXT_HDR_ROWS,
-    #                      delimiter=[COLWIDTH] * NCOLS, encoding=ENCODING)
-    data = np.loadtxt(filename,
-                      skiprows=TEXT_HDR_ROWS,
-                      encoding=ENCODING)
+    data_lines = [line for line in lines[TEXT_HDR_ROWS:] if line.strip()]
+    data = decode_whitespace(data_lines).reshape((len(data_lines), -1))
     data1 = data[:, 0]
     data2 = data[:, 1]
     data3 = data[:, 2]
@@ -95,58 +108,56 @@ def read_nsmn(filename):
     return [stream]
 
 
-def _read_header(filename):
+def _read_header(lines):
     header = {}
     standard = {}
     coords = {}
     format_specific = {}
-    with open(filename, 'rt', encoding=ENCODING) as f:
-        lines = [next(f) for x in range(TEXT_HDR_ROWS)]
-        # fill out the standard dictionary
-        standard['source'] = SOURCE
-        standard['source_format'] = SOURCE_FORMAT
-        standard['instrument'] = lines[9].split(':')[1].strip()
-        standard['sensor_serial_number'] = lines[10].split(':')[1].strip()
-        standard['process_level'] = PROCESS_LEVELS['V1']
-        standard['process_time'] = ''
-        standard['station_name'] = lines[1].split(':')[1].strip()
-        standard['structure_type'] = ''
-        standard['corner_frequency'] = np.nan
-        standard['units'] = 'acc'
-        standard['instrument_period'] = np.nan
-        standard['instrument_damping'] = np.nan
-        standard['horizontal_orientation'] = np.nan
-        standard['comments'] = ' '.join(lines[15:17]).replace('\n', '')
-
-        # fill out the stats stuff
-        stimestr = re.search(TIME_RE, lines[11]).group()
-        # 20/07/2017 22:30:58.000000 (GMT)
-        stime = datetime.strptime(stimestr, TIMEFMT)
-        header['starttime'] = stime
-        header['npts'] = int(lines[12].split(':')[1].strip())
-        header['delta'] = float(lines[13].split(':')[1].strip())
-        header['sampling_rate'] = 1 / header['delta']
-        header['duration'] = header['npts'] * header['delta']
-        header['channel'] = ''
-        header['station'] = lines[6].split(':')[1].strip()
-        header['location'] = '--'
-        header['network'] = NETWORK
-
-        coordstr = lines[7].split(':')[1].replace('-', '')
-        lat_str, lon_str = re.findall(FLOATRE, coordstr)
-        altparts = lines[8].split(':')
-        altitude = 0.0
-        if len(altparts) > 1 and len(altparts[1].strip()):
-            altitude = float(altparts[1].strip())
-        coords = {'latitude': float(lat_str),
-                  'longitude': float(lon_str),
-                  'elevation': altitude}
-
-        header['coordinates'] = coords
-        header['standard'] = standard
-        header['format_specific'] = format_specific
-
-        return header
+    # fill out the standard dictionary
+    standard['source'] = SOURCE
+    standard['source_format'] = SOURCE_FORMAT
+    standard['instrument'] = lines[9].split(':')[1].strip()
+    standard['sensor_serial_number'] = lines[10].split(':')[1].strip()
+    standard['process_level'] = PROCESS_LEVELS['V1']
+    standard['process_time'] = ''
+    standard['station_name'] = lines[1].split(':')[1].strip()
+    standard['structure_type'] = ''
+    standard['corner_frequency'] = np.nan
+    standard['units'] = 'acc'
+    standard['instrument_period'] = np.nan
+    standard['instrument_damping'] = np.nan
+    standard['horizontal_orientation'] = np.nan
+    standard['comments'] = ' '.join(lines[15:17]).replace('\n', '')
+
+    # fill out the stats stuff
+    stimestr = re.search(TIME_RE, lines[11]).group()
+    # 20/07/2017 22:30:58.000000 (GMT)
+    stime = datetime.strptime(stimestr, TIMEFMT)
+    header['starttime'] = stime
+    header['npts'] = int(lines[12].split(':')[1].strip())
+    header['delta'] = float(lines[13].split(':')[1].strip())
+    header['sampling_rate'] = 1 / header['delta']
+    header['duration'] = header['npts'] * header['delta']
+    header['channel'] = ''
+    header['station'] = lines[6].split(':')[1].strip()
+    header['location'] = '--'
+    header['network'] = NETWORK
+
+    coordstr = lines[7].split(':')[1].replace('-', '')
+    lat_str, lon_str = re.findall(FLOATRE, coordstr)
+    altparts = lines[8].split(':')
+    altitude = 0.0
+    if len(altparts) > 1 and len(altparts[1].strip()):
+        altitude = float(altparts[1].strip())
+    coords = {'latitude': float(lat_str),
+              'longitude': float(lon_str),
+              'elevation': altitude}
+
+    header['coordinates'] = coords
+    header['standard'] = standard
+    header['format_specific'] = format_specific
+
+    return header
 
 
 def _read_header_lines(filename, offset):
@@ -162,7 +173,7 @@ def _read_header_lines(filename, offset):
         tuple: (header dictionary containing Stats dictionary with extra sub-dicts, 
                 updated offset rows)
     """
-    with open(filename, 'rt') as f:
+    with open_data_file(filename) as f:
         for _ in range(offset):
             next(f)
         lines = [next(f) for x in range(TEXT_HDR_ROWS)]
@@ -1,8 +1,7 @@
 # stdlib imports
 from datetime import datetime, timedelta
 from urllib.parse import urlparse, urljoin
-import shutil
-import tempfile
+import io
 import os.path
 import logging
 
@@ -18,6 +17,7 @@ import pandas as pd
 # local imports
 from gmprocess.io.fetcher import DataFetcher, _get_first_value
 from gmprocess.io.nsmn.core import read_nsmn
+from gmprocess.io.utils import get_source_name
 from gmprocess.streamcollection import StreamCollection
 from gmprocess.config import get_config
 
@@ -186,11 +186,8 @@ class TurkeyFetcher(DataFetcher):
             StreamCollection: StreamCollection object.
         """
         rawdir = self.rawdir
-        if self.rawdir is None:
-            rawdir = tempfile.mkdtemp()
-        else:
-            if not os.path.isdir(rawdir):
-                os.makedirs(rawdir)
+        if rawdir is not None and not os.path.isdir(rawdir):
+            os.makedirs(rawdir)
 
         urlparts = urlparse(SEARCH_URL)
         req = requests.get(event_dict['url'])
@@ -212,22 +209,23 @@ class TurkeyFetcher(DataFetcher):
             anchor = center.find_all('a')[0]
             href2 = anchor.attrs['href']
             data_url = urljoin('http://' + urlparts.netloc, href2)
-            req3 = requests.get(data_url)
-            data = req3.text
-            localfile = os.path.join(rawdir, '%s.txt' % station_id)
             logging.info('Downloading Turkish data file %s...' % station_id)
-            with open(localfile, 'wt') as f:
-                f.write(data)
-            datafiles.append(localfile)
+            req3 = requests.get(data_url)
+            if rawdir is None:
+                # keep the data in memory
+                datafile = io.BytesIO(req3.content)
+                datafile.name = '%s.txt' % station_id
+            else:
+                datafile = os.path.join(rawdir, '%s.txt' % station_id)
+                with open(datafile, 'wt') as f:
+                    f.write(req3.text)
+            datafiles.append(datafile)
 
         streams = []
         for dfile in datafiles:
-            logging.info('Reading datafile %s...' % dfile)
+            logging.info('Reading datafile %s...' % get_source_name(dfile))
             streams += read_nsmn(dfile)
 
-        if self.rawdir is None:
-            shutil.rmtree(rawdir)
-
         stream_collection = StreamCollection(streams=streams,
                                              drop_non_free=self.drop_non_free)
         return stream_collection
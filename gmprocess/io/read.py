@@ -1,7 +1,10 @@
 # stdlib imports
+from collections import OrderedDict
+import functools
 import importlib
 import os.path
 import logging
+import re
 import pkg_resources
 
 # third party imports
@@ -9,65 +12,168 @@ import numpy as np
 
 # local imports
 from gmprocess.exception import GMProcessException
+from gmprocess.io.cache import get_read_cache
+from gmprocess.io.utils import get_source_name, is_path, open_data_file
 
 
 EXCLUDED = ['__pycache__']
 
+# Number of bytes read from the start of a file to sniff its format
+SNIFF_BYTES = 4096
+
+# Extensions that identify a format; files with these extensions are checked
+# against that format first and the other formats are only tried if it fails
+EXTENSION_FORMATS = {
+    '.asdf': 'asdf',
+    '.h5': 'asdf',
+    '.hdf': 'asdf',
+    '.hdf5': 'asdf',
+    '.smc': 'smc',
+    '.v1a': 'geonet',
+    '.v2a': 'geonet',
+    '.ew': 'knet',
+    '.ew1': 'knet',
+    '.ew2': 'knet',
+    '.ns': 'knet',
+    '.ns1': 'knet',
+    '.ns2': 'knet',
+    '.ud': 'knet',
+    '.ud1': 'knet',
+    '.ud2': 'knet',
+}
+
 
 def read_data(filename, read_format=None, **kwargs):
     """
     Read strong motion data from a file.
 
+    If the read cache is enabled in the config file, the streams read from a
+    path are stored in the cache and read back from it on later calls.
+
     Args:
-        filename (str): Path to file
+        filename (str, bytes or file-like): Path to file, or contents of the
+            file (e.g., an io.BytesIO from iter_archive). The name attribute
+            of a file-like object, if any, is used to help find the format.
         read_format (str): Format of file
 
     Returns:
         list: Sequence of obspy.core.stream.Streams read from file
     """
     # Check if file exists
-    if not os.path.exists(filename):
+    if is_path(filename) and not os.path.exists(filename):
         raise GMProcessException('Not a file %r' % filename)
+    cache = get_read_cache() if is_path(filename) else None
+    if cache is not None:
+        streams = cache.get(filename, read_format, **kwargs)
+        if streams is not None:
+            return streams
+        cache_format = read_format
     # Get and validate format
     if read_format is None:
         read_format = _get_format(filename)
     else:
         read_format = _validate_format(filename, read_format.lower())
     # Load reader and read file
-    reader = 'gmprocess.io.' + read_format + '.core'
-    reader_module = importlib.import_module(reader)
+    reader_module = get_readers()[read_format]
     read_name = 'read_' + read_format
     read_method = getattr(reader_module, read_name)
     streams = read_method(filename, **kwargs)
+    if cache is not None:
+        cache.put(filename, streams, cache_format, **kwargs)
     return streams
 
 
+@functools.lru_cache(maxsize=None)
+def get_readers():
+    """
+    Get the reader modules of all of the supported formats.
+
+    The io directory is listed and the modules are imported the first time
+    this is called; later calls return the same registry.
+
+    Returns:
+        OrderedDict: Reader module (gmprocess.io.<format>.core) for each
+        format name, in alphabetical order.
+    """
+    readers = OrderedDict()
+    io_directory = pkg_resources.resource_filename('gmprocess', 'io')
+    for module in sorted(os.listdir(io_directory)):
+        if module.find('.') < 0 and module not in EXCLUDED:
+            reader = 'gmprocess.io.' + module + '.core'
+            readers[module] = importlib.import_module(reader)
+    return readers
+
+
+def _read_prefix(filename):
+    """
+    Read the first bytes of a file for sniffing its format.
+
+    Args:
+        filename (str or file-like): Path to file
+
+    Returns:
+        bytes: Up to SNIFF_BYTES bytes from the start of the file, or None if
+        the file cannot be read or the prefix does not hold a complete first
+        line, in which case the format cannot be sniffed.
+    """
+    try:
+        with open_data_file(filename, 'rb') as f:
+            prefix = f.read(SNIFF_BYTES)
+    except OSError:
+        return None
+    if len(prefix) == SNIFF_BYTES and not re.search(b'\r|\n', prefix):
+        return None
+    return prefix
+
+
+def _is_format(filename, prefix, read_format):
+    """
+    Check if a file is in a format.
+
+    The format's sniff_<format> function, if it has one, is tried on the
+    first bytes of the file before its (slower) is_<format> function.
+
+    Args:
+        filename (str or file-like): Path to file
+        prefix (bytes): First bytes of the file, or None to skip sniffing.
+        read_format (str): Format of file
+
+    Returns:
+        bool: True if the file is in the format, False otherwise.
+    """
+    reader_module = get_readers()[read_format]
+    sniff_method = getattr(reader_module, 'sniff_' + read_format, None)
+    if prefix is not None and sniff_method is not None:
+        if not sniff_method(prefix):
+            return False
+    is_method = getattr(reader_module, 'is_' + read_format)
+    return is_method(filename)
+
+
 def _get_format(filename):
     """
     Get the format of the file.
 
     Args:
-        filename (str): Path to file
+        filename (str or file-like): Path to file
 
     Returns:
         string: Format of file.
     """
-    # Get the valid formats
-    valid_formats = []
-    io_directory = pkg_resources.resource_filename('gmprocess', 'io')
-    # Create valid list
-    for module in os.listdir(io_directory):
-        if module.find('.') < 0 and module not in EXCLUDED:
-            valid_formats += [module]
+    valid_formats = list(get_readers().keys())
+    prefix = _read_prefix(filename)
+    # Check the format suggested by the file extension first
+    extension = os.path.splitext(get_source_name(filename))[1].lower()
+    ext_format = EXTENSION_FORMATS.get(extension)
+    if ext_format in valid_formats:
+        if _is_format(filename, prefix, ext_format):
+            return ext_format
     # Test each format
     formats = []
     for valid_format in valid_formats:
-        # Create the module and function name from the request
-        reader = 'gmprocess.io.' + valid_format + '.core'
-        reader_module = importlib.import_module(reader)
-        is_name = 'is_' + valid_format
-        is_method = getattr(reader_module, is_name)
-        if is_method(filename):
+        if valid_format == ext_format:
+            continue
+        if _is_format(filename, prefix, valid_format):
             formats += [valid_format]
     # Return the format
     formats = np.asarray(formats)
@@ -88,32 +194,19 @@ def _validate_format(filename, read_format):
     Check if the specified format is valid. If not, get format.
 
     Args:
-        filename (str): Path to file
+        filename (str or file-like): Path to file
         read_format (str): Format of file
 
     Returns:
         string: Format of file.
     """
-    # Get the valid formats
-    valid_formats = []
-    home = os.path.dirname(os.path.abspath(__file__))
-    io_directory = os.path.abspath(os.path.join(home, '..', 'io'))
-    # Create valid list
-    for module in os.listdir(io_directory):
-        if module.find('.') < 0 and module not in EXCLUDED:
-            valid_formats += [module]
     # Check for a valid format
-    if read_format in valid_formats:
-        reader = 'gmprocess.io.' + read_format + '.core'
-        reader_module = importlib.import_module(reader)
-        is_name = 'is_' + read_format
-        is_method = getattr(reader_module, is_name)
-    else:
+    if read_format not in get_readers():
         logging.warning('Not a supported format %r. '
                         'Attempting to find a supported format.' % read_format)
         return _get_format(filename)
     # Check that the format passes tests
-    if is_method(filename):
+    if _is_format(filename, _read_prefix(filename), read_format):
         return read_format
     else:
         logging.warning('File did not match specified format. '
@@ -3,18 +3,20 @@ Module for methods for reading in directories of data, particularly messy data
 from CESMD.
 """
 
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 import os
-import glob
-import tempfile
-import shutil
 
+from gmprocess.config import get_config, get_num_workers
 from gmprocess.io.read import read_data
-from gmprocess.io.utils import flatten_directory
+from gmprocess.io.utils import is_archive, iter_archive
 
 EXT_IGNORE = [".gif", ".csv", ".dis", ".abc", ".zip", ".rs2", ".fs1"]
 
+CONFIG = get_config()
 
-def directory_to_streams(directory):
+
+def directory_to_streams(directory, max_workers=None):
     """Read in a directory of data to a list of streams.
 
     Note:
@@ -26,6 +28,10 @@ def directory_to_streams(directory):
     Args:
         directory (str):
             Directory of ground motion files (streams).
+        max_workers (int):
+            Number of worker processes used to read the files. If None, the
+            value of 'reading_workers' in the 'parallel' config section is
+            used. If 0, one worker per CPU is used.
 
     Returns:
         tuple: (List of obspy streams,
@@ -33,33 +39,122 @@ def directory_to_streams(directory):
                 List of errors associated with trying to read unprocessed
                 files).
     """
+    streams = []
+    unprocessed_files = []
+    unprocessed_file_errors = []
+    for file_path, file_streams, error in iter_directory_streams(
+            directory, max_workers=max_workers):
+        if error is None:
+            streams += file_streams
+        else:
+            unprocessed_files += [file_path]
+            unprocessed_file_errors += [error]
+    return streams, unprocessed_files, unprocessed_file_errors
+
+
+def iter_directory_streams(directory, max_workers=None):
+    """Read the files in a directory, yielding the streams of each file.
+
+    The directory is walked in place, including subdirectories, and the
+    members of zip and tar files (and of archives within them) are read from
+    memory without being extracted. Files are read by a pool of worker
+    processes while the directory is being walked, and results are yielded
+    in the order the files are found.
+
+    Args:
+        directory (str):
+            Directory of ground motion files (streams).
+        max_workers (int):
+            Number of worker processes used to read the files. If None, the
+            value of 'reading_workers' in the 'parallel' config section is
+            used. If 0, one worker per CPU is used.
+
+    Yields:
+        tuple: (Path of the file, or of the archive member below the path of
+                its archive,
+                List of streams read from the file,
+                Exception raised while reading the file or None).
+    """
+    max_workers = get_num_workers(CONFIG, 'reading_workers', max_workers)
+
+    files = _walk_files(directory)
+    if max_workers <= 1:
+        for file_path, source in files:
+            yield (file_path,) + _read_file(source)
+        return
+
+    # Limit the number of files in flight so that the walk does not run far
+    # ahead of the results that have been consumed
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        for file_path, source in files:
+            pending.append((file_path, executor.submit(_read_file, source)))
+            if len(pending) >= 2 * max_workers:
+                yield _get_result(*pending.popleft())
+        while pending:
+            yield _get_result(*pending.popleft())
+
+
+def _walk_files(directory):
+    """Find the files to read in a directory.
+
+    Args:
+        directory (str):
+            Directory of ground motion files (streams).
+
+    Yields:
+        tuple: (Path reported for the file, path of the file or io.BytesIO
+                with the contents of an archive member).
+    """
+    for dirpath, sub_dirs, files in os.walk(directory):
+        sub_dirs.sort()
+        for f in sorted(files):
+            full_file = os.path.join(dirpath, f)
+            if is_archive(full_file):
+                members = iter_archive(full_file)
+            else:
+                members = [(full_file, full_file)]
+            for file_path, source in members:
+                file_ext = os.path.splitext(file_path)[1].lower()
+                if file_ext not in EXT_IGNORE:
+                    yield file_path, source
+
 
-    # Use a temp dir so that we don't modify data on disk since that may not be
-    # expected or desired in all cases.
-    temp_dir = os.path.join(tempfile.mkdtemp(), 'directory_to_streams')
+def _read_file(source):
+    """Read the streams in a file, catching any error.
+
+    Args:
+        source (str or file-like):
+            Path of the file or its contents.
+
+    Returns:
+        tuple: (List of streams, Exception raised or None).
+    """
     try:
-        shutil.copytree(directory, temp_dir)
-        flatten_directory(temp_dir)
-        # -------------------------------------------------------------------------
-        # Read streams
-        # -------------------------------------------------------------------------
-        streams = []
-        unprocessed_files = []
-        unprocessed_file_errors = []
-        for file_path in glob.glob(os.path.join(temp_dir, "*")):
-            file_ext = os.path.splitext(file_path)[1].lower()
-            if file_ext not in EXT_IGNORE:
-                try:
-                    streams += read_data(file_path)
-                except Exception as ex:
-                    unprocessed_files += [file_path]
-                    unprocessed_file_errors += [ex]
-    except Exception as e:
-        raise e
-    finally:
-        shutil.rmtree(temp_dir)
+        return read_data(source), None
+    except Exception as ex:
+        return [], ex
 
-    return streams, unprocessed_files, unprocessed_file_errors
+
+def _get_result(file_path, future):
+    """Get the result of reading a file in a worker process.
+
+    Args:
+        file_path (str):
+            Path reported for the file.
+        future (concurrent.futures.Future):
+            Future of _read_file.
+
+    Returns:
+        tuple: (Path reported for the file, list of streams, Exception raised
+                or None).
+    """
+    try:
+        streams, error = future.result()
+    except Exception as ex:
+        # e.g. the result could not be sent back from the worker
+        streams, error = [], ex
+    return file_path, streams, error
 
 
 def _split_all_path(path):
@@ -10,6 +10,8 @@ import numpy as np
 # local imports
 from gmprocess.exception import GMProcessException
 from gmprocess.io.seedname import get_channel_name
+from gmprocess.io.fixed_width import decode_fixed_width
+from gmprocess.io.utils import get_first_line, open_data_file
 from gmprocess.stationtrace import StationTrace, PROCESS_LEVELS
 from gmprocess.stationstream import StationStream
 
@@ -105,6 +107,22 @@ DAM_LOCATIONS = {
 }
 
 
+def sniff_smc(prefix):
+    """Check the first line of a file for the SMC markers.
+
+    Args:
+        prefix (bytes): First bytes of the candidate SMC file.
+
+    Returns:
+        bool: False if the file cannot be SMC, True otherwise.
+    """
+    firstline = get_first_line(prefix).strip()
+    if firstline in VALID_HEADERS:
+        return True
+    markers = ['DISPLACEMENT', 'VELOCITY', '*']
+    return any(marker in firstline for marker in markers)
+
+
 def is_smc(filename):
     """Check to see if file is a SMC (corrected, in acc.) strong motion file.
 
@@ -115,7 +133,7 @@ def is_smc(filename):
     """
     logging.debug("Checking if format is smc.")
     try:
-        with open(filename, 'rt') as f:
+        with open_data_file(filename) as f:
             lines = f.readlines()
             firstline = lines[0].strip()
             if firstline in VALID_HEADERS:
@@ -149,7 +167,7 @@ def read_smc(filename, **kwargs):
     """Read SMC strong motion file.
 
     Args:
-        filename (str): Path to possible SMC data file.
+        filename (str or file-like): Path to possible SMC data file.
         kwargs (ref):
             any_structure (bool): Read data from any type of structure,
                 raise Exception if False and structure type is not free-field.
@@ -168,38 +186,30 @@ def read_smc(filename, **kwargs):
     if not is_smc(filename):
         raise Exception('%s is not a valid SMC file' % filename)
 
-    with open(filename, 'rt') as f:
-        line = f.readline().strip()
-        if 'DISPLACEMENT' in line:
-            raise GMProcessException('SMC: Diplacement records are not supported: '
-                                     '%s.' % filename)
-        elif 'VELOCITY' in line:
-            raise GMProcessException('SMC: Velocity records are not supported: '
-                                     '%s.' % filename)
-        elif line == "*":
-            raise GMProcessException('SMC: No record volume specified in file: '
-                                     '%s.' % filename)
+    with open_data_file(filename) as f:
+        lines = f.readlines()
+    line = lines[0].strip() if lines else ''
+    if 'DISPLACEMENT' in line:
+        raise GMProcessException('SMC: Diplacement records are not supported: '
+                                 '%s.' % filename)
+    elif 'VELOCITY' in line:
+        raise GMProcessException('SMC: Velocity records are not supported: '
+                                 '%s.' % filename)
+    elif line == "*":
+        raise GMProcessException('SMC: No record volume specified in file: '
+                                 '%s.' % filename)
 
     stats, num_comments = _get_header_info(
-        filename, any_structure=any_structure,
+        filename, lines, any_structure=any_structure,
         accept_flagged=accept_flagged, location=location)
 
     skip = ASCII_HEADER_LINES + INTEGER_HEADER_LINES + \
         num_comments + FLOAT_HEADER_LINES
 
     # read float data (8 columns per line)
-    nrows = int(np.floor(stats['npts'] / DATA_COLUMNS))
-    data = np.genfromtxt(filename,
-                         max_rows=nrows,
-                         skip_header=skip,
-                         delimiter=FLOAT_DATA_WIDTHS)
-    data = data.flatten()
-    if stats['npts'] % DATA_COLUMNS:
-        lastrow = np.genfromtxt(filename, max_rows=1,
-                                skip_header=skip + nrows,
-                                delimiter=FLOAT_DATA_WIDTHS)
-        data = np.append(data, lastrow)
-    data = data[0:stats['npts']]
+    nrows = int(np.ceil(stats['npts'] / DATA_COLUMNS))
+    data = decode_fixed_width(lines[skip:skip + nrows], FLOAT_DATA_WIDTHS)
+    data = data.flatten()[0:stats['npts']]
     trace = StationTrace(data, header=stats)
 
     response = {'input_units': 'counts', 'output_units': 'cm/s^2'}
@@ -209,10 +219,14 @@ def read_smc(filename, **kwargs):
     return [stream]
 
 
-def _get_header_info(filename, any_structure=False, accept_flagged=False,
-                     location=''):
+def _get_header_info(filename, lines, any_structure=False,
+                     accept_flagged=False, location=''):
     """Return stats structure from various headers.
 
+    Args:
+        filename (str): Path to SMC data file, used in error messages.
+        lines (list): Lines (str) of the SMC file.
+
     Output is a dictionary like this:
      - network
      - station
@@ -267,8 +281,7 @@ def _get_header_info(filename, any_structure=False, accept_flagged=False,
     format_specific = {}
     coordinates = {}
     # read the ascii header lines
-    with open(filename) as f:
-        ascheader = [next(f).strip() for x in range(ASCII_HEADER_LINES)]
+    ascheader = [line.strip() for line in lines[0:ASCII_HEADER_LINES]]
 
     standard['process_level'] = PROCESS_LEVELS[VALID_HEADERS[ascheader[0]]]
     logging.debug("process_level: %s" % standard['process_level'])
@@ -299,10 +312,10 @@ def _get_header_info(filename, any_structure=False, accept_flagged=False,
 
     # read integer header data
 
-    intheader = np.genfromtxt(filename, dtype=np.int32,
-                              max_rows=INTEGER_HEADER_LINES,
-                              skip_header=ASCII_HEADER_LINES,
-                              delimiter=INT_HEADER_WIDTHS)
+    skip = ASCII_HEADER_LINES
+    intheader = decode_fixed_width(
+        lines[skip:skip + INTEGER_HEADER_LINES], INT_HEADER_WIDTHS,
+        missing=-1).astype(np.int32)
     # 8 columns per line
     # first line is start time information, and then inst. serial number
     missing_data = intheader[0, 0]
@@ -424,11 +437,8 @@ def _get_header_info(filename, any_structure=False, accept_flagged=False,
 
     # read float header data
     skip = ASCII_HEADER_LINES + INTEGER_HEADER_LINES
-    floatheader = np.genfromtxt(
-        filename,
-        max_rows=FLOAT_HEADER_LINES,
-        skip_header=skip,
-        delimiter=FLOAT_HEADER_WIDTHS)
+    floatheader = decode_fixed_width(
+        lines[skip:skip + FLOAT_HEADER_LINES], FLOAT_HEADER_WIDTHS)
 
     # float headers are 10 lines of 5 floats each
     missing_data = floatheader[0, 0]
@@ -474,11 +484,9 @@ def _get_header_info(filename, any_structure=False, accept_flagged=False,
     standard['units'] = 'acc'
 
     # read in the comment lines
-    with open(filename) as f:
-        skip = ASCII_HEADER_LINES + INTEGER_HEADER_LINES + FLOAT_HEADER_LINES
-        _ = [next(f) for x in range(skip)]
-        standard['comments'] = [next(f).strip().lstrip('|')
-                                for x in range(num_comments)]
+    skip = ASCII_HEADER_LINES + INTEGER_HEADER_LINES + FLOAT_HEADER_LINES
+    standard['comments'] = [line.strip().lstrip('|')
+                            for line in lines[skip:skip + num_comments]]
 
     standard['comments'] = ' '.join(standard['comments'])
     stats['coordinates'] = coordinates
@@ -12,7 +12,9 @@ from gmprocess.exception import GMProcessException
 from gmprocess.io.seedname import get_channel_name
 from gmprocess.stationstream import StationStream
 from gmprocess.stationtrace import StationTrace, PROCESS_LEVELS
-from gmprocess.io.utils import is_evenly_spaced, resample_uneven_trace
+from gmprocess.io.utils import (is_evenly_spaced, resample_uneven_trace,
+                                 get_first_line, open_data_file)
+from gmprocess.io.fixed_width import decode_fixed_width
 
 VOLUMES = {
     'V1': {
@@ -33,6 +35,21 @@ USC_ORIENTATIONS = {
 }
 
 
+def sniff_usc(prefix):
+    """Check the first line of a file for the USC volume markers.
+
+    Args:
+        prefix (bytes): First bytes of the candidate USC file.
+
+    Returns:
+        bool: False if the file cannot be USC, True otherwise.
+    """
+    line = get_first_line(prefix)
+    markers = ['OF UNCORRECTED ACCELEROGRAM DATA OF',
+               'CORRECTED ACCELEROGRAM', 'RESPONSE']
+    return any(line.find(marker) >= 0 for marker in markers)
+
+
 def is_usc(filename, **kwargs):
     """Check to see if file is a USC strong motion file.
 
@@ -48,7 +65,7 @@ def is_usc(filename, **kwargs):
     return_alternate = kwargs.get('return_alternate', False)
 
     try:
-        f = open(filename, 'rt')
+        f = open_data_file(filename)
         first_line = f.readline()
         if first_line.find('OF UNCORRECTED ACCELEROGRAM DATA OF') >= 0:
             volume = 'V1'
@@ -85,7 +102,7 @@ def is_usc(filename, **kwargs):
 
 def _check_header(start, stop, filename):
     passing = True
-    with open(filename, 'r') as f:
+    with open_data_file(filename) as f:
         counter = stop
         for i in range(start):
             f.readline()
@@ -101,7 +118,7 @@ def read_usc(filename, **kwargs):
     """Read USC V1 strong motion file.
 
     Args:
-        filename (str): Path to possible USC V1 data file.
+        filename (str or file-like): Path to possible USC V1 data file.
         kwargs (ref): Ignored by this function.
     Returns:
         Stream: Obspy Stream containing three channels of acceleration data
@@ -114,7 +131,7 @@ def read_usc(filename, **kwargs):
     # Check for Location
     location = kwargs.get('location', '')
 
-    f = open(filename, 'rt')
+    f = open_data_file(filename)
     first_line = f.readline()
     f.close()
 
@@ -134,15 +151,16 @@ def read_volume_one(filename, location='', alternate=False):
         tuple: (list of obspy Trace, int line offset)
     """
     volume = VOLUMES['V1']
-    # count the number of lines in the file
-    with open(filename) as f:
-        line_count = sum(1 for _ in f)
+    # read the whole file once; every channel is parsed from these lines
+    with open_data_file(filename) as f:
+        lines = f.readlines()
+    line_count = len(lines)
     # read as many channels as are present in the file
     line_offset = 0
     stream = StationStream([])
     while line_offset < line_count:
         trace, line_offset = _read_channel(
-            filename, line_offset, volume, location=location, alternate=alternate)
+            lines, line_offset, volume, location=location, alternate=alternate)
         # store the trace if the station type is in the valid_station_types
         # list or store the trace if there is no valid_station_types list
         if trace is not None:
@@ -151,11 +169,11 @@ def read_volume_one(filename, location='', alternate=False):
     return [stream]
 
 
-def _read_channel(filename, line_offset, volume, location='', alternate=False):
+def _read_channel(all_lines, line_offset, volume, location='', alternate=False):
     """Read channel data from USC V1 text file.
 
     Args:
-        filename (str): Input USC V1 filename.
+        all_lines (list): Lines (str) of the USC V1 file.
         line_offset (int): Line offset to beginning of channel text block.
         volume (dictionary): Dictionary of formatting information
     Returns:
@@ -170,32 +188,27 @@ def _read_channel(filename, line_offset, volume, location='', alternate=False):
         int_fmt = volume['INT_FMT']
         data_cols = 10
     # Parse the header portion of the file
-    try:
-        with open(filename, 'rt') as f:
-            for _ in range(line_offset):
-                next(f)
-            lines = [next(f) for x in range(volume['TEXT_HDR_ROWS'])]
     # Accounts for blank lines at end of files
-    except StopIteration:
+    if line_offset + volume['TEXT_HDR_ROWS'] > len(all_lines):
         return (None, 1 + line_offset)
+    lines = all_lines[line_offset:line_offset + volume['TEXT_HDR_ROWS']]
     # read in lines of integer data
     skiprows = line_offset + volume['TEXT_HDR_ROWS']
-    int_data = np.genfromtxt(filename, skip_header=skiprows,
-                             max_rows=int_rows, dtype=np.int32,
-                             delimiter=int_fmt).flatten()
+    int_data = decode_fixed_width(
+        all_lines[skiprows:skiprows + int_rows], int_fmt, missing=-1)
+    int_data = int_data.flatten().astype(np.int32)
 
     # read in lines of float data
     skiprows += int_rows
-    flt_data = np.genfromtxt(filename, skip_header=skiprows,
-                             max_rows=volume['FLT_HDR_ROWS'], dtype=np.float64,
-                             delimiter=volume['FLT_FMT']).flatten()
+    flt_rows = volume['FLT_HDR_ROWS']
+    flt_data = decode_fixed_width(
+        all_lines[skiprows:skiprows + flt_rows], volume['FLT_FMT']).flatten()
     hdr = _get_header_info(int_data, flt_data, lines, 'V1', location=location)
-    skiprows += volume['FLT_HDR_ROWS']
+    skiprows += flt_rows
     # read in the data
     nrows = int(np.floor(hdr['npts'] * 2 / data_cols))
-    all_data = np.genfromtxt(filename, skip_header=skiprows,
-                             max_rows=nrows, dtype=np.float64,
-                             delimiter=volume['COL_FMT'])
+    all_data = decode_fixed_width(
+        all_lines[skiprows:skiprows + nrows], volume['COL_FMT'])
     data = all_data.flatten()[1::2]
     times = all_data.flatten()[0::2]
 
@@ -1,4 +1,7 @@
+import io
 import os
+import re
+import tarfile
 import zipfile
 import logging
 
@@ -84,6 +87,170 @@ def resample_uneven_trace(trace, times, data, resample_rate=None,
     return trace
 
 
+def is_path(source):
+    """
+    Check if a data source is a path rather than data in memory.
+
+    Args:
+        source (str, bytes or file-like):
+            Path to a file, contents of a file, or file-like object.
+
+    Returns:
+        bool: True if source is a path, False otherwise.
+    """
+    return isinstance(source, (str, os.PathLike))
+
+
+def open_data_file(source, mode='rt', encoding=None):
+    """
+    Open a strong motion data file that is on disk or in memory.
+
+    Readers use this instead of open() so that they accept the contents of
+    a file (e.g., a member of a zip or tar archive) as well as its path.
+    File-like objects are read from the start and are not closed.
+
+    Args:
+        source (str, bytes or file-like):
+            Path to the file, contents of the file, or file-like object
+            (e.g., io.BytesIO) holding the contents of the file.
+        mode (str):
+            'rt' to read text or 'rb' to read bytes.
+        encoding (str):
+            Text encoding. Default is the same as for open().
+
+    Returns:
+        file object: Open file, to be used as a context manager or closed
+        by the caller.
+    """
+    if is_path(source):
+        if 'b' in mode:
+            return open(source, mode)
+        return open(source, mode, encoding=encoding)
+    if isinstance(source, (bytes, bytearray)):
+        data = bytes(source)
+    else:
+        if source.seekable():
+            source.seek(0)
+        data = source.read()
+    if isinstance(data, str):
+        if 'b' in mode:
+            return io.BytesIO(data.encode(encoding or 'utf-8'))
+        return io.StringIO(data, newline=None)
+    if 'b' in mode:
+        return io.BytesIO(data)
+    return io.TextIOWrapper(io.BytesIO(data), encoding=encoding)
+
+
+def get_source_name(source):
+    """
+    Get the name of a data source, for messages and format detection.
+
+    Args:
+        source (str, bytes or file-like):
+            Path to a file, contents of a file, or file-like object.
+
+    Returns:
+        str: The path, the name attribute of a file-like object, or an
+        empty string.
+    """
+    if is_path(source):
+        return os.fspath(source)
+    name = getattr(source, 'name', '')
+    return name if isinstance(name, str) else ''
+
+
+def is_archive(source):
+    """
+    Check if a data source is a zip or tar archive.
+
+    Args:
+        source (str, bytes or file-like):
+            Path to a file, contents of a file, or file-like object.
+
+    Returns:
+        bool: True if source is a zip or tar (optionally compressed)
+        archive, False otherwise.
+    """
+    if is_path(source):
+        return zipfile.is_zipfile(source) or tarfile.is_tarfile(source)
+    with open_data_file(source, 'rb') as f:
+        if zipfile.is_zipfile(f):
+            return True
+        f.seek(0)
+        return tarfile.is_tarfile(f)
+
+
+def iter_archive(source, name=None):
+    """
+    Iterate over the files in a zip or tar archive without extracting them.
+
+    Archives within the archive are opened in memory and their files are
+    yielded in turn, so nested archives are flattened. Directories and
+    links are skipped.
+
+    Args:
+        source (str, bytes or file-like):
+            Path to the archive, contents of the archive, or file-like
+            object holding the archive.
+        name (str):
+            Path reported for the archive. Default is the name of source.
+
+    Yields:
+        tuple: (Path of the member below the archive name, io.BytesIO with
+                the contents of the member; its name attribute is the path
+                of the member).
+    """
+    if name is None:
+        name = get_source_name(source)
+    with open_data_file(source, 'rb') as f:
+        if zipfile.is_zipfile(f):
+            members = _iter_zip(f)
+        else:
+            f.seek(0)
+            members = _iter_tar(f)
+        for member_name, data in members:
+            member_path = os.path.join(name, member_name)
+            member = io.BytesIO(data)
+            member.name = member_path
+            if is_archive(member):
+                yield from iter_archive(member, member_path)
+            else:
+                yield member_path, member
+
+
+def _iter_zip(f):
+    with zipfile.ZipFile(f, 'r') as zip:
+        for info in zip.infolist():
+            if not info.is_dir():
+                yield info.filename, zip.read(info)
+
+
+def _iter_tar(f):
+    with tarfile.open(fileobj=f, mode='r:*') as tar:
+        for info in tar:
+            if info.isfile():
+                yield info.name, tar.extractfile(info).read()
+
+
+def get_first_line(prefix):
+    """
+    Get the first line of text from the first bytes of a file.
+
+    Lines end at a carriage return or a line feed, the same as in files
+    opened in text mode. Bytes are decoded as latin-1, so this never fails
+    on binary data.
+
+    Args:
+        prefix (bytes):
+            First bytes of a file.
+
+    Returns:
+        str: First line, without the line ending.
+    """
+    line = prefix.decode('latin-1')
+    return re.split('\r|\n', line, maxsplit=1)[0]
+
+
 def flatten_directory(directory):
     """
     Prepare a messy directory to be read in.
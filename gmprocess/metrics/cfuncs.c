@@ -1,4 +1,5 @@
 #include <math.h>
+#include <stddef.h>
 #include "cfuncs.h"
 
 /*
@@ -71,3 +72,125 @@ void calculate_spectrals_c(double *times, double *acc, int np, double period,
     }
     return;
 }
+
+/*
+ * Integrate a single oscillator of the given period over acc (np samples)
+ * with the same recursion as calculate_spectrals_c. The velocity and
+ * displacement are carried as scalars. If sacc is not NULL the spectral
+ * acceleration time history is written to it (the last sample is set to
+ * zero, as above). If peak is not NULL, the spectral acceleration with the
+ * largest absolute value and its sample index are written to peak and
+ * peak_idx without storing the time history.
+ */
+static void sdof_response(double *acc, int np, double dt_in, double period,
+                          double damping, double *sacc, double *peak,
+                          int *peak_idx) {
+    double w = 2 * M_PI / period;
+    double d = damping;
+    double wd = sqrt(1. - d * d) * w;
+    double ns = (int)(10. * dt_in / period - 0.01) + 1.0;
+    double dt = dt_in / ns;
+    double e = exp( -1 * d * w * dt);
+    double sine = e * sin(wd * dt);
+    double cosine = e * cos(wd * dt);
+
+    double w2 = w * w;
+    double w3 = w2 * w;
+    double w2i = 1.0 / w2;
+    double wdi = 1.0 / wd;
+    double dw = d * w;
+    double ddtw3 = 2. * d / (dt * w3);
+
+    // Values that will change with each iteration
+    double a;
+    double b;
+    double dug;
+    double g;
+    double gw2i;
+    double dugw2i;
+    double dugw2idt;
+    double dis = 0;
+    double vel = 0;
+    double sa;
+    double max_sa = 0;
+    double max_abs = 0;
+    int max_idx = 0;
+    int k;
+
+    for (k = 0; k < np-1; k++) {
+        g = acc[k];
+        dug = (acc[k+1] - g) / ns;
+        gw2i = g * w2i;
+        dugw2i = dug * w2i;
+        dugw2idt = dugw2i / dt;
+        b = dis + gw2i - ddtw3 * dug;
+        a = wdi * vel + dw * wdi * b + wdi * dugw2idt;
+        dis = a * sine + b * cosine + ddtw3 * dug - gw2i - dugw2i;
+        vel = a * (wd * cosine - dw * sine) -
+              b * (wd * sine + dw * cosine) -
+              dugw2idt;
+        sa = -2. * dw * vel - w2 * dis;
+        if (sacc != NULL) {
+            sacc[k] = sa;
+        }
+        if (fabs(sa) > max_abs) {
+            max_abs = fabs(sa);
+            max_sa = sa;
+            max_idx = k;
+        }
+    }
+    if (sacc != NULL && np > 0) {
+        sacc[np-1] = 0;
+    }
+    if (peak != NULL) {
+        *peak = max_sa;
+        *peak_idx = max_idx;
+    }
+    return;
+}
+
+/*
+ * Compute the spectral acceleration time history of every channel in acc
+ * (nchan rows of np samples each, stored contiguously) for every period
+ * in periods. The result is written to sacc, which must hold
+ * nchan * nperiods * np values and is laid out as [channel][period][sample].
+ */
+void calculate_spectrals_batch_c(double *acc, int np, int nchan, double dt_in,
+                                 double *periods, int nperiods,
+                                 double damping, double *sacc) {
+    int ic;
+    int ip;
+
+    for (ic = 0; ic < nchan; ic++) {
+        for (ip = 0; ip < nperiods; ip++) {
+            sdof_response(acc + (long)ic * np, np, dt_in, periods[ip],
+                          damping, sacc + ((long)ic * nperiods + ip) * np,
+                          NULL, NULL);
+        }
+    }
+    return;
+}
+
+/*
+ * Same as calculate_spectrals_batch_c, but only the peak spectral
+ * acceleration (signed value with the largest amplitude) and the sample
+ * index at which it occurs are kept. peaks and peak_idx must hold
+ * nchan * nperiods values and are laid out as [channel][period].
+ */
+void calculate_spectral_peaks_c(double *acc, int np, int nchan, double dt_in,
+                                double *periods, int nperiods,
+                                double damping, double *peaks,
+                                int *peak_idx) {
+    int ic;
+    int ip;
+    long idx;
+
+    for (ic = 0; ic < nchan; ic++) {
+        for (ip = 0; ip < nperiods; ip++) {
+            idx = (long)ic * nperiods + ip;
+            sdof_response(acc + (long)ic * np, np, dt_in, periods[ip],
+                          damping, NULL, peaks + idx, peak_idx + idx);
+        }
+    }
+    return;
+}
@@ -1,3 +1,10 @@
 void calculate_spectrals_c(double *times, double *acc, int np, double period,
 	                       double damping, double *sacc, double *svel,
 						   double *sdis);
+void calculate_spectrals_batch_c(double *acc, int np, int nchan,
+                                 double dt_in, double *periods, int nperiods,
+                                 double damping, double *sacc);
+void calculate_spectral_peaks_c(double *acc, int np, int nchan,
+                                double dt_in, double *periods, int nperiods,
+                                double damping, double *peaks,
+                                int *peak_idx);
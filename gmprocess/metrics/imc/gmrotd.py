@@ -1,9 +1,10 @@
 # local imports
 from gmprocess.metrics.exception import PGMException
-from gmprocess.metrics.rotation import get_max, rotate
+from gmprocess.metrics.rotation import get_max, rotate_peaks
 
 
-def calculate_gmrotd(stream, percentiles, rotated=False, **kwargs):
+def calculate_gmrotd(stream, percentiles, rotated=False, delta=1.0,
+                     **kwargs):
     """
     Rotate two horizontal channels using the geometric mean.
     Args:
@@ -13,6 +14,8 @@ def calculate_gmrotd(stream, percentiles, rotated=False, **kwargs):
             Example: [100, 50, 75] results in RotD100, RotD50, RotD75.
         rotated (bool): Wheter the stream is a rotation matrix. Used by the
                 arias intensity calculation. Default is False.
+        delta (float): Delta degrees of the rotation angle grid used when
+                the stream is not already rotated. Default is 1.0.
     Returns:
         dictionary: Dictionary of geometric mean for each percentile.
     """
@@ -31,7 +34,8 @@ def calculate_gmrotd(stream, percentiles, rotated=False, **kwargs):
         if len(osc1) != len(osc2):
             raise PGMException('Horizontal channels have different lengths.')
 
-        osc1_rot, osc2_rot = rotate(osc1, osc2, combine=False)
+        osc1_rot, osc2_rot = rotate_peaks(osc1, osc2, combine=False,
+                                          delta=delta, absolute=False)
         gm_percentiles = get_max(osc1_rot, 'gm', osc2_rot, percentiles)[1]
 
         gmrotd_dict = {}
@@ -1,9 +1,10 @@
 # third party imports
 from gmprocess.metrics.exception import PGMException
-from gmprocess.metrics.rotation import get_max, rotate
+from gmprocess.metrics.rotation import get_max, rotate_peaks
 
 
-def calculate_rotd(stream, percentiles, rotated=False, **kwargs):
+def calculate_rotd(stream, percentiles, rotated=False, delta=1.0,
+                   **kwargs):
     """
     Rotate two horizontal channels and combine to get the spectral response.
 
@@ -13,6 +14,8 @@ def calculate_rotd(stream, percentiles, rotated=False, **kwargs):
             Example: [100, 50, 75] results in RotD100, RotD50, RotD75.
         rotated (bool): Wheter the stream is a rotation matrix. Used by
             the arias intensity calculation. Default is False.
+        delta (float): Delta degrees of the rotation angle grid used when
+            the stream is not already rotated. Default is 1.0.
 
     Returns:
         dictionary: Dictionary of oienation indeendent nongeometric mean
@@ -33,7 +36,7 @@ def calculate_rotd(stream, percentiles, rotated=False, **kwargs):
         if len(osc1) != len(osc2):
             raise PGMException('Horizontal channels have different lengths.')
 
-        rot = rotate(osc1, osc2, combine=True)
+        rot = rotate_peaks(osc1, osc2, combine=True, delta=delta)
         rot_percentiles = get_max(rot, 'max', None, percentiles)[1]
 
         rotd_dict = {}
@@ -6,7 +6,7 @@ from obspy.core.trace import Trace
 # local imports
 from gmprocess.metrics.exception import PGMException
 from gmprocess.metrics.imc.geometric_mean import calculate_geometric_mean
-from gmprocess.smoothing.konno_ohmachi import konno_ohmachi_smooth
+from gmprocess.smoothing.konno_ohmachi import konno_ohmachi_smooth_many
 
 
 def calculate_fas(stream, imcs, periods, smoothing, bandwidth):
@@ -57,11 +57,10 @@ def calculate_fas(stream, imcs, periods, smoothing, bandwidth):
     freqs = np.fft.rfftfreq(nfft, 1 / trace.stats.sampling_rate)
 
     fas_frequencies = 1 / np.asarray(list(periods))
-    smoothed_values = np.empty_like(fas_frequencies)
 
     if smoothing.lower() == 'konno_ohmachi':
-        konno_ohmachi_smooth(gm_trace.astype(np.double), freqs,
-                fas_frequencies, smoothed_values, bandwidth)
+        smoothed_values = konno_ohmachi_smooth_many(
+            gm_trace, freqs, fas_frequencies, bandwidth)
     else:
         raise PGMException('Not a valid smoothing option: %r' % smoothing)
 
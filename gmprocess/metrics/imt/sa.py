@@ -35,7 +35,6 @@ def calculate_sa(stream, imcs, rotation_matrix=None, origin=None):
     for imc in grouped_imcs:
         if 'calculate_' + imc in pgm_classes:
             sa_func = pgm_classes['calculate_' + imc]
-            sa = sa_func(stream, origin=origin, percentiles=grouped_imcs[imc])
             if imc == 'rotd':
                 if rotation_matrix is None:
                     raise PGMException(
@@ -43,6 +42,10 @@ def calculate_sa(stream, imcs, rotation_matrix=None, origin=None):
                         'in order to calculate the rotd component.')
                 sa = sa_func(rotation_matrix, origin=origin,
                              percentiles=grouped_imcs[imc], rotated=True)
+            else:
+                sa = sa_func(stream, origin=origin,
+                             percentiles=grouped_imcs[imc])
+            if imc == 'rotd':
                 for percentile in sa:
                     sa_dict[imc.upper() + str(percentile)] = sa[percentile]
             elif imc.find('rot') >= 0:
@@ -1,4 +1,5 @@
 # stdlib imports
+from concurrent.futures import ThreadPoolExecutor
 import warnings
 
 # third party imports
@@ -13,12 +14,20 @@ from obspy import read
 
 # local imports
 from gmprocess.constants import GAL_TO_PCTG
-from gmprocess.metrics.rotation import rotate
+from gmprocess.metrics.rotation import rotate, rotate_peaks
 
-cdef extern from "cfuncs.h":
+cdef extern from "cfuncs.h" nogil:
     void calculate_spectrals_c(double *times, double *acc, int np,
                                double period, double damping, double *sacc,
                                double *svel, double *sdis);
+    void calculate_spectrals_batch_c(double *acc, int np, int nchan,
+                                     double dt_in, double *periods,
+                                     int nperiods, double damping,
+                                     double *sacc);
+    void calculate_spectral_peaks_c(double *acc, int np, int nchan,
+                                    double dt_in, double *periods,
+                                    int nperiods, double damping,
+                                    double *peaks, int *peak_idx);
 
 
 def get_acceleration(stream, units='%%g'):
@@ -49,8 +58,8 @@ def get_acceleration(stream, units='%%g'):
     return accel_stream
 
 
-cpdef list calculate_spectrals(np.ndarray[double, ndim=1, mode='c']times,
-                               np.ndarray[double, ndim=1, mode='c']acc,
+cpdef list calculate_spectrals(const double[::1] times,
+                               const double[::1] acc,
                                period, damping):
     """
     Returns a list of spectral responses for acceleration, velocity,
@@ -65,18 +74,149 @@ cpdef list calculate_spectrals(np.ndarray[double, ndim=1, mode='c']times,
         list: List of spectral responses (np.ndarray).
     """
     cdef int kg = len(acc)
+    cdef double c_period = period
+    cdef double c_damping = damping
     cdef ndarray[double, ndim=1] spectral_acc = np.zeros(kg)
     cdef ndarray[double, ndim=1] spectral_vel = np.zeros(kg)
     cdef ndarray[double, ndim=1] spectral_dis = np.zeros(kg)
+    cdef double *times_ptr = NULL
+    cdef double *acc_ptr = NULL
+    cdef double *sacc_ptr = <double *>spectral_acc.data
+    cdef double *svel_ptr = <double *>spectral_vel.data
+    cdef double *sdis_ptr = <double *>spectral_dis.data
 
-    calculate_spectrals_c(<double *>times.data, <double *>acc.data, kg,
-                          period, damping,
-                          <double *>spectral_acc.data,
-                          <double *>spectral_vel.data,
-                          <double *>spectral_dis.data)
+    # the inputs may be read-only, as when the data is shared by copies
+    if kg > 0:
+        times_ptr = <double *>&times[0]
+        acc_ptr = <double *>&acc[0]
+    with nogil:
+        calculate_spectrals_c(times_ptr, acc_ptr, kg, c_period, c_damping,
+                              sacc_ptr, svel_ptr, sdis_ptr)
     return [spectral_acc, spectral_vel, spectral_dis]
 
 
+cpdef np.ndarray calculate_spectrals_batch(
+        const double[:, ::1] acc, double dt, periods,
+        double damping, int max_threads=1):
+    """
+    Returns the spectral acceleration response of several channels for
+            several periods, computed in a single pass.
+
+    The GIL is released while integrating, so this can be called from
+    several threads at once.
+    Args:
+        acc (np.ndarray): 2D array of acceleration values with one row per
+            channel. All channels must share the same sampling interval.
+        dt (float): Sampling interval in seconds.
+        periods (array_like): Periods in seconds.
+        damping (float): Fraction of critical damping.
+        max_threads (int): Number of threads to split the periods over.
+            Default is 1.
+
+    Returns:
+        np.ndarray: Spectral acceleration with shape
+            (n_channels, n_periods, n_samples).
+    """
+    cdef np.ndarray[double, ndim=1, mode='c'] c_periods = np.ascontiguousarray(
+        periods, dtype=np.double)
+    cdef int nchan = acc.shape[0]
+    cdef int kg = acc.shape[1]
+    cdef int nperiods = c_periods.shape[0]
+    cdef np.ndarray[double, ndim=3, mode='c'] spectral_acc
+    cdef double *acc_ptr = NULL
+    cdef double *periods_ptr = <double *>c_periods.data
+    cdef double *sacc_ptr
+
+    if max_threads > 1 and nperiods > 1:
+        chunks = _split_periods(c_periods, max_threads)
+        with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            futures = [executor.submit(calculate_spectrals_batch, acc, dt,
+                                       chunk, damping)
+                       for chunk in chunks]
+            return np.concatenate([f.result() for f in futures], axis=1)
+
+    if nchan > 0 and kg > 0:
+        acc_ptr = <double *>&acc[0, 0]
+    spectral_acc = np.zeros((nchan, nperiods, kg))
+    sacc_ptr = <double *>spectral_acc.data
+    with nogil:
+        calculate_spectrals_batch_c(acc_ptr, kg, nchan, dt, periods_ptr,
+                                    nperiods, damping, sacc_ptr)
+    return spectral_acc
+
+
+cpdef tuple calculate_spectral_peaks(
+        const double[:, ::1] acc, double dt, periods,
+        double damping, int max_threads=1):
+    """
+    Returns the peak spectral acceleration response of several channels for
+            several periods without storing the response time histories.
+
+    The GIL is released while integrating, so this can be called from
+    several threads at once.
+    Args:
+        acc (np.ndarray): 2D array of acceleration values with one row per
+            channel. All channels must share the same sampling interval.
+        dt (float): Sampling interval in seconds.
+        periods (array_like): Periods in seconds.
+        damping (float): Fraction of critical damping.
+        max_threads (int): Number of threads to split the periods over.
+            Default is 1.
+
+    Returns:
+        tuple: Peak spectral acceleration (signed value with the largest
+            amplitude) and the sample index of the peak, each as an
+            np.ndarray with shape (n_channels, n_periods).
+    """
+    cdef np.ndarray[double, ndim=1, mode='c'] c_periods = np.ascontiguousarray(
+        periods, dtype=np.double)
+    cdef int nchan = acc.shape[0]
+    cdef int kg = acc.shape[1]
+    cdef int nperiods = c_periods.shape[0]
+    cdef np.ndarray[double, ndim=2, mode='c'] peaks
+    cdef np.ndarray[int, ndim=2, mode='c'] peak_idx
+    cdef double *acc_ptr = NULL
+    cdef double *periods_ptr = <double *>c_periods.data
+    cdef double *peaks_ptr
+    cdef int *idx_ptr
+
+    if max_threads > 1 and nperiods > 1:
+        chunks = _split_periods(c_periods, max_threads)
+        with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            futures = [executor.submit(calculate_spectral_peaks, acc, dt,
+                                       chunk, damping)
+                       for chunk in chunks]
+            results = [f.result() for f in futures]
+        return (np.concatenate([r[0] for r in results], axis=1),
+                np.concatenate([r[1] for r in results], axis=1))
+
+    if nchan > 0 and kg > 0:
+        acc_ptr = <double *>&acc[0, 0]
+    peaks = np.zeros((nchan, nperiods))
+    peak_idx = np.zeros((nchan, nperiods), dtype=np.intc)
+    peaks_ptr = <double *>peaks.data
+    idx_ptr = <int *>peak_idx.data
+    with nogil:
+        calculate_spectral_peaks_c(acc_ptr, kg, nchan, dt, periods_ptr,
+                                   nperiods, damping, peaks_ptr, idx_ptr)
+    return peaks, peak_idx
+
+
+def _split_periods(periods, max_threads):
+    """
+    Splits an array of periods into contiguous chunks, one per thread.
+
+    Args:
+        periods (np.ndarray): Periods in seconds.
+        max_threads (int): Maximum number of chunks.
+
+    Returns:
+        list: List of non-empty, C-contiguous np.ndarray chunks.
+    """
+    chunks = np.array_split(periods, min(max_threads, len(periods)))
+    return [np.ascontiguousarray(chunk) for chunk in chunks if len(chunk)]
+
+
 def get_fourier_amplitude_spectra(stream, smoothing='fft_smooth',
     bandwidth=20.0):
     """
@@ -85,9 +225,15 @@ def get_fourier_amplitude_spectra(stream, smoothing='fft_smooth',
     """
 
 
-def get_spectral(period, stream, damping=0.05, rotation=''):
+def get_spectral(period, stream, damping=0.05, rotation='', delta=1.0,
+                 peaks_only=False):
     """
     Returns a stream of spectral response with units of %%g.
+
+    Because the oscillator is linear, the response of a rotated pair of
+    horizontal channels is the same rotation applied to the responses of
+    the two channels. Rotation matrices are therefore computed from only
+    two oscillator integrations, regardless of the number of angles.
     Args:
         period (float): Period for spectral response.
         stream (obspy.core.stream.Stream): Strong motion timeseries
@@ -95,6 +241,11 @@ def get_spectral(period, stream, damping=0.05, rotation=''):
         damping (float): Damping of oscillator.
         rotation (str): Wheter a rotation matrix should be return and the
             specific type or rotation. Default is None.
+        delta (float): Delta degrees of the rotation angle grid. Only used
+            when rotation is requested. Default is 1.0.
+        peaks_only (bool): Whether to return only the peak of each row of
+            the rotation matrices (see rotation.rotate_peaks). Only used
+            when rotation is requested. Default is False.
     Returns:
         obpsy.core.stream.Stream: stream of spectral response.
     """
@@ -103,14 +254,9 @@ def get_spectral(period, stream, damping=0.05, rotation=''):
     cdef int len_data = stream[0].data.shape[0]
     cdef list horizontals = []
     cdef int idx
-    cdef int idy
-    cdef int ii
-    cdef ndarray[double, ndim=1] h1_times = np.zeros(len_data)
     cdef ndarray[double, ndim=1] acc_sa = np.zeros(len_data)
-    cdef ndarray[double, ndim=2] rot1
-    cdef ndarray[double, ndim=2] rot2
-    cdef list rot = []
-    cdef list rotated = []
+    cdef ndarray[double, ndim=2] acc_h = np.zeros((2, len_data))
+    cdef ndarray[double, ndim=3] sa_h
 
     if rotation == '':
         for idx in num_trace_range:
@@ -129,33 +275,139 @@ def get_spectral(period, stream, damping=0.05, rotation=''):
             # Z in the channel name
             trace = stream[idx]
             if 'Z' not in trace.stats['channel'].upper():
-                horizontals += [trace.copy()]
+                horizontals += [trace]
         if len(horizontals) != 2:
             warnings.warn('Spectral amplitude rotation could not be performed.')
             return
+        if rotation.lower() not in ['nongm', 'gm']:
+            warnings.warn('Invalid rotation option %r.' % rotation)
+            return
+        acc_h = np.vstack([horizontals[0].data,
+                           horizontals[1].data]).astype(np.double)
+        sa_h = calculate_spectrals_batch(
+            acc_h, horizontals[0].stats.delta, [period], damping)
+        sa_h *= GAL_TO_PCTG
+        if peaks_only:
+            # The geometric mean uses the maximum, not the absolute peak
+            rot_func = rotate_peaks
+            rot_kwargs = {'absolute': rotation.lower() == 'nongm'}
         else:
-            h1_stats = horizontals[0].stats
-            h1_times = horizontals[0].times()
+            rot_func = rotate
+            rot_kwargs = {}
         if rotation.lower() == 'nongm':
-            rot = [rotate(horizontals[0], horizontals[1], combine=True)]
-        elif rotation.lower() == 'gm':
-            rot1, rot2 = rotate(horizontals[0], horizontals[1], combine=False)
-            rot = [rot1, rot2]
+            return [rot_func(sa_h[0, 0], sa_h[1, 0], combine=True,
+                             delta=delta, **rot_kwargs)]
         else:
-            warnings.warn('Invalid rotation option %r.' % rotation)
-            return
+            rot1, rot2 = rot_func(sa_h[0, 0], sa_h[1, 0], combine=False,
+                                  delta=delta, **rot_kwargs)
+            return [rot1, rot2]
 
-    cdef ndarray[double, ndim=2] rotated_spectrals = np.zeros(rot[0].shape)
-    for idx in range(0, len(rot)):
-        rot_matrix = rot[idx]
-        rotated_spectrals = np.zeros(rot_matrix.shape)
-        for idy in range(0, len(rot_matrix)):
-            acc_sa = calculate_spectrals(h1_times, rot_matrix[idy],
-                    period, damping)[0]
-            acc_sa = acc_sa * GAL_TO_PCTG
-            rotated_spectrals[idy] = acc_sa
-        rotated += [rotated_spectrals]
-    return rotated
+
+def get_spectral_batch(periods, stream, damping=0.05, max_threads=1):
+    """
+    Returns streams of spectral response with units of %%g for a list of
+    periods.
+
+    This is equivalent to calling get_spectral (without rotation) once for
+    each period, but every channel and period is integrated in one call to
+    the C extension and the velocity and displacement responses are never
+    allocated.
+    Args:
+        periods (list): Periods for spectral response.
+        stream (obspy.core.stream.Stream): Strong motion timeseries
+            for one station.
+        damping (float): Damping of oscillator.
+        max_threads (int): Number of threads to split the periods over.
+            Default is 1.
+    Returns:
+        list: List of obspy.core.stream.Stream, one for each period, in the
+            same order as periods.
+    """
+    periods = list(periods)
+    spect_streams = [Stream() for period in periods]
+    for traces, acc in _group_channels(stream):
+        spectral = calculate_spectrals_batch(
+            acc, traces[0].stats.delta, periods, damping,
+            max_threads=max_threads)
+        spectral *= GAL_TO_PCTG
+        for idx, trace in enumerate(traces):
+            for idy in range(len(periods)):
+                stats = trace.stats.copy()
+                stats['units'] = '%%g'
+                spect_streams[idy].append(
+                    Trace(data=spectral[idx, idy], header=stats))
+    return spect_streams
+
+
+def get_spectral_peaks(periods, stream, damping=0.05, max_threads=1):
+    """
+    Returns streams of peak spectral response with units of %%g for a list
+    of periods.
+
+    Only the running maximum of the absolute spectral acceleration is kept
+    while integrating, so the response time histories are never stored.
+    Each output trace holds a single sample: the (signed) peak spectral
+    acceleration, with the trace start time set to the time of the peak.
+    This is sufficient for IMCs that only depend on the peak value of each
+    channel (e.g., channels and greater_of_two_horizontals).
+    Args:
+        periods (list): Periods for spectral response.
+        stream (obspy.core.stream.Stream): Strong motion timeseries
+            for one station.
+        damping (float): Damping of oscillator.
+        max_threads (int): Number of threads to split the periods over.
+            Default is 1.
+    Returns:
+        list: List of obspy.core.stream.Stream, one for each period, in the
+            same order as periods.
+    """
+    periods = list(periods)
+    spect_streams = [Stream() for period in periods]
+    for traces, acc in _group_channels(stream):
+        peaks, peak_idx = calculate_spectral_peaks(
+            acc, traces[0].stats.delta, periods, damping,
+            max_threads=max_threads)
+        peaks *= GAL_TO_PCTG
+        for idx, trace in enumerate(traces):
+            for idy in range(len(periods)):
+                stats = trace.stats.copy()
+                stats['units'] = '%%g'
+                stats['npts'] = 1
+                stats['starttime'] = (stats['starttime'] +
+                                      peak_idx[idx, idy] * stats['delta'])
+                spect_streams[idy].append(
+                    Trace(data=np.array([peaks[idx, idy]]), header=stats))
+    return spect_streams
+
+
+def _group_channels(stream):
+    """
+    Groups the traces of a stream into contiguous 2D arrays that can be
+    passed to the batched oscillator functions.
+
+    Args:
+        stream (obspy.core.stream.Stream): Strong motion timeseries
+            for one station.
+
+    Returns:
+        list: List of (traces, data) tuples, where data is a C-contiguous
+            2D array with one row for each trace in traces. All traces are
+            stacked together if they share the same number of samples and
+            sampling interval; otherwise each trace is its own group.
+    """
+    if not len(stream):
+        return []
+    npts = set([trace.stats.npts for trace in stream])
+    deltas = set([trace.stats.delta for trace in stream])
+    if len(npts) == 1 and len(deltas) == 1:
+        acc = np.vstack([trace.data for trace in stream]).astype(np.double)
+        return [(list(stream), acc)]
+    groups = []
+    for trace in stream:
+        acc = np.ascontiguousarray(
+            trace.data, dtype=np.double).reshape((1, -1))
+        groups += [([trace], acc)]
+    return groups
 
 
 def get_velocity(stream):
@@ -1,6 +1,10 @@
 import numpy as np
 from gmprocess.metrics.exception import PGMException
 
+# Number of samples rotated at a time by rotate_peaks. With the default 1
+# degree grid this keeps each block of rotated data under ~6 MB.
+CHUNK_SIZE = 4096
+
 
 def get_max(tr1, pick_peak, tr2=None, percentiles=50):
     """
@@ -103,10 +107,7 @@ def get_max(tr1, pick_peak, tr2=None, percentiles=50):
             if (input_dim == '1D'):
                 return np.amax([tr1_max, tr2_max])
             else:
-                maximums = []
-                for idx, val in enumerate(tr1_max):
-                    max_val = np.max([val, tr2_max[idx]])
-                    maximums.append(max_val)
+                maximums = np.maximum(tr1_max, tr2_max)
                 return maximums, np.percentile(maximums, percentiles)
         else:
             maximums = np.amax(np.abs(tr1), axis)
@@ -158,3 +159,83 @@ def rotate(tr1, tr2, combine=False, delta=1.0):
         osc1_rot = td1 * cos_deg + td2 * sin_deg
         osc2_rot = -td1 * sin_deg + td2 * cos_deg
         return osc1_rot, osc2_rot
+
+
+def rotate_peaks(tr1, tr2, combine=False, delta=1.0, absolute=True,
+                 chunk_size=CHUNK_SIZE):
+    """
+    Rotates a trace through 180 degrees and returns the peak value at each
+    degree.
+
+    This gives the same peaks as taking the maximum of each row of the
+    matrices returned by rotate, but the rotation is done in blocks of
+    chunk_size samples and the peaks are reduced incrementally, so the
+    full (num_angles, npts) matrix is never created.
+
+    Args:
+        tr1 (obspy.core.trace.Trace): Trace 1 of strong motion data.
+        tr2 (obspy.core.trace.Trace): Trace 2 of strong motion data.
+        combine (bool): Whether rotated traces should be combined.
+            Default is False.
+        delta (float): Delta degrees which will determine the number of rows
+            for the matrix of rotated components.
+            Default is 1.0
+        absolute (bool): Whether to return the peak of the absolute value
+            (True) or the maximum value (False) at each degree.
+            Default is True.
+        chunk_size (int): Number of samples to rotate at a time.
+            Default is CHUNK_SIZE.
+
+    Returns:
+        numpy.ndarray: Array of shape (num_angles, 1) with the peak at each
+            degree. This can be passed to get_max in place of the rotated
+            matrix. If combine is False, a tuple of two such arrays is
+            returned.
+    """
+    if combine:
+        max_deg = 180
+    else:
+        max_deg = 90
+
+    num_rows = int(max_deg * (1.0 / delta) + 1)
+    degrees = np.deg2rad(np.linspace(0, max_deg, num_rows)).reshape((-1, 1))
+    cos_deg = np.cos(degrees)
+    sin_deg = np.sin(degrees)
+
+    td1 = np.reshape(tr1, (1, -1))
+    td2 = np.reshape(tr2, (1, -1))
+    if td1.shape != td2.shape:
+        raise PGMException('Traces must have the same length.')
+    npts = td1.shape[1]
+    chunk_size = max(int(chunk_size), 1)
+
+    peaks1 = np.full(num_rows, -np.inf)
+    peaks2 = np.full(num_rows, -np.inf)
+    for start in range(0, npts, chunk_size):
+        block1 = td1[:, start:start + chunk_size]
+        block2 = td2[:, start:start + chunk_size]
+        rot1 = block1 * cos_deg + block2 * sin_deg
+        _update_peaks(peaks1, rot1, absolute)
+        if not combine:
+            rot2 = -block1 * sin_deg + block2 * cos_deg
+            _update_peaks(peaks2, rot2, absolute)
+
+    if combine:
+        return peaks1.reshape((-1, 1))
+    else:
+        return peaks1.reshape((-1, 1)), peaks2.reshape((-1, 1))
+
+
+def _update_peaks(peaks, block, absolute):
+    """
+    Updates the running peak of each row with a block of rotated data.
+
+    Args:
+        peaks (numpy.ndarray): Running peak for each row. Updated in place.
+        block (numpy.ndarray): Block of rotated data (num_angles, nsamples).
+            Modified in place if absolute is True.
+        absolute (bool): Whether to use the absolute value of the block.
+    """
+    if absolute:
+        np.abs(block, out=block)
+    np.maximum(peaks, np.amax(block, axis=1), out=peaks)
@@ -1,5 +1,6 @@
 # stdlib imports
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import logging
 import re
 
@@ -10,19 +11,24 @@ from lxml import etree
 import pandas as pd
 
 # local imports
-from gmprocess.config import get_config
+from gmprocess.config import get_config, get_num_workers
 from gmprocess.metrics.imt.arias import calculate_arias
 from gmprocess.metrics.imt.pga import calculate_pga
 from gmprocess.metrics.imt.pgv import calculate_pgv
 from gmprocess.metrics.imt.sa import calculate_sa
 from gmprocess.metrics.imt.fas import calculate_fas
-from gmprocess.metrics.gather import get_pgm_classes
+from gmprocess.metrics.gather import get_pgm_classes, group_imcs
 from gmprocess.metrics.oscillators import (
-    get_acceleration, get_spectral, get_velocity)
+    get_acceleration, get_spectral, get_spectral_batch, get_spectral_peaks,
+    get_velocity)
 
 
 CONFIG = get_config()
 
+# IMCs that only depend on the peak value of each SA oscillator. The ROTD
+# component is computed from its own rotated oscillators.
+PEAK_IMCS = ['channels', 'greater_of_two_horizontals', 'rotd']
+
 XML_UNITS = {'pga': '%g',
              'pgv': 'cm/s',
              'sa': '%g',
@@ -213,7 +219,9 @@ class StationSummary(object):
         for component in components:
             if component.upper().startswith('ROTD'):
                 rot = True
-        station.generate_oscillators(imts, sa_periods, fas_periods, rot)
+        peaks_only = all([imc in PEAK_IMCS for imc in group_imcs(components)])
+        station.generate_oscillators(imts, sa_periods, fas_periods, rot,
+                                     peaks_only)
         # Gather pgm/imt for each
         station.pgms = station.gather_pgms(components, fas_periods)
         return station
@@ -249,7 +257,8 @@ class StationSummary(object):
                         sa = calculate_sa(stream, components, rotation_matrix,
                                           self.origin)
                     else:
-                        sa = calculate_sa(stream, components, self.origin)
+                        sa = calculate_sa(stream, components,
+                                          origin=self.origin)
                     pgm_dict[oscillator] = sa
                 elif oscillator.startswith('FAS'):
                     fas = calculate_fas(stream, components, periods,
@@ -268,7 +277,8 @@ class StationSummary(object):
         self.components = set(components)
         return pgm_dict
 
-    def generate_oscillators(self, imts, sa_periods, fas_periods, rotate=False):
+    def generate_oscillators(self, imts, sa_periods, fas_periods, rotate=False,
+                             peaks_only=False):
         """
         Create dictionary of requested imt and its coinciding oscillators.
 
@@ -280,6 +290,9 @@ class StationSummary(object):
                     oscillators.
             rotate (bool): Whether to rotate the sa oscillators for the ROTD
                     component.
+            peaks_only (bool): Whether the SA oscillators should only hold
+                    the peak value of each channel rather than the full
+                    time history. Only valid for the IMCs in PEAK_IMCS.
 
         Returns:
             dictionary: dictionary of oscillators for each imt.
@@ -302,16 +315,21 @@ class StationSummary(object):
                 oscillator = get_acceleration(stream, 'cm/s/s')
                 oscillator_dict['FAS'] = oscillator
             elif imt.upper().startswith('SA'):
-                for period in sa_periods:
+                sa_periods = list(sa_periods)
+                if peaks_only:
+                    spectral_streams = get_spectral_peaks(
+                        sa_periods, stream, damping=self.damping)
+                else:
+                    spectral_streams = get_spectral_batch(
+                        sa_periods, stream, damping=self.damping)
+                for period, oscillator in zip(sa_periods, spectral_streams):
                     tag = 'SA(' + str(period) + ')'
-                    oscillator = get_spectral(
-                        period, stream,
-                        damping=self.damping)
                     oscillator_dict[tag] = oscillator
                     if rotate:
                         oscillator = get_spectral(
                             period, stream,
-                            damping=self.damping, rotation='nongm')
+                            damping=self.damping, rotation='nongm',
+                            peaks_only=True)
                         oscillator_dict[tag + '_ROT'] = oscillator
             elif imt.upper() == 'ARIAS':
                 oscillator = get_acceleration(stream, units='m/s/s')
@@ -625,3 +643,59 @@ class StationSummary(object):
                     data.append(imt_dict[imc])
         series = pd.Series(data, index)
         return series
+
+
+def get_station_summaries(streams, components=None, imts=None, origin=None,
+                          max_workers=None, use_threads=False):
+    """
+    Compute a StationSummary for each of a sequence of streams.
+
+    The summaries are computed in a pool of worker processes when more than
+    one worker is requested. Summaries computed by a worker process do not
+    keep the stream or oscillators, to avoid copying them back from the
+    worker. With use_threads, a thread pool is used instead; the oscillator
+    and smoothing extensions release the GIL, so the streams are shared
+    rather than copied to other processes.
+
+    Args:
+        streams (list): List of streams, one per station.
+        components (list): List of requested components (str).
+        imts (list): List of requested imts (str).
+        origin (obspy.core.event.origin.Origin):
+            Origin for the event containing latitude and longitude.
+        max_workers (int): Number of worker processes. If None, the value of
+            'metrics_workers' in the 'parallel' config section is used.
+            If 0, one worker per CPU is used.
+        use_threads (bool): Whether to use a thread pool instead of a
+            process pool. Default is False.
+
+    Returns:
+        list: StationSummary objects in the same order as streams.
+    """
+    max_workers = get_num_workers(CONFIG, 'metrics_workers', max_workers)
+    streams = list(streams)
+    args = [(stream, components, imts, origin) for stream in streams]
+    if max_workers <= 1 or len(streams) <= 1:
+        return [StationSummary.from_stream(*arg) for arg in args]
+    if use_threads:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(
+                lambda arg: StationSummary.from_stream(*arg), args))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_summary_from_stream, args))
+
+
+def _summary_from_stream(args):
+    """
+    Worker for get_station_summaries.
+
+    Args:
+        args (tuple): Arguments for StationSummary.from_stream.
+
+    Returns:
+        StationSummary: Summary without the stream and oscillators.
+    """
+    summary = StationSummary.from_stream(*args)
+    summary._stream = None
+    summary._oscillators = None
+    return summary
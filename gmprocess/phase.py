@@ -1,5 +1,7 @@
-import numpy as np
+from collections import OrderedDict
 import datetime as dt
+
+import numpy as np
 from scipy.signal import butter, lfilter, hilbert
 
 
@@ -24,109 +26,253 @@ def AICPicker(data, triggers, search_window, sps):
     data = data - np.median(data)
     searchwindowpts = int(sps * search_window)
 
+    # Windows around the triggers, one per row
+    starts = []
     for trigpts in triggers:
-
         trigstart = (trigpts - (2 * searchwindowpts))
         trigend = trigpts + 1 * searchwindowpts
-
         if(trigstart > 0 and trigend < np.size(data)):
-            data_select = data[trigstart:trigend]
-        else:
-            continue
-
-        data_select_size = np.size(data_select)
-        pts_select = np.arange(data_select_size) - 2 * searchwindowpts
+            starts.append(trigstart)
+    if not starts:
+        return refined_triggers
+    window_size = 3 * searchwindowpts
+    data_select = data[np.array(starts)[:, None] + np.arange(window_size)]
+    pts_select = np.arange(window_size) - 2 * searchwindowpts
 
-        AIC = np.zeros(np.size(data_select))
+    AIC = _aic(data_select)
+    AIC[:, 0:5] = np.inf
+    AIC[:, -5:] = np.inf
 
-        for n in range(1, np.size(AIC) - 2):
-            s1 = np.var(data_select[0:n])
-            if(s1 <= 0):
-                s1 = 0
-            else:
-                s1 = np.log(s1)
-            s2 = np.var(data_select[(n + 1):-1])
-            if(s2 <= 0):
-                s2 = 0
-            else:
-                s2 = np.log(s2)
-            AIC[n] = (n * s1) + ((np.size(AIC) - n + 1) * s2)
+    for trigstart, idx in zip(starts, np.argmin(AIC, axis=1)):
+        trigpts = trigstart + 2 * searchwindowpts
+        refined_triggers.append(pts_select[idx + 1] + trigpts)
 
-        AIC[0:5] = np.inf
-        AIC[-5:] = np.inf
+    return refined_triggers
 
-        refined_triggers.append(pts_select[np.argmin(AIC) + 1] + trigpts)
 
-    return refined_triggers
+def _aic(data_select):
+    """
+    Compute the Akaike Information Criterion for splitting each row of a 2D
+    array into two segments at each sample.
+
+    The variances of the segments before and after each sample are computed
+    from cumulative first and second moments, so each row takes O(n) time.
+    For the split at sample n, the segments are data[0:n] and
+    data[n + 1:-1]. The first and the last two values of each row are not
+    valid splits and are set to zero.
+
+    Args:
+        data_select (np.ndarray): 2D array with one window of data per row.
+
+    Returns:
+        np.ndarray: AIC, with the same shape as data_select.
+    """
+    nwin, size = data_select.shape
+    AIC = np.zeros((nwin, size))
+    if size < 4:
+        return AIC
+
+    # The variance does not depend on the mean, so the moments of the
+    # segments starting at the first sample are computed relative to that
+    # sample, and those of the segments ending at the second to last sample
+    # relative to that one. This limits the rounding errors of the
+    # cumulative moments, and makes them exact for constant segments.
+    n = np.arange(1, size - 2)
+    count2 = size - 2 - n
+
+    # The rounding residue is up to about n * eps times the mean square of
+    # a segment, so variances below that are set to zero
+    eps = np.finfo(float).eps
+
+    # Moments of data[0:n]
+    head = data_select - data_select[:, :1]
+    sum1 = np.cumsum(head, axis=1)[:, n - 1]
+    sum2 = np.cumsum(head**2, axis=1)[:, n - 1]
+    var1 = sum2 / n - (sum1 / n)**2
+    var1[var1 < 4 * eps * sum2] = 0
+
+    # Moments of data[n + 1:-1], summed from the end of the window
+    tail = data_select[:, -2::-1] - data_select[:, -2:-1]
+    sum1 = np.cumsum(tail, axis=1)[:, count2 - 1]
+    sum2 = np.cumsum(tail**2, axis=1)[:, count2 - 1]
+    var2 = sum2 / count2 - (sum1 / count2)**2
+    var2[var2 < 4 * eps * sum2] = 0
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        s1 = np.where(var1 <= 0, 0, np.log(var1))
+        s2 = np.where(var2 <= 0, 0, np.log(var2))
+    AIC[:, n] = (n * s1) + ((size - n + 1) * s2)
+    return AIC
 
 
 def STALTA_Earle(data, datao, sps, STAW, STAW2, LTAW, hanning, threshold,
                  threshold2, threshdrop):
-    data_hil = hilbert(data)
-    envelope = np.abs(data_hil)
-    envelope = np.convolve(envelope, np.hanning(hanning * sps), mode='same')
+    envelope = _envelope(np.atleast_2d(data), sps, hanning)[0]
 
     sta_samples = int(STAW * sps)
     sta_samples2 = int(STAW2 * sps)
     lta_samples = int(LTAW * sps)
 
-    sta = np.zeros(np.size(envelope))
-    sta2 = np.zeros(np.size(envelope))
-    lta = np.zeros(np.size(envelope))
+    sta, sta2, lta = _running_means(
+        envelope[None, :], sta_samples, sta_samples2, lta_samples)
+    sta, sta2, lta = sta[0], sta2[0], lta[0]
+
+    ratio = sta / lta
+    ratio2 = sta2 / lta
+
+    triggers_on, triggers_off = _find_triggers(
+        ratio, ratio2, threshold, threshold2, threshdrop)
+
+    refined_triggers = AICPicker(data, triggers_on, 4., sps)
+
+    return (refined_triggers, triggers_on, triggers_off, ratio, ratio2,
+            envelope, sta, lta)
 
-    for i in range(np.size(envelope) - lta_samples - 1):
-        lta[i+lta_samples+1] = np.sum(envelope[i:i + lta_samples])
-        sta[i+lta_samples+1] = np.sum(envelope[i + lta_samples + 1:i +
-                                               lta_samples + sta_samples + 1])
-        sta2[i+lta_samples+1] = np.sum(envelope[i+lta_samples + 1:i +
-                                                lta_samples + 1 +
-                                                sta_samples2])
+
+def _envelope(data, sps, hanning):
+    """
+    Smoothed envelope of each row of a 2D array of data.
+    """
+    envelope = np.abs(hilbert(data, axis=-1))
+    window = np.hanning(hanning * sps)
+    return np.array([np.convolve(row, window, mode='same')
+                     for row in envelope])
+
+
+def _running_means(envelope, sta_samples, sta_samples2, lta_samples):
+    """
+    Compute the short- and long-term averages of each row of an envelope.
+
+    The window sums are differences of the cumulative sum of the envelope,
+    so this takes O(n) time regardless of the window lengths. At sample
+    i, the long-term window is the lta_samples samples ending before
+    sample i - 1 and the short-term windows start at sample i; the
+    averages are zero for the first lta_samples + 1 samples.
+
+    Args:
+        envelope (np.ndarray): 2D array with one envelope per row.
+        sta_samples (int): Length of the first short-term window.
+        sta_samples2 (int): Length of the second short-term window.
+        lta_samples (int): Length of the long-term window.
+
+    Returns:
+        tuple: Arrays of the first and second short-term averages and the
+        long-term average, each with the same shape as envelope.
+    """
+    nrows, npts = envelope.shape
+    csum = np.zeros((nrows, npts + 1))
+    np.cumsum(envelope, axis=1, out=csum[:, 1:])
+
+    sta = np.zeros((nrows, npts))
+    sta2 = np.zeros((nrows, npts))
+    lta = np.zeros((nrows, npts))
+
+    idx = np.arange(lta_samples + 1, npts)
+    lta[:, idx] = csum[:, idx - 1] - csum[:, idx - 1 - lta_samples]
+    sta[:, idx] = (csum[:, np.minimum(idx + sta_samples, npts)] -
+                   csum[:, idx])
+    sta2[:, idx] = (csum[:, np.minimum(idx + sta_samples2, npts)] -
+                    csum[:, idx])
 
     lta = lta / float(lta_samples)
     sta = sta / float(sta_samples)
     sta2 = sta2 / float(sta_samples2)
 
     lta[lta < 0.00001] = 0.00001
+    return sta, sta2, lta
 
-    ratio = sta / lta
-    ratio2 = sta2 / lta
 
-    trigger = False
-    triggers_on = []
-    triggers_off = []
+def _find_triggers(ratio, ratio2, threshold, threshold2, threshdrop):
+    """
+    Find the samples where the STA/LTA ratios turn the trigger on and off.
 
-    for i in range(np.size(ratio) - 1):
-        if(trigger is False and ratio[i] >= threshold and
-           ratio2[i] >= threshold2 and ratio[i] > ratio[i + 1]):
-            triggers_on.append(i)
-            trigger = True
-        elif(trigger is True and ratio[i] <= threshdrop):
-            triggers_off.append(i)
-            trigger = False
+    The trigger turns on where both ratios reach their thresholds while
+    the first ratio is decreasing, and turns off at the first later sample
+    where the first ratio drops to threshdrop.
 
-    refined_triggers = AICPicker(data, triggers_on, 4., sps)
+    Returns:
+        tuple: Lists of the trigger on and off samples.
+    """
+    on = np.flatnonzero((ratio[:-1] >= threshold) &
+                        (ratio2[:-1] >= threshold2) &
+                        (ratio[:-1] > ratio[1:]))
+    off = np.flatnonzero(ratio[:-1] <= threshdrop)
 
-    return (refined_triggers, triggers_on, triggers_off, ratio, ratio2,
-            envelope, sta, lta)
+    triggers_on = []
+    triggers_off = []
+    i = 0
+    while True:
+        k = np.searchsorted(on, i)
+        if k == len(on):
+            break
+        triggers_on.append(int(on[k]))
+        k = np.searchsorted(off, on[k], side='right')
+        if k == len(off):
+            break
+        triggers_off.append(int(off[k]))
+        i = off[k] + 1
+    return triggers_on, triggers_off
 
 
 def PowerPicker(tr, highpass=1.4, lowpass=6, order=3, sta=3.0, sta2=3.0,
                 lta=20.0, hanningWindow=3.0, threshDetect=2.5,
                 threshDetect2=2.5, threshRestart=1.5):
 
-    tr_copy = tr.copy()
-    tr_copy.resample(20)
-    tr_copy.detrend()
-    data = tr_copy.data
-    sps = tr_copy.stats.sampling_rate
-
-    datahigh = butter_bandpass_filter(data, highpass, lowpass, sps,
-                                      order=order)
-
-    rt = STALTA_Earle(datahigh, data, sps, sta, sta2, lta, hanningWindow,
-                      threshDetect, threshDetect2, threshRestart)[0]
-
-    rt2 = []
-    for r in rt:
-        rt2.append(tr_copy.stats.starttime + dt.timedelta(seconds=(r / sps)))
-    return rt2
+    return PowerPickerStream(
+        [tr], highpass=highpass, lowpass=lowpass, order=order, sta=sta,
+        sta2=sta2, lta=lta, hanningWindow=hanningWindow,
+        threshDetect=threshDetect, threshDetect2=threshDetect2,
+        threshRestart=threshRestart)[0]
+
+
+def PowerPickerStream(st, highpass=1.4, lowpass=6, order=3, sta=3.0,
+                      sta2=3.0, lta=20.0, hanningWindow=3.0,
+                      threshDetect=2.5, threshDetect2=2.5,
+                      threshRestart=1.5):
+    """
+    Pick the P-wave arrivals of all of the traces of a stream.
+
+    This gives the same picks as calling PowerPicker on each trace, but the
+    traces with the same number of samples after resampling are filtered
+    and scanned together.
+
+    Args:
+        st (obspy.core.stream.Stream): Stream of data.
+        Other arguments are as for PowerPicker.
+
+    Returns:
+        list: List of the picks (UTCDateTime) for each trace.
+    """
+    tr_copies = []
+    for tr in st:
+        tr_copy = tr.copy()
+        tr_copy.resample(20)
+        tr_copy.detrend()
+        tr_copies.append(tr_copy)
+
+    groups = OrderedDict()
+    for idx, tr_copy in enumerate(tr_copies):
+        key = (tr_copy.stats.npts, tr_copy.stats.sampling_rate)
+        groups.setdefault(key, []).append(idx)
+
+    picks = [None] * len(tr_copies)
+    for (npts, sps), indices in groups.items():
+        data = np.vstack([tr_copies[idx].data for idx in indices])
+        b, a = butter_bandpass(highpass, lowpass, sps, order=order)
+        datahigh = lfilter(b, a, data, axis=-1)
+
+        envelope = _envelope(datahigh, sps, hanningWindow)
+        sta_means, sta2_means, lta_means = _running_means(
+            envelope, int(sta * sps), int(sta2 * sps), int(lta * sps))
+        ratio = sta_means / lta_means
+        ratio2 = sta2_means / lta_means
+
+        for row, idx in enumerate(indices):
+            triggers_on = _find_triggers(
+                ratio[row], ratio2[row], threshDetect, threshDetect2,
+                threshRestart)[0]
+            rt = AICPicker(datahigh[row], triggers_on, 4., sps)
+            starttime = tr_copies[idx].stats.starttime
+            picks[idx] = [starttime + dt.timedelta(seconds=(r / sps))
+                          for r in rt]
+    return picks
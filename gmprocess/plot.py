@@ -286,7 +286,7 @@ def plot_moveout(streams, epilat, epilon, channel, cmap='viridis',
             if normalize or scale != 1:
                 warnings.filterwarnings("ignore", category=FutureWarning)
                 trace.normalize()
-            trace.data *= scale
+            trace.data = trace.data * scale
             lat = trace.stats.coordinates['latitude']
             lon = trace.stats.coordinates['longitude']
             distance = gps2dist_azimuth(lat, lon, epilat, epilon)[0] / 1000
@@ -422,7 +422,7 @@ def summary_plots(st, directory):
         # Compute model spectra
         if fit_spectra_dict is not None:
             model_spec = spectrum.model(
-                freq=np.array(smooth_signal_dict['freq']),
+                freq=np.asarray(smooth_signal_dict['freq']),
                 dist=fit_spectra_dict['epi_dist'],
                 kappa=fit_spectra_dict['kappa'],
                 magnitude=fit_spectra_dict['magnitude'],
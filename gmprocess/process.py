@@ -9,12 +9,12 @@ from collections import OrderedDict
 from obspy.core.stream import Stream
 from obspy.signal.util import next_pow_2
 from obspy.signal.trigger import classic_sta_lta
-from scipy.optimize import curve_fit
 
 # local imports
+from gmprocess import baseline
 from gmprocess.config import get_config
 from gmprocess.phase import PowerPicker
-from gmprocess.smoothing.konno_ohmachi import konno_ohmachi_smooth
+from gmprocess.smoothing.konno_ohmachi import konno_ohmachi_smooth_many
 
 
 CONFIG = get_config()
@@ -286,12 +286,9 @@ def fft_smooth(trace, nfft):
     # Do a maximum of 301 K-O frequencies in the range of the fft freqs
     nkofreqs = min(nfft, 302) - 1
     ko_freqs = np.logspace(np.log10(freqs[1]), np.log10(freqs[-1]), nkofreqs)
-    # An array to hold the output
-    spec_smooth = np.empty_like(ko_freqs)
 
     # Konno Omachi Smoothing using 20 for bandwidth parameter
-    konno_ohmachi_smooth(spec.astype(np.double), freqs, ko_freqs, spec_smooth,
-                         20.0)
+    spec_smooth = konno_ohmachi_smooth_many(spec, freqs, ko_freqs, 20.0)
     return spec_smooth, ko_freqs
 
 
@@ -474,13 +471,6 @@ def filter_waveform(trace, filter_type, freqmax=None, freqmin=None,
     return trace
 
 
-def poly_func(x, a, b, c, d, e):
-    """
-    Model polynomial function for polynomial baseline correction.
-    """
-    return a*x**6 + b*x**5 + c*x**4 + d*x**3 + e*x**2
-
-
 def correct_baseline(trace):
     """
     Performs a baseline correction following the method of Ancheta
@@ -494,28 +484,9 @@ def correct_baseline(trace):
         trace (obspy.core.trace.Trace): Baseline-corrected trace.
     """
 
-    # Make copies of the trace for our accleration data
     orig_trace = trace.copy()
-    acc_trace = trace.copy()
-
-    # Integrate twice to get the displacement time series
-    disp_trace = (acc_trace.integrate()).integrate()
-
-    # Fit a sixth order polynomial to displacement time series, requiring
-    # that the 1st and 0th order coefficients are zero
-    time_values = np.linspace(0, trace.stats.npts-1, trace.stats.npts)
-    poly_cofs = list(curve_fit(poly_func, time_values, disp_trace.data)[0])
-    poly_cofs += [0, 0]
-
-    # Construct a polynomial from the coefficients and compute
-    # the second derivative
-    polynomial = np.poly1d(poly_cofs)
-    polynomial_second_derivative = np.polyder(polynomial, 2)
-
-    # Subtract the second derivative of the polynomial from the
-    # acceleration trace
-    for i in range(orig_trace.stats.npts):
-        orig_trace.data[i] -= polynomial_second_derivative(i)
+    orig_trace.data = baseline.correct_baseline(
+        trace.data, trace.stats.delta)[0]
     orig_trace = _update_params(orig_trace, 'baseline_correct', True)
     return orig_trace
 
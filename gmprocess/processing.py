@@ -3,13 +3,16 @@
 Processing methods.
 """
 
-import numpy as np
 import logging
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 
-from scipy.optimize import curve_fit
+import numpy as np
 
 from gmprocess.streamcollection import StreamCollection
-from gmprocess.config import get_config
+from gmprocess import baseline
+from gmprocess.config import get_config, get_num_workers
 from gmprocess.windows import signal_split
 from gmprocess.windows import signal_end
 from gmprocess.windows import window_checks
@@ -64,6 +67,10 @@ def process_streams(streams, origin, config=None):
     the parameter 'passed_checks' is set to False and subsequent processing
     steps are not applied once a check has failed.
 
+    Stations are processed in a pool of worker processes if
+    'processing_workers' in the 'parallel' config section is not 1. A station
+    that raises an exception is returned with all of its traces failed.
+
     Args:
         streams (list):
             A StreamCollection object.
@@ -88,15 +95,126 @@ def process_streams(streams, origin, config=None):
         config = get_config()
 
     logging.info('Processing streams...')
+    _check_processing_steps(config['processing'])
 
-    # -------------------------------------------------------------------------
-    # Begin noise/signal window steps
+    processed_streams = streams.copy()
+    num_workers = get_num_workers(config, 'processing_workers')
+    if num_workers > 1 and len(processed_streams) > 1:
+        # Stations are independent, so each one is handed to a worker as a
+        # whole. Results are collected in the order the stations were
+        # submitted.
+        logging.info('Processing stations with %i workers...' % num_workers)
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            futures = [
+                executor.submit(_process_station, st, origin, config)
+                for st in processed_streams
+            ]
+            for idx, future in enumerate(futures):
+                try:
+                    st, error_traceback = future.result()
+                except Exception as e:
+                    # The worker itself failed, e.g., the stream could not
+                    # be sent to it
+                    logging.exception('Processing stream %s failed.' %
+                                      processed_streams[idx].get_id())
+                    _fail_stream(processed_streams[idx], e)
+                    continue
+                _log_failure(st, error_traceback)
+                processed_streams[idx] = st
+    else:
+        for idx, st in enumerate(processed_streams):
+            st, error_traceback = _process_station(st, origin, config)
+            _log_failure(st, error_traceback)
+            processed_streams[idx] = st
 
-    logging.info('Windowing noise and signal...')
-    window_conf = config['windows']
+    # Build the summary report?
+    build_conf = config['build_report']
+    if build_conf['run']:
+        build_report(processed_streams,
+                     build_conf['directory'],
+                     origin, config=config)
+
+    logging.info('Finished processing streams.')
+    return processed_streams
+
+
+def _check_processing_steps(processing_steps):
+    """
+    Check that the configured processing steps are valid.
+
+    Args:
+        processing_steps (list):
+            List of processing step dictionaries from the config.
+    """
+    for processing_step_dict in processing_steps:
+        key_list = list(processing_step_dict.keys())
+        if len(key_list) != 1:
+            raise ValueError(
+                'Each processing step must contain exactly one key.')
+        step_name = key_list[0]
+        # Using globals doesn't seem like a great solution here, but it
+        # works.
+        if step_name not in globals():
+            raise ValueError(
+                'Processing step %s is not valid.' % step_name)
+
+
+def _fail_stream(st, error):
+    """
+    Mark all of the traces in a stream as failed because of an exception.
+
+    Args:
+        st (StationStream):
+            Stream of data.
+        error (Exception):
+            Exception raised while processing the stream.
+    """
+    for tr in st:
+        tr.fail('Processing failed: %s: %s' % (type(error).__name__, error))
+
+
+def _log_failure(st, error_traceback):
+    """
+    Log the exception that failed a stream, if any.
+
+    Args:
+        st (StationStream):
+            Stream of data.
+        error_traceback (str):
+            Formatted traceback of the exception, or None if the stream
+            did not fail because of an exception.
+    """
+    if error_traceback is not None:
+        logging.error('Processing stream %s failed:\n%s' %
+                      (st.get_id(), error_traceback))
+
+
+def _process_station(st, origin, config):
+    """
+    Run the windowing and processing steps on one station.
+
+    Exceptions raised by any step are caught and the stream is returned
+    with all of its traces failed, so that one station cannot stop the
+    processing of the others. The traceback is returned rather than logged
+    so that it is logged by the main process when this runs in a worker.
+
+    Args:
+        st (StationStream):
+            Stream of data.
+        origin (dict):
+            Origin dictionary; see process_streams.
+        config (dict):
+            Configuration dictionary.
+
+    Returns:
+        tuple: Processed stream, and the formatted traceback of the exception
+        that failed it (None if no exception was raised).
+    """
+    try:
+        # ---------------------------------------------------------------------
+        # Begin noise/signal window steps
+        window_conf = config['windows']
 
-    processed_streams = streams.copy()
-    for st in processed_streams:
         # Estimate noise/signal split time
         split_conf = window_conf['split']
         event_time = origin['time']
@@ -127,53 +245,30 @@ def process_streams(streams, origin, config=None):
             min_signal_duration=wcheck_conf['min_signal_duration']
         )
 
-    # -------------------------------------------------------------------------
-    # Begin processing steps
-    logging.info('Starting processing...')
-    processing_steps = config['processing']
-
-    # Loop over streams
-    for stream in processed_streams:
-        logging.info('Stream: %s' % stream.get_id())
-        for processing_step_dict in processing_steps:
-
-            key_list = list(processing_step_dict.keys())
-            if len(key_list) != 1:
-                raise ValueError(
-                    'Each processing step must contain exactly one key.')
-            step_name = key_list[0]
+        # ---------------------------------------------------------------------
+        # Begin processing steps
+        logging.info('Stream: %s' % st.get_id())
+        for processing_step_dict in config['processing']:
+            step_name = list(processing_step_dict.keys())[0]
 
             logging.info('Processing step: %s' % step_name)
             step_args = processing_step_dict[step_name]
-            # Using globals doesn't seem like a great solution here, but it
-            # works.
-            if step_name not in globals():
-                raise ValueError(
-                    'Processing step %s is not valid.' % step_name)
-
-            # Origin is required by some steps and has to be handled specially.
-            # There must be a better solution for this...
+
+            # Origin is required by some steps and has to be handled
+            # specially. There must be a better solution for this...
             if step_name == 'fit_spectra':
-                step_args = {
-                    'origin': origin
-                }
+                step_args = dict(step_args or {}, origin=origin)
             elif step_name == 'build_report':
                 step_args['origin'] = origin
 
             if step_args is None:
-                stream = globals()[step_name](stream)
+                st = globals()[step_name](st)
             else:
-                stream = globals()[step_name](stream, **step_args)
-
-    # Build the summary report?
-    build_conf = config['build_report']
-    if build_conf['run']:
-        build_report(processed_streams,
-                     build_conf['directory'],
-                     origin, config=config)
-
-    logging.info('Finished processing streams.')
-    return processed_streams
+                st = globals()[step_name](st, **step_args)
+    except Exception as e:
+        _fail_stream(st, e)
+        return st, traceback.format_exc()
+    return st, None
 
 
 def remove_response(st, f1, f2, f3=None, f4=None, water_level=None,
@@ -227,7 +322,7 @@ def remove_response(st, f1, f2, f3=None, f4=None, water_level=None,
             tr.remove_response(
                 inventory=inv, output=output, water_level=water_level,
                 pre_filt=(f1, f2, f3, f4))
-            tr.data *= M_TO_CM  # Convert from m/s/s to cm/s/s
+            tr.data = tr.data * M_TO_CM  # Convert from m/s/s to cm/s/s
             tr.setProvenance(
                 'remove_response',
                 {
@@ -243,7 +338,7 @@ def remove_response(st, f1, f2, f3=None, f4=None, water_level=None,
         elif tr.stats.channel[1] == 'N':
             if isinstance(tr.data[0], int):
                 tr.remove_sensitivity(inventory=inv)
-                tr.data *= M_TO_CM  # Convert from m/s/s to cm/s/s
+                tr.data = tr.data * M_TO_CM  # Convert from m/s/s to cm/s/s
                 tr.setProvenance(
                     'remove_response',
                     {
@@ -284,10 +379,11 @@ def detrend(st, detrending_method=None):
     if not st.passed:
         return st
 
+    if detrending_method == 'baseline_sixth_order':
+        _correct_baseline(st)
+
     for tr in st:
-        if detrending_method == 'baseline_sixth_order':
-            tr = _correct_baseline(tr)
-        else:
+        if detrending_method != 'baseline_sixth_order':
             tr = tr.detrend(detrending_method)
 
         tr.setProvenance(
@@ -567,8 +663,8 @@ def snr_check(st, threshold=3.0, min_freq=0.2, max_freq=5.0, bandwidth=20.0):
 
         if st.passed:
             snr_dict = tr.getParameter('snr')
-            snr = np.array(snr_dict['snr'])
-            freq = np.array(snr_dict['freq'])
+            snr = np.asarray(snr_dict['snr'])
+            freq = np.asarray(snr_dict['freq'])
             # Check if signal criteria is met
             min_snr = np.min(snr[(freq >= min_freq) & (freq <= max_freq)])
             if min_snr < threshold:
@@ -611,48 +707,33 @@ def max_traces(st, n_max=3):
     return st
 
 
-def _correct_baseline(trace):
+def _correct_baseline(traces):
     """
     Performs a baseline correction following the method of Ancheta
     et al. (2013). This removes low-frequency, non-physical trends
     that remain in the time series following filtering.
 
+    Traces with the same number of samples and sampling interval are
+    corrected together.
+
     Args:
-        trace (obspy.core.trace.Trace):
-            Trace of strong motion data.
+        traces (list):
+            Sequence of StationTraces of strong motion data.
 
     Returns:
-        trace: Baseline-corrected trace.
-    """
-
-    # Make copies of the trace for our accleration data
-    acc_trace = trace.copy()
-
-    # Integrate twice to get the displacement time series
-    disp_trace = (acc_trace.integrate()).integrate()
-
-    # Fit a sixth order polynomial to displacement time series, requiring
-    # that the 1st and 0th order coefficients are zero
-    time_values = np.linspace(0, trace.stats.npts - 1, trace.stats.npts)
-    poly_cofs = list(curve_fit(_poly_func, time_values, disp_trace.data)[0])
-    poly_cofs += [0, 0]
-
-    # Construct a polynomial from the coefficients and compute
-    # the second derivative
-    polynomial = np.poly1d(poly_cofs)
-    polynomial_second_derivative = np.polyder(polynomial, 2)
-
-    # Subtract the second derivative of the polynomial from the
-    # acceleration trace
-    for i in range(trace.stats.npts):
-        trace.data[i] -= polynomial_second_derivative(i)
-    trace.setParameter('baseline', {'polynomial_coefs': poly_cofs})
-
-    return trace
-
-
-def _poly_func(x, a, b, c, d, e):
-    """
-    Model polynomial function for polynomial baseline correction.
+        list: Baseline-corrected traces.
     """
-    return a * x**6 + b * x**5 + c * x**4 + d * x**3 + e * x**2
+    groups = OrderedDict()
+    for trace in traces:
+        key = (trace.stats.npts, trace.stats.delta)
+        groups.setdefault(key, []).append(trace)
+
+    for (npts, delta), group in groups.items():
+        acc = np.vstack([trace.data for trace in group])
+        corrected, poly_cofs = baseline.correct_baseline(acc, delta)
+        for trace, data, cofs in zip(group, corrected, poly_cofs):
+            trace.data = data
+            trace.setParameter('baseline',
+                               {'polynomial_coefs': cofs.tolist()})
+
+    return traces
@@ -1,15 +1,31 @@
 # stdlib imports
+from collections import OrderedDict
+import threading
 
 # third party imports
 import numpy as np
 from numpy cimport ndarray
 cimport numpy as np
 cimport cython
+from scipy.sparse import csr_matrix
 
-cdef extern from "smoothing.h":
+cdef extern from "smoothing.h" nogil:
     void konno_ohmachi_c(double *spec, double *freqs, int np,
                          double *ko_freqs, double *ko_smooth, int nko,
                          double bandwidth);
+    void konno_ohmachi_bounds_c(double *freqs, int np, double *ko_freqs,
+                                int nko, double bandwidth, int *start,
+                                int *stop);
+    void konno_ohmachi_weights_c(double *freqs, int np, double *ko_freqs,
+                                 int nko, double bandwidth, int *start,
+                                 int *indptr, int *indices,
+                                 double *weights);
+
+# Maximum number of weight matrices kept by konno_ohmachi_weights
+MAX_CACHED_WEIGHTS = 32
+
+_WEIGHTS_CACHE = OrderedDict()
+_WEIGHTS_LOCK = threading.Lock()
 
 
 def konno_ohmachi_smooth(np.ndarray[double, ndim=1, mode='c']spec,
@@ -18,11 +34,121 @@ def konno_ohmachi_smooth(np.ndarray[double, ndim=1, mode='c']spec,
                          np.ndarray[double, ndim=1, mode='c']spec_smooth,
                          bandwidth):
     """
+    Smooth a spectrum with the Konno-Ohmachi window.
+
+    Args:
+        spec (np.ndarray): Amplitude spectrum.
+        freqs (np.ndarray): Frequencies of spec, in increasing order.
+        ko_freqs (np.ndarray): Center frequencies of the smoothed spectrum.
+        spec_smooth (np.ndarray): Array that is filled with the smoothed
+            spectrum. Must be the same length as ko_freqs.
+        bandwidth (float): Konno-Ohmachi smoothing bandwidth parameter.
     """
     cdef int np = len(spec)
     cdef int nko = len(ko_freqs)
+    cdef double c_bandwidth = bandwidth
+    cdef double *spec_ptr = <double *>spec.data
+    cdef double *freqs_ptr = <double *>freqs.data
+    cdef double *ko_freqs_ptr = <double *>ko_freqs.data
+    cdef double *smooth_ptr = <double *>spec_smooth.data
 
-    konno_ohmachi_c(<double *>spec.data, <double *>freqs.data, np,
-                    <double *>ko_freqs.data, <double *>spec_smooth.data,
-                    nko, bandwidth)
+    with nogil:
+        konno_ohmachi_c(spec_ptr, freqs_ptr, np, ko_freqs_ptr, smooth_ptr,
+                        nko, c_bandwidth)
     return
+
+
+def konno_ohmachi_weights(freqs, ko_freqs, bandwidth):
+    """
+    Get the sparse matrix of normalized Konno-Ohmachi weights.
+
+    Multiplying this matrix by a spectrum gives the same result as
+    konno_ohmachi_smooth. Matrices are cached on (freqs, ko_freqs,
+    bandwidth), so repeated calls with the same frequency grids only build
+    the matrix once. At most MAX_CACHED_WEIGHTS matrices are kept. The
+    cache is shared between threads and the GIL is released while the
+    weights are computed.
+
+    Args:
+        freqs (np.ndarray): Frequencies of the spectra, in increasing order.
+        ko_freqs (np.ndarray): Center frequencies of the smoothed spectra.
+        bandwidth (float): Konno-Ohmachi smoothing bandwidth parameter.
+
+    Returns:
+        scipy.sparse.csr_matrix: Weights with shape (len(ko_freqs),
+            len(freqs)).
+    """
+    cdef np.ndarray[double, ndim=1, mode='c'] c_freqs = np.ascontiguousarray(
+        freqs, dtype=np.double)
+    cdef np.ndarray[double, ndim=1, mode='c'] c_ko_freqs = \
+        np.ascontiguousarray(ko_freqs, dtype=np.double)
+    cdef int nf = len(c_freqs)
+    cdef int nko = len(c_ko_freqs)
+    cdef np.ndarray[int, ndim=1, mode='c'] start
+    cdef np.ndarray[int, ndim=1, mode='c'] stop
+    cdef np.ndarray[int, ndim=1, mode='c'] indptr
+    cdef np.ndarray[int, ndim=1, mode='c'] indices
+    cdef np.ndarray[double, ndim=1, mode='c'] weights
+    cdef double c_bandwidth = bandwidth
+    cdef double *freqs_ptr = <double *>c_freqs.data
+    cdef double *ko_freqs_ptr = <double *>c_ko_freqs.data
+    cdef int *start_ptr
+    cdef int *stop_ptr
+    cdef int *indptr_ptr
+    cdef int *indices_ptr
+    cdef double *weights_ptr
+
+    key = (c_freqs.tobytes(), c_ko_freqs.tobytes(), float(bandwidth))
+    with _WEIGHTS_LOCK:
+        if key in _WEIGHTS_CACHE:
+            _WEIGHTS_CACHE.move_to_end(key)
+            return _WEIGHTS_CACHE[key]
+
+    start = np.zeros(nko, dtype=np.intc)
+    stop = np.zeros(nko, dtype=np.intc)
+    start_ptr = <int *>start.data
+    stop_ptr = <int *>stop.data
+    with nogil:
+        konno_ohmachi_bounds_c(freqs_ptr, nf, ko_freqs_ptr, nko, c_bandwidth,
+                               start_ptr, stop_ptr)
+    indptr = np.zeros(nko + 1, dtype=np.intc)
+    indptr[1:] = np.cumsum(stop - start)
+    indices = np.zeros(indptr[nko], dtype=np.intc)
+    weights = np.zeros(indptr[nko])
+    indptr_ptr = <int *>indptr.data
+    indices_ptr = <int *>indices.data
+    weights_ptr = <double *>weights.data
+    with nogil:
+        konno_ohmachi_weights_c(freqs_ptr, nf, ko_freqs_ptr, nko,
+                                c_bandwidth, start_ptr, indptr_ptr,
+                                indices_ptr, weights_ptr)
+    matrix = csr_matrix((weights, indices, indptr), shape=(nko, nf))
+
+    with _WEIGHTS_LOCK:
+        _WEIGHTS_CACHE[key] = matrix
+        if len(_WEIGHTS_CACHE) > MAX_CACHED_WEIGHTS:
+            _WEIGHTS_CACHE.popitem(last=False)
+    return matrix
+
+
+def konno_ohmachi_smooth_many(specs, freqs, ko_freqs, bandwidth):
+    """
+    Smooth one or more spectra that share the same frequencies with the
+    Konno-Ohmachi window.
+
+    Args:
+        specs (np.ndarray): Amplitude spectrum, or 2D array with one
+            spectrum per row.
+        freqs (np.ndarray): Frequencies of the spectra, in increasing order.
+        ko_freqs (np.ndarray): Center frequencies of the smoothed spectra.
+        bandwidth (float): Konno-Ohmachi smoothing bandwidth parameter.
+
+    Returns:
+        np.ndarray: Smoothed spectra, with the same number of dimensions as
+            specs and len(ko_freqs) values per spectrum.
+    """
+    weights = konno_ohmachi_weights(freqs, ko_freqs, bandwidth)
+    specs = np.asarray(specs, dtype=np.double)
+    if specs.ndim == 1:
+        return weights.dot(specs)
+    return weights.dot(specs.T).T
@@ -12,12 +12,92 @@
  * Kottke and found here:
  * https://github.com/arkottke/notebooks/blob/master/effective_amp_spectrum.ipynb
  * It was rewritten and optimized in C by Bruce Worden.
+ *
+ * The window is zero outside of [fc / max_ratio, fc * max_ratio], so the
+ * FFT frequencies (which must be sorted in increasing order) are
+ * binary-searched for that range rather than scanned in full.
  */
+
+/*
+ * Return the index of the first element of the sorted array freqs that is
+ * not less than value (np if there is none).
+ */
+static int lower_bound(double *freqs, int np, double value) {
+    int lo = 0;
+    int hi = np;
+    int mid;
+
+    while (lo < hi) {
+        mid = lo + (hi - lo) / 2;
+        if (freqs[mid] < value) {
+            lo = mid + 1;
+        } else {
+            hi = mid;
+        }
+    }
+    return lo;
+}
+
+/*
+ * The Konno-Ohmachi window centered on fc evaluated at freq. Returns 0 for
+ * frequencies outside of the window.
+ */
+static double ko_window(double freq, double fc, double bandwidth,
+                        double max_ratio, double min_ratio) {
+    double x, frat, window;
+
+    frat = freq / fc;
+    if (freq < 1e-6 ||
+        frat > max_ratio || frat < min_ratio) {
+        return 0;
+    } else if (fabs(freq - fc) < 1e-6) {
+        return 1.0;
+    }
+    x = bandwidth * log10(frat);
+    window = sin(x) / x;
+    window *= window;
+    window *= window;
+    return window;
+}
+
+/*
+ * Compute the range of FFT bins [start[i], stop[i]) that may fall within
+ * the window of each center frequency ko_freqs[i]. The range is widened by
+ * one bin on each side so that the exact ratio test in ko_window decides
+ * the edges. Center frequencies below 1e-6 get an empty range.
+ */
+void konno_ohmachi_bounds_c(double *freqs, int np, double *ko_freqs,
+                            int nko, double bandwidth, int *start,
+                            int *stop) {
+    int i;
+    double fc;
+    double max_ratio = pow(10.0, (3.0 / bandwidth));
+    double min_ratio = 1.0 / max_ratio;
+
+    for(i = 0; i < nko; i++) {
+        fc = ko_freqs[i];
+        if (fc < 1e-6) {
+            start[i] = 0;
+            stop[i] = 0;
+            continue;
+        }
+        start[i] = lower_bound(freqs, np, fc * min_ratio) - 1;
+        if (start[i] < 0) {
+            start[i] = 0;
+        }
+        stop[i] = lower_bound(freqs, np, fc * max_ratio) + 1;
+        if (stop[i] > np) {
+            stop[i] = np;
+        }
+    }
+    return;
+}
+
 void konno_ohmachi_c(double *spec, double *freqs, int np,
                      double *ko_freqs, double *ko_smooth, int nko,
                      double bandwidth) {
-    int i, j;
-    double window_total, total, x, fc, freq, frat, window;
+    int i, j, start, stop;
+    double window_total, total, fc, window;
     double max_ratio = pow(10.0, (3.0 / bandwidth));
     double min_ratio = 1.0 / max_ratio;
 
@@ -27,22 +107,13 @@ void konno_ohmachi_c(double *spec, double *freqs, int np,
             ko_smooth[i] = 0;
             continue;
         }
+        konno_ohmachi_bounds_c(freqs, np, ko_freqs + i, 1, bandwidth,
+                               &start, &stop);
         total = 0;
         window_total = 0;
-        for(j = 0; j < np; j++) {
-            freq = freqs[j];
-            frat = freq / fc;
-            if (freq < 1e-6 ||
-                frat > max_ratio || frat < min_ratio) {
-                continue;
-            } else if (fabs(freq - fc) < 1e-6) {
-                window = 1.0;
-            } else {
-                x = bandwidth * log10(frat);
-                window = sin(x) / x;
-                window *= window;
-                window *= window;
-            }
+        for(j = start; j < stop; j++) {
+            window = ko_window(freqs[j], fc, bandwidth, max_ratio,
+                               min_ratio);
             total += window * spec[j];
             window_total += window;
         }
@@ -54,3 +125,39 @@ void konno_ohmachi_c(double *spec, double *freqs, int np,
     }
     return;
 }
+
+/*
+ * Fill the normalized Konno-Ohmachi weights of a sparse (CSR) matrix with
+ * one row per center frequency. The row pointers (indptr) must have been
+ * computed from the ranges returned by konno_ohmachi_bounds_c, i.e.
+ * indptr[i + 1] - indptr[i] == stop[i] - start[i]. Each row sums to one,
+ * or is all zeros if no FFT bin falls within the window.
+ */
+void konno_ohmachi_weights_c(double *freqs, int np, double *ko_freqs,
+                             int nko, double bandwidth, int *start,
+                             int *indptr, int *indices, double *weights) {
+    int i, j, k;
+    double window_total, fc, window;
+    double max_ratio = pow(10.0, (3.0 / bandwidth));
+    double min_ratio = 1.0 / max_ratio;
+
+    for(i = 0; i < nko; i++) {
+        fc = ko_freqs[i];
+        window_total = 0;
+        for(k = indptr[i], j = start[i]; k < indptr[i + 1]; k++, j++) {
+            window = ko_window(freqs[j], fc, bandwidth, max_ratio,
+                               min_ratio);
+            indices[k] = j;
+            weights[k] = window;
+            window_total += window;
+        }
+        for(k = indptr[i]; k < indptr[i + 1]; k++) {
+            if (window_total > 0) {
+                weights[k] /= window_total;
+            } else {
+                weights[k] = 0;
+            }
+        }
+    }
+    return;
+}
@@ -1,3 +1,8 @@
 void konno_ohmachi_c(double *spec, double *freqs, int np, double *ko_freqs,
                      double *ko_smooth, int nko, double bandwidth);
-
+void konno_ohmachi_bounds_c(double *freqs, int np, double *ko_freqs,
+                            int nko, double bandwidth, int *start,
+                            int *stop);
+void konno_ohmachi_weights_c(double *freqs, int np, double *ko_freqs,
+                             int nko, double bandwidth, int *start,
+                             int *indptr, int *indices, double *weights);
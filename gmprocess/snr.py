@@ -3,7 +3,7 @@ import numpy as np
 
 from obspy.signal.util import next_pow_2
 
-from gmprocess.fft import fft_smooth
+from gmprocess.fft import compute_fft, smooth_spectrum
 
 
 # Options for tapering noise/signal windows
@@ -66,49 +66,49 @@ def compute_snr(tr, bandwidth):
         nfft = max(next_pow_2(signal.stats.npts),
                    next_pow_2(noise.stats.npts))
 
-        # Transform to frequency domain and smooth spectra using
-        # konno-ohmachi smoothing
-        dt = signal.stats.delta
-        sig_spec = abs(np.fft.rfft(signal.data, n=nfft)) * dt
-        sig_spec_freqs = np.fft.rfftfreq(nfft, dt)
-        dt = noise.stats.delta
-        noise_spec = abs(np.fft.rfft(noise.data, n=nfft)) * dt
+        # Transform to frequency domain; each window is only transformed
+        # once and the raw spectra are reused for smoothing
+        sig_spec, sig_spec_freqs = compute_fft(signal, nfft)
+        noise_spec, _ = compute_fft(noise, nfft)
+
+        # Smooth both spectra at once using konno-ohmachi smoothing
+        smoothed, freqs_signal = smooth_spectrum(
+            np.vstack([sig_spec, noise_spec]), sig_spec_freqs, nfft,
+            bandwidth)
+        sig_spec_smooth, noise_spec_smooth = smoothed[0], smoothed[1]
+
         sig_spec -= noise_spec
 
         sig_dict = {
-            'spec': sig_spec.tolist(),
-            'freq': sig_spec_freqs.tolist()
+            'spec': sig_spec,
+            'freq': sig_spec_freqs
         }
         tr.setParameter('signal_spectrum', sig_dict)
 
         noise_dict = {
-            'spec': noise_spec.tolist(),
-            'freq': sig_spec_freqs.tolist()  # same as signal
+            'spec': noise_spec,
+            'freq': sig_spec_freqs  # same as signal
         }
         tr.setParameter('noise_spectrum', noise_dict)
 
-        sig_spec_smooth, freqs_signal = fft_smooth(
-            signal, nfft, bandwidth)
         smooth_dict = {
-            'spec': sig_spec_smooth.tolist(),
-            'freq': freqs_signal.tolist()
+            'spec': sig_spec_smooth,
+            'freq': freqs_signal
         }
         tr.setParameter('smooth_signal_spectrum', smooth_dict)
 
-        noise_spec_smooth, freqs_noise = fft_smooth(noise, nfft)
         noise_smooth_dict = {
-            'spec': noise_spec_smooth.tolist(),
-            'freq': freqs_noise.tolist()
+            'spec': noise_spec_smooth,
+            'freq': freqs_signal
         }
         tr.setParameter('smooth_noise_spectrum', noise_smooth_dict)
 
-        # remove the noise level from the spectrum of the signal window
-        sig_spec_smooth -= noise_spec_smooth
-
-        snr = sig_spec_smooth/noise_spec_smooth
+        # remove the noise level from the spectrum of the signal window;
+        # not done in place since the smoothed spectrum is stored above
+        snr = (sig_spec_smooth - noise_spec_smooth) / noise_spec_smooth
         snr_dict = {
-            'snr': snr.tolist(),
-            'freq': freqs_signal.tolist()
+            'snr': snr,
+            'freq': freqs_signal
         }
         tr.setParameter('snr', snr_dict)
     else:
@@ -135,14 +135,11 @@ def compute_signal_spectrum(tr, bandwidth):
     # Transform to frequency domain and smooth spectra using
     # konno-ohmachi smoothing
     nfft = next_pow_2(tr.stats.npts)
-
-    dt = tr.stats.delta
-    sig_spec = abs(np.fft.rfft(tr.data, n=nfft)) * dt
-    sig_spec_freqs = np.fft.rfftfreq(nfft, dt)
+    sig_spec, sig_spec_freqs = compute_fft(tr, nfft)
 
     sig_dict = {
-        'spec': sig_spec.tolist(),
-        'freq': sig_spec_freqs.tolist()
+        'spec': sig_spec,
+        'freq': sig_spec_freqs
     }
     tr.setParameter('signal_spectrum', sig_dict)
     return tr
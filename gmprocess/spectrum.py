@@ -57,14 +57,16 @@ def fit_spectra(st, origin, kappa=0.035):
               - lon
               - lat
               - depth
-        kappa (float):
+        kappa (float or list):
             Site diminution factor (sec). Typical value for active cruststal
             regions is about 0.03-0.04, and stable continental regions is about
-            0.006.
+            0.006. If a list of trial values is given, kappa is fit jointly
+            with the stress drop.
 
     Returns:
         StationStream with fitted spectra parameters.
     """
+    kappas = np.atleast_1d(np.asarray(kappa, dtype=float))
     for tr in st:
         # Only do this for horizontal channels for which the smoothed spectra
         # has been computed.
@@ -82,51 +84,93 @@ def fit_spectra(st, origin, kappa=0.035):
 
             # Use the smoothed spectra for fitting
             smooth_signal_dict = tr.getParameter('smooth_signal_spectrum')
-            freq = np.array(smooth_signal_dict['freq'])
-            obs_spec = np.array(smooth_signal_dict['spec'])
-
-            # Loop over trial stress drops and kappas compute RMS fit
-            # of the spectra
-            rms = []
-            rms_stress = []
-            rms_f0 = []
-            for i in range(len(TRIAL_STRESS_DROPS)):
-                # Pick min f for cost function that is slightly less than
-                # corner frequency.
-                f0 = brune_f0(event_mag, TRIAL_STRESS_DROPS[i])
-                fmin = FMIN_FAC * f0
-                fmax = -np.log(FMAX_FAC)/np.pi/kappa
-
-                rms_f0.append(f0)
-                mod_spec = model(
-                    freq, dist, kappa,
-                    event_mag, TRIAL_STRESS_DROPS[i]
-                )
-
-                # Comput rms fit in log space, append to list
-                log_residuals = (
-                    np.log(obs_spec[(freq >= fmin) & (freq <= fmax)]) -
-                    np.log(mod_spec[(freq >= fmin) & (freq <= fmax)])
-                )
-                rms.append(np.sqrt(np.mean((log_residuals)**2)))
-
-                # Track the values of kappa and stress
-                rms_stress.append(TRIAL_STRESS_DROPS[i])
+            freq = np.asarray(smooth_signal_dict['freq'])
+            obs_spec = np.asarray(smooth_signal_dict['spec'])
+
+            # RMS fit of the spectra for all of the trial stress drops and
+            # kappas
+            rms = fit_rms(freq, obs_spec, dist, event_mag,
+                          TRIAL_STRESS_DROPS, kappas)
 
             # Find the kappa-stress pair with best fit
-            idx = np.where(rms == np.nanmin(rms))[0][0]
+            idx_stress, idx_kappa = np.unravel_index(
+                np.nanargmin(rms), rms.shape)
+            stress_drop = TRIAL_STRESS_DROPS[idx_stress]
             fit_spectra_dict = {
-                'stress_drop': rms_stress[idx],
+                'stress_drop': stress_drop,
                 'epi_dist': dist,
-                'kappa': kappa,
+                'kappa': float(kappas[idx_kappa]),
                 'magnitude': event_mag,
-                'f0': rms_f0[idx]
+                'f0': brune_f0(event_mag, stress_drop)
             }
             tr.setParameter('fit_spectra', fit_spectra_dict)
 
     return st
 
 
+def fit_rms(freq, obs_spec, dist, magnitude, stress_drops, kappas,
+            gs_mod="REA99", q_mod="REA99", crust_mod="BT15"):
+    """
+    Compute the RMS misfit of the model spectra to an observed spectrum
+    for a grid of stress drops and kappas.
+
+    The misfit is computed in log space, using only the frequencies above
+    FMIN_FAC times the corner frequency and below the frequency where the
+    site diminution equals FMAX_FAC. The path and crustal amplification
+    terms do not depend on the trial values, so they are computed once.
+
+    Args:
+        freq (array):
+            Numpy array of frequencies of the spectrum (Hz).
+        obs_spec (array):
+            Numpy array of the observed spectrum.
+        dist (float):
+            Distance (km).
+        magnitude (float):
+            Earthquake moment magnitude.
+        stress_drops (array):
+            Trial stress drops (bars).
+        kappas (array):
+            Trial site diminution factors (sec).
+        gs_mod (str):
+            Name of model for geometric attenuation; see model().
+        q_mod (str):
+            Name of model for anelastic attenuation; see model().
+        crust_mod (str):
+            Name of model for crustal amplification; see model().
+
+    Returns:
+        Array of RMS misfits with shape (len(stress_drops), len(kappas)).
+        The misfit is NaN where no frequencies are in the fitting range.
+    """
+    freq = np.asarray(freq, dtype=float)
+    stress_drops = np.asarray(stress_drops, dtype=float)
+    kappas = np.asarray(kappas, dtype=float)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Residuals without the source and kappa terms, shape (nfreq,)
+        log_obs = (np.log(obs_spec) -
+                   np.log(path(freq, dist, gs_mod, q_mod)) -
+                   np.log(crustal_amplification(freq, model=crust_mod)))
+
+        # Source term, shape (nstress, nfreq)
+        log_source = np.log(brune(freq, magnitude, stress_drops[:, None]))
+
+        # Residuals, shape (nstress, nkappa, nfreq)
+        residuals = (log_obs - log_source)[:, None, :] + \
+            np.pi * kappas[:, None] * freq
+
+        f0 = brune_f0(magnitude, stress_drops)
+        fmax = -np.log(FMAX_FAC)/np.pi/kappas
+        in_range = ((freq >= FMIN_FAC * f0[:, None])[:, None, :] &
+                    (freq <= fmax[:, None])[None, :, :])
+
+        count = np.sum(in_range, axis=-1)
+        sum_sq = np.sum(np.where(in_range, residuals**2, 0.0), axis=-1)
+        rms = np.sqrt(sum_sq / count)
+    return rms
+
+
 def model(freq, dist, kappa,
           magnitude, stress_drop=150,
           gs_mod="REA99", q_mod="REA99",
@@ -1,4 +1,5 @@
 # stdlib imports
+import copy
 import json
 import logging
 
@@ -51,6 +52,22 @@ class StationStream(Stream):
                     else:
                         self.append(trace)
 
+    def copy(self):
+        """
+        Copy the stream; the data of the traces is shared until changed.
+
+        The data arrays of the traces in both streams are read-only
+        afterwards, so in-place changes to them (e.g. ``tr.data *= k``)
+        raise a ValueError; assign a new array instead. See
+        StationTrace.copy.
+
+        Returns:
+            StationStream: Copy of the stream.
+        """
+        stream = copy.copy(self)
+        stream.traces = [trace.copy() for trace in self.traces]
+        return stream
+
     def get_id(self):
         """
         Get the StationStream ID.
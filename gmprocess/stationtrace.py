@@ -1,4 +1,5 @@
 # stdlib imports
+import copy
 import json
 import logging
 from datetime import datetime
@@ -12,6 +13,7 @@ from obspy.core.trace import Trace
 import prov
 import prov.model
 from obspy.core.utcdatetime import UTCDateTime
+from obspy.core.util.attribdict import AttribDict
 import pandas as pd
 
 # local imports
@@ -192,6 +194,70 @@ class StationTrace(Trace):
         self.parameters = {}
         self.validate()
 
+    def copy(self):
+        """Copy the trace, sharing the data until either trace changes it.
+
+        Unlike Trace.copy, the data array is not copied. Both traces hold
+        read-only views of the same samples; processing steps that replace
+        the data (filtering, integration, etc.) leave the other trace
+        untouched, and the steps that change the samples in place (taper,
+        normalize, detrend) first give the trace its own copy. The header
+        is copied except for the response, which is shared, and the
+        parameter values are copied one level deep. Use copy.deepcopy for
+        a fully independent trace.
+
+        Note that the data of this trace is also made read-only, and stays
+        read-only until the data is replaced, so in-place changes such as
+        ``tr.data *= k`` raise a ValueError on both traces afterwards;
+        assign a new array instead (``tr.data = tr.data * k``).
+
+        Returns:
+            StationTrace: Copy of the trace.
+        """
+        self._share_data()
+        trace = copy.copy(self)
+        trace.stats = copy.copy(self.stats)
+        for key, value in list(trace.stats.items()):
+            if key != 'response' and isinstance(value, (AttribDict, dict, list)):
+                trace.stats[key] = copy.deepcopy(value)
+        trace.data = self.data.view()
+        trace.provenance = copy.deepcopy(self.provenance)
+        trace.parameters = {key: copy.copy(value)
+                            for key, value in self.parameters.items()}
+        return trace
+
+    def _share_data(self):
+        """Make the data read-only so that it can be shared by copies."""
+        if isinstance(self.data, np.ndarray) and self.data.flags.writeable:
+            self.data.flags.writeable = False
+
+    def _own_data(self):
+        """Copy the data if it is shared, before it is changed in place."""
+        if isinstance(self.data, np.ndarray) and \
+                not self.data.flags.writeable:
+            self.data = self.data.copy()
+
+    def taper(self, *args, **kwargs):
+        """
+        Extends Trace taper to copy shared data first.
+        """
+        self._own_data()
+        return super(StationTrace, self).taper(*args, **kwargs)
+
+    def normalize(self, *args, **kwargs):
+        """
+        Extends Trace normalize to copy shared data first.
+        """
+        self._own_data()
+        return super(StationTrace, self).normalize(*args, **kwargs)
+
+    def detrend(self, *args, **kwargs):
+        """
+        Extends Trace detrend to copy shared data first.
+        """
+        self._own_data()
+        return super(StationTrace, self).detrend(*args, **kwargs)
+
     @property
     def free_field(self):
         """Is this station a free-field station?
@@ -425,7 +491,9 @@ class StationTrace(Trace):
             param_id (str):
                 Key for parameters dictionary.
             param_attributes (dict or list):
-                Parameters for the given key.
+                Parameters for the given key. Values may be numpy arrays;
+                they are converted to lists only when the trace is written
+                to a workspace.
         """
         self.parameters[param_id] = param_attributes
 
@@ -1,5 +1,7 @@
 # stdlib imports
+from collections import OrderedDict
 import glob
+import hashlib
 import os
 import logging
 
@@ -14,7 +16,7 @@ import pandas as pd
 from gmprocess.exception import GMProcessException
 from gmprocess.io.read import read_data
 from gmprocess.process import process_config
-from gmprocess.metrics.station_summary import StationSummary
+from gmprocess.metrics.station_summary import get_station_summaries
 
 
 DEFAULT_IMTS = ['PGA', 'PGV', 'SA(0.3)', 'SA(1.0)', 'SA(3.0)']
@@ -116,94 +118,50 @@ def group_channels(streams):
                 trace.stats.location = '--'
             trace_list += [trace]
 
-    # Create a list of duplicate traces and event matches
-    duplicate_list = []
-    match_list = []
-    for idx1, trace1 in enumerate(trace_list):
-        matches = []
-        network = trace1.stats['network']
-        station = trace1.stats['station']
-        starttime = trace1.stats['starttime']
-        endtime = trace1.stats['endtime']
-        channel = trace1.stats['channel']
-        location = trace1.stats['location']
-        if 'units' in trace1.stats.standard:
-            units = trace1.stats.standard['units']
-        else:
-            units = ''
-        if 'process_level' in trace1.stats.standard:
-            process_level = trace1.stats.standard['process_level']
-        else:
-            process_level = ''
-        data = np.asarray(trace1.data)
-        for idx2, trace2 in enumerate(trace_list):
-            if idx1 != idx2 and idx1 not in duplicate_list:
-                event_match = False
-                duplicate = False
-                if data.shape == trace2.data.shape:
-                    try:
-                        same_data = ((data == np.asarray(trace2.data)).all())
-                    except AttributeError:
-                        same_data = (data == np.asarray(trace2.data))
-                else:
-                    same_data = False
-                if 'units' in trace2.stats.standard:
-                    units2 = trace2.stats.standard['units']
-                else:
-                    units2 = ''
-                if 'process_level' in trace2.stats.standard:
-                    process_level2 = trace2.stats.standard['process_level']
-                else:
-                    process_level2 = ''
-                if (
-                    network == trace2.stats['network'] and
-                    station == trace2.stats['station'] and
-                    starttime == trace2.stats['starttime'] and
-                    endtime == trace2.stats['endtime'] and
-                    channel == trace2.stats['channel'] and
-                    location == trace2.stats['location'] and
-                    units == units2 and
-                    process_level == process_level2 and
-                    same_data
-                ):
-                    duplicate = True
-                elif (
-                    network == trace2.stats['network'] and
-                    station == trace2.stats['station'] and
-                    starttime == trace2.stats['starttime'] and
-                    location == trace2.stats['location'] and
-                    units == units2 and
-                    process_level == process_level2
-                ):
-                    event_match = True
-                if duplicate:
-                    duplicate_list += [idx2]
-                if event_match:
-                    matches += [idx2]
-        match_list += [matches]
-
-    # Create an updated list of streams
-    streams = []
-    for idx, matches in enumerate(match_list):
-        stream = Stream()
-        grouped = False
-        for match_idx in matches:
-            if match_idx not in duplicate_list:
-                if idx not in duplicate_list:
-                    stream.append(trace_list[match_idx])
-                    duplicate_list += [match_idx]
-                    grouped = True
-        if grouped:
-            stream.append(trace_list[idx])
-            duplicate_list += [idx]
-            streams += [stream]
-
-    # Check for ungrouped traces
+    # Group the traces that are from the same station and event. Within
+    # a group, traces that duplicate an earlier trace (same channel, end
+    # time and data) are dropped; the data are hashed so that only traces
+    # with the same hash are compared.
+    groups = OrderedDict()
+    duplicate_keys = {}
     for idx, trace in enumerate(trace_list):
-        if idx not in duplicate_list:
+        standard = trace.stats.standard
+        group_key = _get_key(trace.stats['network'],
+                             trace.stats['station'],
+                             _get_time_key(trace.stats['starttime']),
+                             trace.stats['location'],
+                             standard.get('units', ''),
+                             standard.get('process_level', ''))
+        data = np.asarray(trace.data)
+        duplicate_key = (group_key,
+                         _get_key(_get_time_key(trace.stats['endtime']),
+                                  trace.stats['channel']),
+                         data.shape,
+                         _hash_data(data))
+        originals = duplicate_keys.setdefault(duplicate_key, [])
+        if any([_same_data(data, trace_list[original].data)
+                for original in originals]):
+            continue
+        originals.append(idx)
+        groups.setdefault(group_key, []).append(idx)
+
+    # Traces that are alone in their group are put in one channel streams
+    # after the grouped streams. In a grouped stream, the first trace comes
+    # last.
+    streams = []
+    ungrouped = []
+    for indices in groups.values():
+        if len(indices) > 1:
             stream = Stream()
-            streams += [stream.append(trace)]
-            logging.warning('One channel stream:\n%s' % (stream))
+            for idx in indices[1:] + indices[:1]:
+                stream.append(trace_list[idx])
+            streams += [stream]
+        else:
+            ungrouped += indices
+    for idx in sorted(ungrouped):
+        stream = Stream()
+        streams += [stream.append(trace_list[idx])]
+        logging.warning('One channel stream:\n%s' % (stream))
 
     # Check for streams with more than three channels
     for stream in streams:
@@ -214,9 +172,46 @@ def group_channels(streams):
     return streams
 
 
+def _get_key(*values):
+    """Make a dictionary key that matches the equality of the values.
+
+    NaN is not equal to itself, so each NaN value is replaced with a new
+    object that is only equal to itself.
+    """
+    return tuple([object() if value != value else value
+                  for value in values])
+
+
+def _get_time_key(time):
+    """Get a hashable value that is equal for times that compare equal."""
+    return round(time.ns, time.precision - 9)
+
+
+def _hash_data(data):
+    """Hash data so that arrays that compare equal have the same hash."""
+    try:
+        # adding zero turns -0.0 into 0.0
+        values = np.ascontiguousarray(data, dtype=np.float64) + 0.0
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha1(values.tobytes()).hexdigest()
+
+
+def _same_data(data1, data2):
+    """Check if two data arrays have the same shape and values."""
+    data2 = np.asarray(data2)
+    if data1.shape != data2.shape:
+        return False
+    try:
+        return bool((data1 == data2).all())
+    except AttributeError:
+        return bool(data1 == data2)
+
+
 def streams_to_dataframe(streams, imcs=None, imts=None,
                          epi_dist=None, event_time=None,
-                         lat=None, lon=None, process=True):
+                         lat=None, lon=None, process=True,
+                         max_workers=None):
     """Extract peak ground motions from list of Stream objects.
 
     Note: The PGM columns underneath each channel will be variable
@@ -243,6 +238,9 @@ def streams_to_dataframe(streams, imcs=None, imts=None,
             Epicentral longitude. Epicentral distance calculation.
         process (bool):
             Process the stream using the config file.
+        max_workers (int):
+            Number of processes used to compute the station summaries. See
+            get_station_summaries().
 
     Returns:
         DataFrame: Pandas dataframe containing columns:
@@ -298,9 +296,7 @@ def streams_to_dataframe(streams, imcs=None, imts=None,
     else:
         columns = ['STATION', 'NAME', 'SOURCE', 'NETID', 'LAT', 'LON']
         meta_data = np.empty((num_streams, len(columns)), dtype=list)
-    station_pgms = []
-    imcs = []
-    imts = []
+    processed_streams = []
     for idx, stream in enumerate(streams):
         # set meta_data
         meta_data[idx][0] = stream[0].stats['station']
@@ -322,11 +318,17 @@ def streams_to_dataframe(streams, imcs=None, imts=None,
         if process:
             stream = process_config(stream, event_time=event_time,
                                     epi_dist=epi_dist)
-        origin = Origin(latitude=lat, longitude=lon)
-        stream_summary = StationSummary.from_stream(
-            stream, station_summary_imcs, station_summary_imts, origin)
-        pgms = stream_summary.pgms
-        station_pgms += [pgms]
+        processed_streams += [stream]
+
+    origin = Origin(latitude=lat, longitude=lon)
+    summaries = get_station_summaries(
+        processed_streams, station_summary_imcs, station_summary_imts, origin,
+        max_workers=max_workers)
+    station_pgms = []
+    imcs = []
+    imts = []
+    for stream_summary in summaries:
+        station_pgms += [stream_summary.pgms]
         imcs += stream_summary.components
         imts += stream_summary.imts
 
@@ -5,6 +5,7 @@ This class functions as a list of StationStream objects, and enforces
 various rules, such as all traces within a stream are from the same station.
 """
 
+from collections import OrderedDict
 import copy
 
 import numpy as np
@@ -14,7 +15,7 @@ import pandas as pd
 
 from gmprocess.io.read_directory import directory_to_streams
 from gmprocess.stationstream import StationStream
-from gmprocess.metrics.station_summary import StationSummary
+from gmprocess.metrics.station_summary import get_station_summaries
 
 INDENT = 2
 
@@ -71,25 +72,30 @@ class StreamCollection(object):
             self.__check_sample_rate(stream)
 
     @classmethod
-    def from_directory(cls, directory):
+    def from_directory(cls, directory, max_workers=None):
         """
         Create a StreamCollection instance from a directory of data.
 
         Args:
             directory (str):
                 Directory of ground motion files (streams) to be read.
+            max_workers (int):
+                Number of worker processes used to read the files. See
+                directory_to_streams.
 
         Returns:
             StreamCollection instance.
         """
-        streams, missed_files, errors = directory_to_streams(directory)
+        streams, missed_files, errors = directory_to_streams(
+            directory, max_workers=max_workers)
 
         # Might eventually want to include some of the missed files and
         # error info but don't have a sensible place to put it currently.
 
         return cls(streams)
 
-    def to_dataframe(self, origin_dict, imcs=None, imts=None):
+    def to_dataframe(self, origin_dict, imcs=None, imts=None,
+                     max_workers=None):
         """Get a summary dataframe of streams.
 
         Note: The PGM columns underneath each channel will be variable
@@ -113,6 +119,9 @@ class StreamCollection(object):
                 Strings designating desired components to create in table.
             imts (list):
                 Strings designating desired PGMs to create in table.
+            max_workers (int):
+                Number of processes used to compute the station summaries.
+                See get_station_summaries().
 
         Returns:
             DataFrame: Pandas dataframe containing columns:
@@ -167,9 +176,6 @@ class StreamCollection(object):
                    'NETID', 'LAT', 'LON', 'DISTANCE']
         meta_data = np.empty((num_streams, len(columns)), dtype=list)
 
-        station_pgms = []
-        imcs = []
-        imts = []
         for idx, stream in enumerate(streams):
             # set meta_data
             meta_data[idx][0] = stream[0].stats['station']
@@ -187,13 +193,16 @@ class StreamCollection(object):
                 origin_dict['lat'], origin_dict['lon'], latitude, longitude)
             meta_data[idx][6] = dist / 1000
 
-            origin_obj = Origin(latitude=origin_dict['lat'],
-                                longitude=origin_dict['lon'])
-
-            stream_summary = StationSummary.from_stream(
-                stream, station_summary_imcs, station_summary_imts, origin_obj)
-            pgms = stream_summary.pgms
-            station_pgms += [pgms]
+        origin_obj = Origin(latitude=origin_dict['lat'],
+                            longitude=origin_dict['lon'])
+        summaries = get_station_summaries(
+            streams, station_summary_imcs, station_summary_imts, origin_obj,
+            max_workers=max_workers)
+        station_pgms = []
+        imcs = []
+        imts = []
+        for stream_summary in summaries:
+            station_pgms += [stream_summary.pgms]
             imcs += stream_summary.components
             imts += stream_summary.imts
 
@@ -321,51 +330,32 @@ class StreamCollection(object):
     def copy(self):
         """
         Copy method.
+
+        The data of the traces is shared with the copy until either
+        collection changes it. The data arrays of the traces in both
+        collections are read-only afterwards, so in-place changes to them
+        (e.g. ``tr.data *= k``) raise a ValueError; assign a new array
+        instead. See StationTrace.copy.
         """
-        return copy.deepcopy(self)
+        collection = copy.copy(self)
+        collection.streams = [stream.copy() for stream in self.streams]
+        return collection
 
     def __group_by_net_sta_inst(self):
-        trace_list = []
+        # Group the traces by network, station, instrument (the first two
+        # characters of the channel) and free field status, keeping the
+        # order in which each group first appears
+        groups = OrderedDict()
         for stream in self:
             for trace in stream:
-                trace_list += [trace]
-
-        # Create a list of traces with matching net, sta.
-        all_matches = []
-        match_list = []
-        for idx1, trace1 in enumerate(trace_list):
-            if idx1 in all_matches:
-                continue
-            matches = [idx1]
-            network = trace1.stats['network']
-            station = trace1.stats['station']
-            free_field = trace1.free_field
-            # For instrument, use first two characters of the channel
-            inst = trace1.stats['channel'][0:2]
-            for idx2, trace2 in enumerate(trace_list):
-                if idx1 != idx2 and idx1 not in all_matches:
-                    if (
-                        network == trace2.stats['network'] and
-                        station == trace2.stats['station'] and
-                        inst == trace2.stats['channel'][0:2] and
-                        free_field == trace2.free_field
-                    ):
-                        matches.append(idx2)
-            if len(matches) > 1:
-                match_list.append(matches)
-                all_matches.extend(matches)
-            else:
-                if matches[0] not in all_matches:
-                    match_list.append(matches)
-                    all_matches.extend(matches)
+                key = (trace.stats['network'],
+                       trace.stats['station'],
+                       trace.stats['channel'][0:2],
+                       trace.free_field)
+                groups.setdefault(key, []).append(trace)
 
         grouped_streams = []
-        for groups in match_list:
-            grouped_trace_list = []
-            for i in groups:
-                grouped_trace_list.append(
-                    trace_list[i]
-                )
+        for grouped_trace_list in groups.values():
             grouped_streams.append(
                 StationStream(grouped_trace_list)
             )
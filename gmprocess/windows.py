@@ -19,7 +19,7 @@ from openquake.hazardlib import imt
 from obspy.geodetics.base import gps2dist_azimuth
 from obspy.signal.trigger import ar_pick, pk_baer
 
-from gmprocess.phase import PowerPicker
+from gmprocess.phase import PowerPickerStream
 from gmprocess.config import get_config
 
 M_TO_KM = 1.0 / 1000
@@ -123,13 +123,16 @@ def signal_split(
 
         if preferred_picker in ['baer', 'cwb']:
             tdiffs = []
-            for tr in st:
+            if preferred_picker == 'cwb':
+                # Pick all of the traces together
+                picks = PowerPickerStream(st)
+            for idx, tr in enumerate(st):
                 if preferred_picker == 'baer':
                     pick_sample = pk_baer(tr.data, tr.stats.sampling_rate,
                                           **picker_config['baer'])[0]
                     tr_tdiff = pick_sample * tr.stats.delta
                 else:
-                    tr_tdiff = PowerPicker(tr)[0] - tr.stats.starttime
+                    tr_tdiff = picks[idx][0] - tr.stats.starttime
                 tdiffs.append(tr_tdiff)
             tdiff = min(tdiffs)
             tsplit = st[0].stats.starttime + tdiff
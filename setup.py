@@ -10,6 +10,7 @@ sourcefiles = ["gmprocess/metrics/oscillators.pyx",
                "gmprocess/metrics/cfuncs.c"]
 ko_sourcefiles = ["gmprocess/smoothing/konno_ohmachi.pyx",
                   "gmprocess/smoothing/smoothing.c"]
+decode_sourcefiles = ["gmprocess/io/cdecode.pyx"]
 
 ext_modules = [
     Extension(
@@ -23,7 +24,12 @@ ext_modules = [
         ko_sourcefiles,
         libraries=["m"],
         include_dirs=[numpy.get_include()],
-        extra_compile_args=["-Ofast"])
+        extra_compile_args=["-Ofast"]),
+    Extension(
+        "gmprocess.io.cdecode",
+        decode_sourcefiles,
+        include_dirs=[numpy.get_include()],
+        extra_compile_args=["-O3"])
 ]
 
 setup(
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+
+import os
+
+import numpy as np
+from scipy.optimize import curve_fit
+
+from gmprocess import baseline
+from gmprocess.io.read import read_data
+from gmprocess.io.test_utils import read_data_dir
+
+
+def _poly_func(x, a, b, c, d, e):
+    return a * x**6 + b * x**5 + c * x**4 + d * x**3 + e * x**2
+
+
+def test_correct_baseline():
+    datafiles, _ = read_data_dir(
+        'geonet', 'us1000778i', '20161113_110259_WTMC_20.V2A')
+    stream = read_data(datafiles[0])[0]
+    stream.detrend('demean')
+    stream.filter('highpass', freq=0.1)
+    delta = stream[0].stats.delta
+    npts = stream[0].stats.npts
+    acc = np.vstack([trace.data for trace in stream])
+
+    corrected, poly_cofs = baseline.correct_baseline(acc, delta)
+    assert corrected.shape == acc.shape
+    assert poly_cofs.shape == (len(stream), 7)
+    np.testing.assert_array_equal(poly_cofs[:, -2:], 0)
+
+    index = np.arange(npts, dtype=float)
+    for trace, trace_corrected, cofs in zip(stream, corrected, poly_cofs):
+        # Fitting one trace at a time gives the same result
+        single, single_cofs = baseline.correct_baseline(trace.data, delta)
+        np.testing.assert_allclose(single, trace_corrected)
+        np.testing.assert_allclose(single_cofs, cofs)
+
+        # The direct solution agrees with the nonlinear fit
+        disp = trace.copy().integrate().integrate().data
+        target = curve_fit(_poly_func, index, disp)[0]
+        np.testing.assert_allclose(cofs[:5], target, rtol=1e-2)
+
+        # The second derivative of the polynomial is removed
+        second_derivative = np.polyder(np.poly1d(cofs), 2)(index)
+        np.testing.assert_allclose(trace.data - trace_corrected,
+                                   second_derivative, rtol=1e-8,
+                                   atol=1e-12 * np.abs(trace.data).max())
+
+
+if __name__ == '__main__':
+    os.environ['CALLED_FROM_PYTEST'] = 'True'
+    test_correct_baseline()
@@ -5,7 +5,7 @@ import os
 import json
 
 
-from gmprocess.config import merge_dicts
+from gmprocess.config import merge_dicts, get_num_workers
 
 
 def test_merge_dicts():
@@ -88,6 +88,21 @@ def test_merge_dicts():
     assert(dump_expected == dump_result)
 
 
+def test_get_num_workers():
+    config = {'parallel': {'processing_workers': 4, 'metrics_workers': 0}}
+    assert get_num_workers(config, 'processing_workers') == 4
+    assert get_num_workers(config, 'metrics_workers') == (os.cpu_count() or 1)
+    # missing options and configs default to one worker
+    assert get_num_workers(config, 'reading_workers') == 1
+    assert get_num_workers(None, 'reading_workers') == 1
+    assert get_num_workers({'parallel': None}, 'reading_workers') == 1
+    # a number requested by the caller takes precedence
+    assert get_num_workers(config, 'processing_workers', 2) == 2
+    assert get_num_workers(config, 'processing_workers', 0) == \
+        (os.cpu_count() or 1)
+
+
 if __name__ == '__main__':
     os.environ['CALLED_FROM_PYTEST'] = 'True'
     test_merge_dicts()
+    test_get_num_workers()
@@ -33,6 +33,12 @@ def test_asdf():
         assert is_asdf(tfile)
         assert not is_asdf(datafiles[0])
 
+        # data in memory is checked as well
+        with open(tfile, 'rb') as f:
+            assert is_asdf(f.read())
+        with open(datafiles[0], 'rb') as f:
+            assert not is_asdf(f.read())
+
         outstreams = read_asdf(tfile)
         assert len(outstreams) == len(raw_streams)
 
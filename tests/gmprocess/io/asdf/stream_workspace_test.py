@@ -6,7 +6,10 @@ import time
 import tempfile
 import warnings
 
-from gmprocess.io.asdf.stream_workspace import StreamWorkspace
+from gmprocess.io.asdf.stream_workspace import (StreamWorkspace,
+                                                PYASDF_PRIVATE,
+                                                _get_pyasdf_private)
+from gmprocess.exception import GMProcessException
 from gmprocess.io.read import read_data
 from gmprocess.processing import process_streams
 from gmprocess.config import get_config
@@ -116,6 +119,39 @@ def test_workspace():
                                              labels=['raw'])[0]
             compare_streams(instream, outstream)
 
+            # lazy streams have the same headers and read the same data
+            lazystream = workspace.getStreams(eventid,
+                                              stations=['hses'],
+                                              labels=['raw'],
+                                              lazy=True)[0]
+            for trace, lazytrace in zip(outstream, lazystream):
+                assert lazytrace.stats.npts == trace.stats.npts
+                assert lazytrace.stats.endtime == trace.stats.endtime
+                # the ASDF header is decoded the same way as pyasdf does
+                assert lazytrace.stats.asdf == trace.stats.asdf
+                np.testing.assert_array_equal(lazytrace.data, trace.data)
+            compare_streams(outstream, lazystream)
+
+            # time windows are read from the file
+            starttime = outstream[0].stats.starttime + 10
+            endtime = starttime + 20
+            for lazy in [False, True]:
+                window = workspace.getStreams(eventid,
+                                              stations=['hses'],
+                                              labels=['raw'],
+                                              starttime=starttime,
+                                              endtime=endtime,
+                                              lazy=lazy)[0]
+                trace = window[0]
+                assert abs(trace.stats.starttime - starttime) < 0.01
+                assert abs(trace.stats.endtime - endtime) < 0.01
+                offset = int(round((trace.stats.starttime -
+                                    outstream[0].stats.starttime) *
+                                   trace.stats.sampling_rate))
+                np.testing.assert_array_equal(
+                    trace.data,
+                    outstream[0].data[offset:offset + trace.stats.npts])
+
             label_summary = workspace.summarizeLabels()
             assert label_summary.iloc[0]['Label'] == 'raw'
             assert label_summary.iloc[0]['Software'] == 'gmprocess'
@@ -172,6 +208,9 @@ def test_workspace():
             workspace.addStreams(event, raw_streams, label='foo')
 
             stations = workspace.getStations(eventid)
+            tags = workspace.getStreamTags(eventid)
+            assert sorted(tags) == ['%s_foo' % station for station in stations]
+            assert len(workspace.getStreams(eventid)) == len(raw_streams)
 
             eventids = workspace.getEventIds()
             assert eventids == ['us1000778i', 'nz2018p115908']
@@ -202,7 +241,8 @@ def test_workspace():
                                    'ROTD50.0': 0.0003})
             assert cmpseries.equals(summary_series)
 
-            workspace.setStreamMetrics(usid, labels=['processed'])
+            workspace.setStreamMetrics(usid, labels=['processed'],
+                                       store_table=True)
             df = workspace.getMetricsTable(usid, labels=['processed'])
             cmpdict = {
                 'GREATER_OF_TWO_HORIZONTALS': [26.8906, 4.9415, 94.6646],
@@ -213,6 +253,33 @@ def test_workspace():
             cmpframe = pd.DataFrame(cmpdict)
             assert df['PGA'].equals(cmpframe)
 
+            # the metrics table holds the unrounded values
+            table = workspace.getMetricsArray(usid, labels=['processed'])
+            assert len(table) == len(df)
+            pga = dict(zip(table['STATION'], table['PGA_HN1']))
+            for station, value in zip(df['STATION'].values.ravel(),
+                                      df['PGA']['HN1']):
+                np.testing.assert_allclose(pga[station], value, atol=1e-4)
+            assert workspace.getMetricsArray(eventid) is None
+
+            # setting the metrics again replaces them in both stores
+            workspace.setStreamMetrics(usid, labels=['processed'],
+                                       imclist=['channels'],
+                                       imtlist=['pgv', 'sa1.0'],
+                                       store_table=True)
+            df = workspace.getMetricsTable(usid, labels=['processed'])
+            imts = set(df.columns.get_level_values(0))
+            assert 'PGV' in imts and 'SA(1.0)' in imts
+            assert 'PGA' not in imts
+            table = workspace.getMetricsArray(usid, labels=['processed'])
+            assert len(table) == len(df)
+            assert 'PGV_HN1' in table.dtype.names
+            assert 'PGA_HN1' not in table.dtype.names
+            pgv = dict(zip(table['STATION'], table['PGV_HN1']))
+            for station, value in zip(df['STATION'].values.ravel(),
+                                      df['PGV']['HN1']):
+                np.testing.assert_allclose(pgv[station], value, atol=1e-4)
+
             inventory = workspace.getInventory(usid)
             codes = [station.code for station in inventory.networks[0].stations]
             assert sorted(codes) == ['HSES', 'THZ', 'WPWS', 'WTMC']
@@ -223,6 +290,26 @@ def test_workspace():
         shutil.rmtree(tdir)
 
 
+def test_pyasdf_private():
+    tdir = tempfile.mkdtemp()
+    try:
+        workspace = StreamWorkspace(os.path.join(tdir, 'test.hdf'))
+        # the installed pyasdf has the private members the workspace uses
+        for name in PYASDF_PRIVATE:
+            assert _get_pyasdf_private(workspace.dataset, name) is not None
+
+        # and a missing one is reported
+        try:
+            _get_pyasdf_private(workspace.dataset, '_not_a_member')
+            success = True
+        except GMProcessException:
+            success = False
+        assert not success
+        workspace.close()
+    finally:
+        shutil.rmtree(tdir)
+
+
 def test_raw():
     msg = "dataset.value has been deprecated. Use dataset[()] instead."
     with warnings.catch_warnings():
@@ -285,4 +372,5 @@ def test_raw():
 if __name__ == '__main__':
     os.environ['CALLED_FROM_PYTEST'] = 'True'
     test_workspace()
+    test_pyasdf_private()
     test_raw()
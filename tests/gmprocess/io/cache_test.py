@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+
+# stdlib imports
+import os
+import shutil
+import tempfile
+
+# third party imports
+import numpy as np
+
+from gmprocess.io import cache as cache_module
+from gmprocess.io.cache import ReadCache
+from gmprocess.io.read import read_data
+from gmprocess.io.test_utils import read_data_dir
+
+
+def _compare_streams(streams, target):
+    assert len(streams) == len(target)
+    for stream, target_stream in zip(streams, target):
+        assert len(stream) == len(target_stream)
+        for trace, target_trace in zip(stream, target_stream):
+            np.testing.assert_array_equal(trace.data, target_trace.data)
+            assert trace.data.dtype == target_trace.data.dtype
+            # compare the text, since some headers are NaN
+            assert str(trace.stats) == str(target_trace.stats)
+            assert trace.provenance == target_trace.provenance
+            assert trace.parameters == target_trace.parameters
+
+
+def test_read_cache():
+    tempdir = tempfile.mkdtemp()
+    try:
+        datafiles, _ = read_data_dir('cwb', 'us1000chhc', '1-EAS.dat')
+        datafile = os.path.join(tempdir, '1-EAS.dat')
+        shutil.copyfile(datafiles[0], datafile)
+        cache = ReadCache(os.path.join(tempdir, 'cache'))
+
+        # files that have not been read are not in the cache
+        assert cache.get(datafile) is None
+        target = read_data(datafile)
+        cache.put(datafile, target)
+        _compare_streams(cache.get(datafile), target)
+
+        # the entries depend on the reader arguments
+        assert cache.get(datafile, 'cwb') is None
+
+        # changing the file invalidates the entry
+        stat = os.stat(datafile)
+        os.utime(datafile, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert cache.get(datafile) is None
+
+        # the least recently used entries are removed
+        cache.put(datafile, target)
+        size = os.path.getsize(cache._get_cache_file(datafile, None, {}))
+        cache.max_size = int(1.5 * size)
+        cache.put(datafile, target, 'cwb')
+        assert cache.get(datafile) is None
+        assert cache.get(datafile, 'cwb') is not None
+
+        cache.clear()
+        assert cache.get(datafile, 'cwb') is None
+        assert not os.listdir(cache.directory)
+    finally:
+        shutil.rmtree(tempdir)
+
+
+def test_read_cache_unwritable():
+    tempdir = tempfile.mkdtemp()
+    get_config = cache_module.get_config
+    try:
+        datafiles, _ = read_data_dir('cwb', 'us1000chhc', '1-EAS.dat')
+        datafile = datafiles[0]
+        target = read_data(datafile)
+
+        # entries that cannot be written are skipped
+        cache_dir = os.path.join(tempdir, 'cache')
+        cache = ReadCache(cache_dir)
+        shutil.rmtree(cache_dir)
+        open(cache_dir, 'w').close()
+        cache.put(datafile, target)
+        assert cache.get(datafile) is None
+
+        # a cache directory that cannot be created disables the cache, and
+        # reading still works
+        config = {'read': {'cache': {
+            'enabled': True,
+            'directory': os.path.join(cache_dir, 'subdir')}}}
+        cache_module.get_config = lambda: config
+        cache_module.get_read_cache.cache_clear()
+        assert cache_module.get_read_cache() is None
+        _compare_streams(read_data(datafile), target)
+    finally:
+        cache_module.get_config = get_config
+        cache_module.get_read_cache.cache_clear()
+        shutil.rmtree(tempdir)
+
+
+if __name__ == '__main__':
+    os.environ['CALLED_FROM_PYTEST'] = 'True'
+    test_read_cache()
+    test_read_cache_unwritable()
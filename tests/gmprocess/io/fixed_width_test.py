@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+
+import io
+import os
+
+import numpy as np
+
+from gmprocess.io import fixed_width
+from gmprocess.io.fixed_width import decode_fixed_width, decode_whitespace
+
+
+LINES = [
+    '   1.5  -2.25e-3      7 extra\n',
+    '-0.125              abc\n',
+    '\n',
+    '  12',
+]
+
+
+def _genfromtxt(lines, widths, **kwargs):
+    return np.genfromtxt(io.StringIO(''.join(lines)), delimiter=widths,
+                         invalid_raise=False, **kwargs)
+
+
+def test_decode_fixed_width():
+    # lines with blank, short and invalid fields
+    widths = [6, 10, 7]
+    data = decode_fixed_width(LINES, widths)
+    assert data.shape == (4, 3)
+    np.testing.assert_array_equal(data[0], [1.5, -2.25e-3, 7])
+    np.testing.assert_array_equal(data[1], [-0.125, np.nan, np.nan])
+    assert np.isnan(data[2]).all()
+    np.testing.assert_array_equal(data[3], [12, np.nan, np.nan])
+
+    # same values as genfromtxt
+    target = _genfromtxt(LINES, widths)
+    np.testing.assert_array_equal(data, target)
+
+    # integer headers use -1 for missing values
+    data = decode_fixed_width(LINES, widths, missing=-1).astype(np.int32)
+    target = _genfromtxt(LINES, widths, dtype=np.int32)
+    np.testing.assert_array_equal(data, target)
+
+    # equal widths give the same values with and without the extension
+    lines = ['%10.4f%10.4f' % (x, -x) for x in np.linspace(0, 1, 11)]
+    data = decode_fixed_width(lines, [10, 10])
+    mixed = decode_fixed_width(LINES, widths)
+    cfunc = fixed_width._decode_fields_c
+    try:
+        fixed_width._decode_fields_c = None
+        np.testing.assert_array_equal(
+            decode_fixed_width(lines, [10, 10]), data)
+        np.testing.assert_array_equal(
+            decode_fixed_width(LINES, widths), mixed)
+    finally:
+        fixed_width._decode_fields_c = cfunc
+    np.testing.assert_allclose(data[:, 0], np.linspace(0, 1, 11))
+
+    # no lines
+    assert decode_fixed_width([], [5, 5]).shape == (0, 2)
+
+
+def test_decode_whitespace():
+    data = decode_whitespace(['1 2.5\n', ' -3e2  4\n', '5\n'])
+    np.testing.assert_array_equal(data, [1, 2.5, -300, 4, 5])
+
+
+if __name__ == '__main__':
+    os.environ['CALLED_FROM_PYTEST'] = 'True'
+    test_decode_fixed_width()
+    test_decode_whitespace()
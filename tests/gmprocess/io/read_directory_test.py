@@ -4,7 +4,8 @@ import os.path
 import pkg_resources
 import logging
 
-from gmprocess.io.read_directory import directory_to_streams
+from gmprocess.io.read_directory import (directory_to_streams,
+                                         iter_directory_streams)
 from gmprocess.logging import setup_logger
 
 setup_logger()
@@ -17,6 +18,22 @@ def test_directory_to_streams():
     streams, unprocessed_files, unprocessed_file_errors = directory_to_streams(
         directory)
     assert len(streams) == 7
+    # zip members are reported below the path of their zip file
+    assert len(unprocessed_files) == 9
+    assert os.path.join(directory, 'ce14196p.zip',
+                        'INGLEWOO.V3') in unprocessed_files
+
+    # reading with worker processes gives the same streams
+    pstreams, punprocessed_files, _ = directory_to_streams(
+        directory, max_workers=2)
+    assert punprocessed_files == unprocessed_files
+    assert [st.get_id() for st in pstreams] == [st.get_id() for st in streams]
+
+    # streams are yielded for each file as it is read
+    results = iter_directory_streams(directory, max_workers=1)
+    file_path, file_streams, error = next(results)
+    assert error is None and len(file_streams) == 1
+    results.close()
 
 
 if __name__ == '__main__':
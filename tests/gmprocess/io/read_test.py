@@ -3,7 +3,11 @@
 # stdlib imports
 import os
 
-from gmprocess.io.read import read_data, _get_format, _validate_format
+# third party imports
+import pkg_resources
+
+from gmprocess.io.read import (read_data, get_readers, _get_format,
+                               _validate_format, _read_prefix)
 from gmprocess.exception import GMProcessException
 from gmprocess.io.test_utils import read_data_dir
 
@@ -63,6 +67,47 @@ def test_read():
     assert success == False
 
 
+def test_sniff():
+    # the registry is only built once
+    readers = get_readers()
+    assert get_readers() is readers
+    assert 'knet' in readers and 'asdf' in readers
+
+    # files pass the sniffer of their own format and few others
+    datafiles = {
+        'bhrc': read_data_dir('bhrc', 'usp000jq5p', '5520-1.V1')[0][0],
+        'cosmos': read_data_dir('cosmos', 'ci14155260',
+                                'Cosmos12TimeSeriesTest.v1')[0][0],
+        'cwb': read_data_dir('cwb', 'us1000chhc', '1-EAS.dat')[0][0],
+        'geonet': read_data_dir('geonet', 'us1000778i',
+                                '20161113_110259_WTMC_20.V1A')[0][0],
+        'knet': read_data_dir('knet', 'us2000cnnl',
+                              'AOM0011801241951.EW')[0][0],
+        'nsmn': read_data_dir('nsmn', 'us20009ynd',
+                              '20170720223109_0921.txt')[0][0]
+    }
+    for file_format, file_path in datafiles.items():
+        prefix = _read_prefix(file_path)
+        passing = [reader_format for reader_format, reader in readers.items()
+                   if getattr(reader, 'sniff_' + reader_format)(prefix)]
+        assert file_format in passing
+        assert len(passing) <= 2
+        assert _get_format(file_path) == file_format
+
+    # binary files that are not in a supported format
+    datapath = os.path.join('data', 'testdata', 'fdsnfetch', 'raw')
+    mseed_file = os.path.join(
+        pkg_resources.resource_filename('gmprocess', datapath),
+        'UW.ALCT.--.HN1.MSEED')
+    try:
+        _get_format(mseed_file)
+        success = True
+    except GMProcessException:
+        success = False
+    assert success == False
+
+
 if __name__ == '__main__':
     os.environ['CALLED_FROM_PYTEST'] = 'True'
     test_read()
+    test_sniff()
@@ -1,10 +1,15 @@
 #!/usr/bin/env python
 
+import io
 import os
+import tarfile
+import zipfile
+
 import numpy as np
 
 from gmprocess.io.test_utils import read_data_dir
 from gmprocess.io.read import read_data
+from gmprocess.io.utils import is_archive, iter_archive, open_data_file
 
 
 def test_uneven_samples():
@@ -19,6 +24,47 @@ def test_uneven_samples():
     )
 
 
+def test_read_archive():
+    datafiles, _ = read_data_dir(
+        'knet', 'us2000cnnl', files=['AOM0011801241951.EW'])
+    with open(datafiles[0], 'rb') as f:
+        data = f.read()
+
+    # the contents of a file can be read as well as its path
+    stream = read_data(datafiles[0])[0]
+    for source in [data, io.BytesIO(data)]:
+        mstream = read_data(source)[0]
+        np.testing.assert_array_equal(mstream[0].data, stream[0].data)
+        assert mstream[0].stats == stream[0].stats
+    with open_data_file(io.BytesIO(data)) as f:
+        assert f.readline().startswith('Origin Time')
+
+    # zip file holding a gzipped tar file
+    tarball = io.BytesIO()
+    with tarfile.open(fileobj=tarball, mode='w:gz') as tar:
+        info = tarfile.TarInfo('knet/AOM0011801241951.EW')
+        info.size = len(data)
+        tar.addfile(info, io.BytesIO(data))
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, 'w') as zip:
+        zip.writestr('event/knet.tar.gz', tarball.getvalue())
+        zip.writestr('event/readme.txt', 'not data')
+    assert is_archive(archive)
+    assert not is_archive(io.BytesIO(data))
+
+    members = list(iter_archive(archive, 'event.zip'))
+    names = [name for name, _ in members]
+    assert names == [
+        os.path.join('event.zip', 'event', 'knet.tar.gz', 'knet',
+                     'AOM0011801241951.EW'),
+        os.path.join('event.zip', 'event', 'readme.txt')
+    ]
+    assert members[0][1].name == names[0]
+    mstream = read_data(members[0][1])[0]
+    np.testing.assert_array_equal(mstream[0].data, stream[0].data)
+
+
 if __name__ == '__main__':
     os.environ['CALLED_FROM_PYTEST'] = 'True'
     test_uneven_samples()
+    test_read_archive()
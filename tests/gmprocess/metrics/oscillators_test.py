@@ -8,7 +8,10 @@ import numpy as np
 # local imports
 from gmprocess.constants import GAL_TO_PCTG
 from gmprocess.io.read import read_data
-from gmprocess.metrics.oscillators import get_acceleration, get_spectral, get_velocity
+from gmprocess.metrics.rotation import rotate
+from gmprocess.metrics.oscillators import (
+    calculate_spectrals, get_acceleration, get_spectral, get_spectral_batch, get_spectral_peaks,
+    get_velocity)
 from gmprocess.io.test_utils import read_data_dir
 
 
@@ -42,6 +45,84 @@ def test_spectral():
     get_spectral(1.0, acc, 0.05, rotation='gm')
 
 
+def test_spectral_rotation():
+    datafiles, _ = read_data_dir(
+        'geonet', 'us1000778i', '20161113_110259_WTMC_20.V2A')
+    acc_file = datafiles[0]
+    acc = read_data(acc_file)[0]
+    horizontals = [tr for tr in acc if 'Z' not in tr.stats.channel]
+    times = horizontals[0].times()
+
+    # The rotated responses must match the responses of rotated traces
+    rot = get_spectral(1.0, acc, 0.05, rotation='nongm')[0]
+    assert rot.shape == (181, acc[0].stats.npts)
+    target = rotate(horizontals[0].data, horizontals[1].data, combine=True)
+    for idx in [0, 45, 90, 137, 180]:
+        target_sa = calculate_spectrals(
+            times, np.ascontiguousarray(target[idx]), 1.0, 0.05)[0]
+        np.testing.assert_allclose(
+            rot[idx], target_sa * GAL_TO_PCTG, atol=1e-10)
+
+    rot1, rot2 = get_spectral(1.0, acc, 0.05, rotation='gm', delta=5.0)
+    assert rot1.shape == (19, acc[0].stats.npts)
+    assert rot2.shape == (19, acc[0].stats.npts)
+
+
+def test_spectral_batch():
+    datafiles, _ = read_data_dir(
+        'geonet', 'us1000778i', '20161113_110259_WTMC_20.V2A')
+    acc_file = datafiles[0]
+    acc = read_data(acc_file)[0]
+    periods = [0.1, 0.3, 1.0, 3.0]
+    batch = get_spectral_batch(periods, acc, damping=0.05)
+    assert len(batch) == len(periods)
+    for period, spect_stream in zip(periods, batch):
+        target = get_spectral(period, acc, damping=0.05)
+        assert len(spect_stream) == len(target)
+        for trace, target_trace in zip(spect_stream, target):
+            assert trace.stats['units'] == '%%g'
+            assert trace.stats.channel == target_trace.stats.channel
+            np.testing.assert_allclose(trace.data, target_trace.data)
+
+
+def test_spectral_peaks():
+    datafiles, _ = read_data_dir(
+        'geonet', 'us1000778i', '20161113_110259_WTMC_20.V2A')
+    acc_file = datafiles[0]
+    acc = read_data(acc_file)[0]
+    periods = [0.1, 0.3, 1.0, 3.0]
+    batch = get_spectral_batch(periods, acc, damping=0.05)
+    peaks = get_spectral_peaks(periods, acc, damping=0.05)
+    assert len(peaks) == len(periods)
+    for spect_stream, peak_stream in zip(batch, peaks):
+        for trace, peak_trace in zip(spect_stream, peak_stream):
+            assert peak_trace.stats.npts == 1
+            assert peak_trace.stats['units'] == '%%g'
+            np.testing.assert_allclose(
+                np.abs(peak_trace.max()), np.abs(trace.max()))
+            imax = np.argmax(np.abs(trace.data))
+            assert peak_trace.stats.starttime == trace.times('utcdatetime')[imax]
+
+
+def test_spectral_threads():
+    datafiles, _ = read_data_dir(
+        'geonet', 'us1000778i', '20161113_110259_WTMC_20.V2A')
+    acc_file = datafiles[0]
+    acc = read_data(acc_file)[0]
+    periods = [0.1, 0.3, 1.0, 3.0, 5.0]
+    batch = get_spectral_batch(periods, acc, damping=0.05)
+    threaded = get_spectral_batch(periods, acc, damping=0.05, max_threads=3)
+    peaks = get_spectral_peaks(periods, acc, damping=0.05)
+    threaded_peaks = get_spectral_peaks(periods, acc, damping=0.05,
+                                        max_threads=3)
+    for idx in range(len(periods)):
+        for trace, threaded_trace in zip(batch[idx], threaded[idx]):
+            np.testing.assert_array_equal(trace.data, threaded_trace.data)
+        for trace, threaded_trace in zip(peaks[idx], threaded_peaks[idx]):
+            np.testing.assert_array_equal(trace.data, threaded_trace.data)
+            assert trace.stats.starttime == threaded_trace.stats.starttime
+
+
 def test_velocity():
     datafiles, _ = read_data_dir(
         'geonet', 'us1000778i', '20161113_110259_WTMC_20.V2A')
@@ -55,4 +136,8 @@ def test_velocity():
 if __name__ == '__main__':
     test_acceleration()
     test_spectral()
+    test_spectral_rotation()
+    test_spectral_batch()
+    test_spectral_peaks()
+    test_spectral_threads()
     test_velocity()
@@ -8,7 +8,7 @@ import pkg_resources
 # local imports
 from obspy.core.stream import Stream
 from obspy.core.trace import Trace
-from gmprocess.metrics.rotation import get_max, rotate
+from gmprocess.metrics.rotation import get_max, rotate, rotate_peaks
 from gmprocess.metrics.station_summary import StationSummary
 
 ddir = os.path.join('data', 'testdata', 'process')
@@ -84,6 +84,30 @@ def test_rotation():
     assert (maxs[0] == 5.0 and maxs[1] == 7.0)
 
 
+def test_rotate_peaks():
+    osc1_data = np.genfromtxt(datadir + '/ALCTENE.UW..sac.acc.final.txt')
+    osc2_data = np.genfromtxt(datadir + '/ALCTENN.UW..sac.acc.final.txt')
+    osc1_data = osc1_data.T[1] * 100
+    osc2_data = osc2_data.T[1] * 100
+
+    rot = rotate(osc1_data, osc2_data, combine=True)
+    for chunk_size in [1, 1000, 10400, 20000]:
+        peaks = rotate_peaks(osc1_data, osc2_data, combine=True,
+                             chunk_size=chunk_size)
+        assert peaks.shape == (181, 1)
+        np.testing.assert_array_equal(
+            peaks[:, 0], np.amax(np.abs(rot), axis=1))
+        np.testing.assert_array_equal(
+            get_max(peaks, 'max', percentiles=[50, 100])[1],
+            get_max(rot, 'max', percentiles=[50, 100])[1])
+
+    rot1, rot2 = rotate(osc1_data, osc2_data, combine=False, delta=2.0)
+    peaks1, peaks2 = rotate_peaks(osc1_data, osc2_data, combine=False,
+                                  delta=2.0, absolute=False, chunk_size=333)
+    np.testing.assert_array_equal(peaks1[:, 0], np.amax(rot1, axis=1))
+    np.testing.assert_array_equal(peaks2[:, 0], np.amax(rot2, axis=1))
+
+
 def test_exceptions():
 
     # Invalid dimensions
@@ -127,4 +151,5 @@ def test_exceptions():
 
 if __name__ == '__main__':
     test_rotation()
+    test_rotate_peaks()
     test_exceptions()
@@ -9,7 +9,8 @@ import numpy as np
 
 # local imports
 from gmprocess.io.geonet.core import read_geonet
-from gmprocess.metrics.station_summary import StationSummary
+from gmprocess.metrics.station_summary import (
+    StationSummary, get_station_summaries)
 from gmprocess.io.test_utils import read_data_dir
 
 
@@ -172,5 +173,27 @@ def test_stationsummary():
     np.testing.assert_array_equal(imt1, imt2)
 
 
+def test_station_summaries():
+    datafiles, _ = read_data_dir('geonet', 'us1000778i', '*.V2A')
+    streams = [read_geonet(datafile)[0] for datafile in datafiles]
+    components = ['greater_of_two_horizontals', 'channels', 'rotd50']
+    imts = ['sa1.0', 'PGA', 'pgv']
+    serial = get_station_summaries(streams, components, imts, max_workers=1)
+    parallel = get_station_summaries(streams, components, imts,
+                                     max_workers=2)
+    assert len(serial) == len(parallel) == len(streams)
+    for stream, ssummary, psummary in zip(streams, serial, parallel):
+        assert psummary.station_code == stream[0].stats['station']
+        assert psummary.station_code == ssummary.station_code
+        cmp_dicts(ssummary.pgms, psummary.pgms)
+
+    threaded = get_station_summaries(streams, components, imts,
+                                     max_workers=2, use_threads=True)
+    for ssummary, tsummary in zip(serial, threaded):
+        assert tsummary.station_code == ssummary.station_code
+        cmp_dicts(ssummary.pgms, tsummary.pgms)
+
+
 if __name__ == '__main__':
     test_stationsummary()
+    test_station_summaries()
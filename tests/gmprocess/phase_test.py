@@ -1,5 +1,7 @@
 #!/usr/bin/env python
-from gmprocess.phase import PowerPicker
+import numpy as np
+
+from gmprocess.phase import AICPicker, PowerPicker, PowerPickerStream
 from gmprocess.io.read import read_data
 from obspy import read, UTCDateTime
 import os
@@ -31,6 +33,32 @@ def test_p_pick():
     assert ppick == []
 
 
+def test_p_pick_stream():
+    datapath = os.path.join('data', 'testdata', 'process')
+    datadir = pkg_resources.resource_filename('gmprocess', datapath)
+    st = read(datadir + '/ALCTENE.UW..sac')
+    st += read(datadir + '/HAWABHN.US..sac')
+    st += read(datadir + '/ALCTENE.UW..sac')
+    st[2].stats.channel = 'ENN'
+    st[2].data = st[2].data * 2.0
+    ppicks = PowerPickerStream(st)
+    assert len(ppicks) == 3
+    for tr, ppick in zip(st, ppicks):
+        assert ppick == PowerPicker(tr)
+
+
+def test_aic_flat_segment():
+    # The variance of the flat lead-in is zero, whatever its level
+    np.random.seed(1)
+    noise = np.random.normal(size=1500)
+    for level in [0.0, -3.7, 1234.5]:
+        data = np.concatenate([np.full(1500, level), level + noise])
+        for trigger in [1500, 1550, 1620]:
+            assert AICPicker(data, [trigger], 4., 20.) == [1502]
+
+
 if __name__ == '__main__':
     os.environ['CALLED_FROM_PYTEST'] = 'True'
     test_p_pick()
+    test_p_pick_stream()
+    test_aic_flat_segment()
@@ -2,6 +2,7 @@
 
 # stdlib imports
 import os
+import copy
 import glob
 import logging
 
@@ -68,6 +69,30 @@ def test_process_streams():
     )
 
 
+def test_process_streams_parallel():
+    data_files, origin = read_data_dir('geonet', 'us1000778i', '*.V1A')
+    streams = []
+    for f in data_files:
+        streams += read_data(f)
+    sc = StreamCollection(streams)
+
+    config = copy.deepcopy(get_config())
+    config['build_report']['run'] = False
+    serial = process_streams(sc, origin, config=config)
+
+    config['parallel'] = {'processing_workers': 2}
+    parallel = process_streams(sc, origin, config=config)
+
+    # Stations come back in the input order with the same provenance
+    assert len(parallel) == len(serial)
+    for pstream, sstream in zip(parallel, serial):
+        assert pstream.get_id() == sstream.get_id()
+        assert pstream.passed == sstream.passed
+        for ptrace, strace in zip(pstream, sstream):
+            assert ptrace.getProvenanceKeys() == strace.getProvenanceKeys()
+            np.testing.assert_allclose(ptrace.data, strace.data)
+
+
 def test_free_field():
     data_files, origin = read_data_dir('kiknet', 'usp000hzq8')
 
@@ -98,4 +123,5 @@ def test_free_field():
 if __name__ == '__main__':
     os.environ['CALLED_FROM_PYTEST'] = 'True'
     test_process_streams()
+    test_process_streams_parallel()
     test_free_field()
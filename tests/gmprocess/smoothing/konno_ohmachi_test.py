@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+
+# third party imports
+import numpy as np
+
+# local imports
+from gmprocess.smoothing.konno_ohmachi import (
+    konno_ohmachi_smooth, konno_ohmachi_smooth_many, konno_ohmachi_weights)
+
+
+def test_konno_ohmachi():
+    np.random.seed(42)
+    nfft = 4096
+    freqs = np.fft.rfftfreq(nfft, 0.01)
+    specs = np.abs(np.random.normal(size=(3, len(freqs))))
+    ko_freqs = np.logspace(np.log10(freqs[1]), np.log10(freqs[-1]), 301)
+    ko_freqs = np.append([0.0], ko_freqs)
+
+    for bandwidth in [10.0, 20.0, 40.0]:
+        target = np.zeros((3, len(ko_freqs)))
+        for idx, spec in enumerate(specs):
+            konno_ohmachi_smooth(spec, freqs, ko_freqs, target[idx],
+                                 bandwidth)
+        # Brute force implementation of the window
+        max_ratio = 10**(3.0 / bandwidth)
+        for idx in [1, 150, 301]:
+            frat = freqs[1:] / ko_freqs[idx]
+            x = bandwidth * np.log10(frat)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                window = (np.sin(x) / x)**4
+            window[np.abs(freqs[1:] - ko_freqs[idx]) < 1e-6] = 1.0
+            window[(frat > max_ratio) | (frat < 1 / max_ratio)] = 0.0
+            brute = np.sum(window * specs[0][1:]) / np.sum(window)
+            np.testing.assert_allclose(target[0][idx], brute)
+        assert target[0][0] == 0
+
+        smoothed = konno_ohmachi_smooth_many(specs, freqs, ko_freqs,
+                                             bandwidth)
+        np.testing.assert_allclose(smoothed, target, rtol=1e-12)
+        smoothed = konno_ohmachi_smooth_many(specs[1], freqs, ko_freqs,
+                                             bandwidth)
+        np.testing.assert_allclose(smoothed, target[1], rtol=1e-12)
+
+    # Weight matrices are cached
+    weights = konno_ohmachi_weights(freqs, ko_freqs, 20.0)
+    assert konno_ohmachi_weights(freqs, ko_freqs.copy(), 20.0) is weights
+    assert konno_ohmachi_weights(freqs, ko_freqs, 30.0) is not weights
+
+
+if __name__ == '__main__':
+    test_konno_ohmachi()
@@ -13,6 +13,20 @@ def test_spectrum():
     np.testing.assert_allclose(mod[-1], 0.0032295, atol=1e-5)
 
 
+def test_fit_rms():
+    freq = np.logspace(-2, 2, 101)
+    mod = spectrum.model(freq, 50, kappa=0.02, magnitude=6.0,
+                         stress_drop=100)
+    kappas = [0.01, 0.02, 0.035]
+    rms = spectrum.fit_rms(freq, mod, 50, 6.0, spectrum.TRIAL_STRESS_DROPS,
+                           kappas)
+    assert rms.shape == (len(spectrum.TRIAL_STRESS_DROPS), len(kappas))
+    idx = np.unravel_index(np.nanargmin(rms), rms.shape)
+    np.testing.assert_allclose(spectrum.TRIAL_STRESS_DROPS[idx[0]], 100)
+    assert kappas[idx[1]] == 0.02
+    np.testing.assert_allclose(rms[idx], 0, atol=1e-10)
+
+
 def test_fff():
     mags = np.linspace(3, 8, 51)
     h = [spectrum.finite_fault_factor(m) for m in mags]
@@ -24,4 +38,5 @@ def test_fff():
 if __name__ == '__main__':
     os.environ['CALLED_FROM_PYTEST'] = 'True'
     test_spectrum()
+    test_fit_rms()
     test_fff()
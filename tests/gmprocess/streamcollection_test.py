@@ -80,6 +80,19 @@ def test_StreamCollection():
     assert test_copy[0][0].stats['standard']['process_level'] == \
         'corrected physical units'
 
+    # The copy shares the data until it is changed, but not the headers
+    trace, copy_trace = dmg_sc[0][0], test_copy[0][0]
+    assert np.shares_memory(trace.data, copy_trace.data)
+    assert not trace.data.flags.writeable
+    assert not copy_trace.data.flags.writeable
+    target = trace.data.copy()
+    copy_trace.taper(max_percentage=0.05)
+    copy_trace.stats.standard['process_level'] = 'raw counts'
+    np.testing.assert_array_equal(trace.data, target)
+    assert not np.array_equal(copy_trace.data, target)
+    assert trace.stats['standard']['process_level'] == \
+        'corrected physical units'
+
     # Appending dmg should not add to length because of the
     # overwriting of the station/network above
     stream1 = test_copy[0]